@@ -165,7 +165,7 @@ class ExecuteCommands:
         self.datahub = session.datahub
 
     @profiler.profile()
-    def execute_command(self, statement, database_name: str = None) -> ExecuteAnswer:
+    def execute_command(self, statement, database_name: str = None, stream: bool = False) -> ExecuteAnswer:
         sql = None
         if isinstance(statement, ASTNode):
             sql = statement.to_string()
@@ -605,7 +605,7 @@ class ExecuteCommands:
         elif type(statement) is Select:
             if statement.from_table is None:
                 return self.answer_single_row_select(statement, database_name)
-            query = SQLQuery(statement, session=self.session, database=database_name)
+            query = SQLQuery(statement, session=self.session, database=database_name, stream=stream)
             return self.answer_select(query)
         elif type(statement) is Union:
             query = SQLQuery(statement, session=self.session, database=database_name)
@@ -2043,6 +2043,16 @@ class ExecuteCommands:
         return ExecuteAnswer(ANSWER_TYPE.OK)
 
     def answer_select(self, query):
+        if query.stream_batches is not None:
+            # the first batch is fetched, the rest is pulled lazily
+            batches = query.fetch_batches()
+            return ExecuteAnswer(
+                answer_type=ANSWER_TYPE.TABLE,
+                columns=query.columns_list,
+                data=next(batches),
+                stream=batches
+            )
+
         data = query.fetch()
 
         return ExecuteAnswer(
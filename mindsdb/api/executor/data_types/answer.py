@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, List
 
 
 class ANSWER_TYPE:
@@ -22,9 +22,12 @@ class ExecuteAnswer:
         state_track: List[List] = None,
         error_code: int = None,
         error_message: str = None,
+        stream: Iterator[List[List]] = None,
     ):
         self.columns = columns
         self.data = data
+        # next batches of rows after 'data', they are pulled lazily
+        self.stream = stream
         self.status = status
         self.state_track = state_track
         self.error_code = error_code
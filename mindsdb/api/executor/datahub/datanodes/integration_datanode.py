@@ -13,7 +13,9 @@ from mindsdb_sql.parser.ast import Insert, Identifier, CreateTable, TableColumn,
 from mindsdb.api.executor.datahub.datanodes.datanode import DataNode
 from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.executor.datahub.classes.tables_row import TablesRow
+from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.utilities.utils import get_class_name
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.metrics import metrics
 from mindsdb.utilities import log
 from mindsdb.utilities.profiler import profiler
@@ -60,6 +62,7 @@ class IntegrationDataNode(DataNode):
             if_exists=if_exists
         )
         result = self._query(drop_ast)
+        metadata_catalog.invalidate(self.integration_name)
         if result.type == RESPONSE_TYPE.ERROR:
             raise Exception(result.error_message)
 
@@ -109,6 +112,7 @@ class IntegrationDataNode(DataNode):
                 is_replace=is_replace
             )
             result = self._query(create_table_ast)
+            metadata_catalog.invalidate(self.integration_name)
             if result.type == RESPONSE_TYPE.ERROR:
                 raise Exception(result.error_message)
 
@@ -117,26 +121,28 @@ class IntegrationDataNode(DataNode):
             return
 
         insert_columns = [Identifier(parts=[x.alias]) for x in result_set.columns]
-        formatted_data = []
 
-        for rec in result_set.get_records():
-            new_row = []
-            for col in result_set.columns:
-                value = rec[col.alias]
-                column_type = table_columns_meta[col.alias]
+        # convert values column by column
+        columns_values = []
+        for i, col in enumerate(result_set.columns):
+            column_type = table_columns_meta[col.alias]
 
-                python_type = str
-                if column_type == Integer:
-                    python_type = int
-                elif column_type == Float:
-                    python_type = float
+            python_type = str
+            if column_type == Integer:
+                python_type = int
+            elif column_type == Float:
+                python_type = float
 
+            values = []
+            for value in result_set.get_column_values(i):
                 try:
                     value = python_type(value) if value is not None else value
                 except Exception:
                     pass
-                new_row.append(value)
-            formatted_data.append(new_row)
+                values.append(value)
+            columns_values.append(values)
+
+        formatted_data = [list(row) for row in zip(*columns_values)]
 
         if len(formatted_data) == 0:
             # not need to insert
@@ -209,7 +215,54 @@ class IntegrationDataNode(DataNode):
         if result.type == RESPONSE_TYPE.OK:
             return [], []
 
-        df = result.data_frame
+        return self._prepare_df(result.data_frame)
+
+    def _query_stream(self, query, batch_size: int = 1000):
+        time_before_query = time.perf_counter()
+        result_type = RESPONSE_TYPE.TABLE
+        num_rows = 0
+        try:
+            for df in self.integration_handler.query_stream(query, batch_size=batch_size):
+                num_rows += len(df.index)
+                yield df
+        except Exception:
+            result_type = RESPONSE_TYPE.ERROR
+            raise
+        finally:
+            elapsed_seconds = time.perf_counter() - time_before_query
+            query_time_with_labels = metrics.INTEGRATION_HANDLER_QUERY_TIME.labels(
+                get_class_name(self.integration_handler), result_type)
+            query_time_with_labels.observe(elapsed_seconds)
+
+            response_size_with_labels = metrics.INTEGRATION_HANDLER_RESPONSE_SIZE.labels(
+                get_class_name(self.integration_handler), result_type)
+            response_size_with_labels.observe(num_rows)
+
+    def query_stream(self, query, session=None, batch_size: int = 1000):
+        """ Execute select query and return result by batches
+
+            Returns:
+                Iterator[tuple]: pairs of (dataframe, columns_info)
+        """
+        handler = self.integration_handler
+        if not isinstance(handler, DatabaseHandler):
+            yield self.query(query=query, session=session)
+            return
+
+        try:
+            batches = self._query_stream(query, batch_size=batch_size)
+            df = next(batches, None)
+            yield self._prepare_df(df if df is not None else pd.DataFrame())
+            for df in batches:
+                yield self._prepare_df(df)
+        except Exception as e:
+            msg = str(e).strip()
+            if msg == '':
+                msg = e.__class__.__name__
+            msg = f'[{self.ds_type}/{self.integration_name}]: {msg}'
+            raise DBHandlerException(msg) from e
+
+    def _prepare_df(self, df):
         # region clearing df from NaN values
         # recursion error appears in pandas 1.5.3 https://github.com/pandas-dev/pandas/pull/45749
         if isinstance(df, pd.Series):
@@ -233,5 +286,4 @@ class IntegrationDataNode(DataNode):
             }
             for k, v in df.dtypes.items()
         ]
-        data = df.to_dict(orient='split')['data']
-        return data, columns_info
+        return df, columns_info
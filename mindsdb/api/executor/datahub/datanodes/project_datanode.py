@@ -140,7 +140,7 @@ class ProjectDataNode(DataNode):
                     for k, v in df.dtypes.items()
                 ]
 
-                return df.to_dict(orient='split')['data'], columns_info
+                return df, columns_info
 
             kb_table = session.kb_controller.get_table(query_table, self.project.id)
             if kb_table:
@@ -154,7 +154,7 @@ class ProjectDataNode(DataNode):
                     for k, v in df.dtypes.items()
                 ]
 
-                return df.to_dict(orient='split')['data'], columns_info
+                return df, columns_info
 
             raise EntityNotExistsError(f"Can't select from {query_table} in project")
         else:
@@ -1,17 +1,101 @@
+from functools import partial
+from typing import List, Optional, Set
 
 import pandas as pd
-from mindsdb_sql.parser.ast import BinaryOperation, Constant, Identifier, Select
+from mindsdb_sql.parser.ast import BinaryOperation, Constant, Identifier, Select, Tuple
 from mindsdb_sql.parser.ast.base import ASTNode
 
 from mindsdb.api.executor.datahub.classes.tables_row import (
     TABLES_ROW_TYPE,
     TablesRow,
 )
+from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
 
 
+def get_filter_values(query: ASTNode, column_name: str) -> Optional[Set[str]]:
+    """ Get values of column from conditions "column = 'value'" and "column in ('value', ...)" of query.
+        Only conditions joined with 'and' are used, so rows with other values can be skipped before the query
+
+    Args:
+        query (ASTNode): query to the table
+        column_name (str): name of the column in upper case
+
+    Returns:
+        Optional[Set[str]]: lowercase values, None if there is no condition for the column
+    """
+    if type(query) is not Select or query.where is None:
+        return None
+
+    conditions = [query.where]
+    values = None
+    while len(conditions) > 0:
+        condition = conditions.pop()
+        if type(condition) is not BinaryOperation:
+            continue
+        if condition.op == 'and':
+            conditions.extend(condition.args)
+            continue
+        arg1, arg2 = condition.args
+        if type(arg1) is not Identifier or arg1.parts[-1].upper() != column_name:
+            continue
+
+        if condition.op == '=' and type(arg2) is Constant:
+            constants = [arg2]
+        elif condition.op == 'in' and type(arg2) is Tuple and all(type(x) is Constant for x in arg2.items):
+            constants = arg2.items
+        else:
+            continue
+
+        condition_values = set(str(x.value).lower() for x in constants)
+        values = condition_values if values is None else values & condition_values
+    return values
+
+
+def is_selected(name: str, values: Optional[Set[str]]) -> bool:
+    return values is None or name.lower() in values
+
+
+def _load_integration_tables(inf_schema, ds_name: str) -> List[list]:
+    ds = inf_schema.get(ds_name)
+    rows = []
+    for row in ds.get_tables():
+        row.TABLE_SCHEMA = ds_name
+        rows.append(row.to_list())
+    return rows
+
+
+def _load_integration_columns(inf_schema, ds_name: str, table_name: str) -> List[tuple]:
+    ds = inf_schema.get(ds_name)
+    response = ds.integration_handler.get_columns(table_name)
+    if response.type != RESPONSE_TYPE.TABLE:
+        raise Exception(f"Can't get columns of '{table_name}': {response.error_message}")
+    df = response.data_frame
+    # handlers return columns in different formats
+    df_columns = {str(x).lower(): x for x in df.columns}
+    name_column = df_columns.get('field', df_columns.get('column_name', df.columns[0]))
+    type_column = df_columns.get('type', df_columns.get('data_type'))
+    types = df[type_column] if type_column is not None else [None] * len(df)
+    return list(zip(df[name_column], types))
+
+
+def get_integrations_tables(inf_schema, ds_names: List[str]) -> dict:
+    """ Rows of information_schema.tables for integrations from metadata catalog
+
+    Returns:
+        dict: {integration name: rows}, integrations which were not loaded in time are skipped
+    """
+    loaders = {
+        (ds_name, 'tables'): partial(_load_integration_tables, inf_schema, ds_name)
+        for ds_name in ds_names
+    }
+    tables = metadata_catalog.get_many(loaders)
+    return {key[0]: rows for key, rows in tables.items()}
+
+
 class Table:
 
     deletable: bool = False
@@ -72,32 +156,19 @@ class TablesTable(Table):
     @classmethod
     def get_data(cls, query: ASTNode = None, inf_schema=None, **kwargs):
 
-        target_table = None
-        if (
-            type(query) is Select
-            and type(query.where) is BinaryOperation
-            and query.where.op == "and"
-        ):
-            for arg in query.where.args:
-                if (
-                    type(arg) is BinaryOperation
-                    and arg.op == "="
-                    and type(arg.args[0]) is Identifier
-                    and arg.args[0].parts[-1].upper() == "TABLE_SCHEMA"
-                    and type(arg.args[1]) is Constant
-                ):
-                    target_table = arg.args[1].value
-                    break
+        schemas = get_filter_values(query, "TABLE_SCHEMA")
+        table_names = get_filter_values(query, "TABLE_NAME")
 
         data = []
-        for name in inf_schema.tables.keys():
-            if target_table is not None and target_table != name:
-                continue
-            row = TablesRow(TABLE_TYPE=TABLES_ROW_TYPE.SYSTEM_VIEW, TABLE_NAME=name)
-            data.append(row.to_list())
+        if is_selected("information_schema", schemas):
+            for name in inf_schema.tables.keys():
+                if not is_selected(name, table_names):
+                    continue
+                row = TablesRow(TABLE_TYPE=TABLES_ROW_TYPE.SYSTEM_VIEW, TABLE_NAME=name)
+                data.append(row.to_list())
 
         for ds_name, ds in inf_schema.persis_datanodes.items():
-            if target_table is not None and target_table != ds_name:
+            if not is_selected(ds_name, schemas):
                 continue
             if hasattr(ds, 'get_tables_rows'):
                 ds_tables = ds.get_tables_rows()
@@ -122,27 +193,28 @@ class TablesTable(Table):
                     for x in ds_tables
                 ]
             for row in ds_tables:
+                if not is_selected(row.TABLE_NAME, table_names):
+                    continue
                 row.TABLE_SCHEMA = ds_name
                 data.append(row.to_list())
 
-        for ds_name in inf_schema.get_integrations_names():
-            if target_table is not None and target_table != ds_name:
-                continue
-            try:
-                ds = inf_schema.get(ds_name)
-                ds_tables = ds.get_tables()
-                for row in ds_tables:
-                    row.TABLE_SCHEMA = ds_name
-                    data.append(row.to_list())
-            except Exception:
-                logger.error(f"Can't get tables from '{ds_name}'")
+        ds_names = [
+            ds_name for ds_name in inf_schema.get_integrations_names()
+            if is_selected(ds_name, schemas)
+        ]
+        for rows in get_integrations_tables(inf_schema, ds_names).values():
+            for row in rows:
+                if is_selected(row[2], table_names):
+                    data.append(row)
 
         for project_name in inf_schema.get_projects_names():
-            if target_table is not None and target_table != project_name:
+            if not is_selected(project_name, schemas):
                 continue
             project_dn = inf_schema.get(project_name)
             project_tables = project_dn.get_tables()
             for row in project_tables:
+                if not is_selected(row.TABLE_NAME, table_names):
+                    continue
                 row.TABLE_SCHEMA = project_name
                 data.append(row.to_list())
 
@@ -178,7 +250,28 @@ class ColumnsTable(Table):
     ]
 
     @classmethod
-    def get_data(cls, inf_schema=None, **kwargs):
+    def get_column_template(cls, data_type) -> str:
+        """ Choose template of row by type of the column in integration
+        """
+        if data_type is None:
+            return "text"
+        data_type = str(data_type).lower()
+        if "interval" in data_type:
+            return "text"
+        if "int" in data_type:
+            return "bigint"
+        if any(x in data_type for x in ("float", "double", "real", "decimal", "numeric")):
+            return "float"
+        if "date" in data_type or "time" in data_type:
+            return "timestamp"
+        return "text"
+
+    @classmethod
+    def get_data(cls, query: ASTNode = None, inf_schema=None, **kwargs):
+        """ Columns of tables of information_schema, mindsdb and files.
+            Columns of integrations are returned only if query has filter by TABLE_SCHEMA:
+            otherwise every table of every integration would be requested
+        """
 
         # NOTE there is a lot of types in mysql, but listed below should be enough for our purposes
         row_templates = {
@@ -276,40 +369,60 @@ class ColumnsTable(Table):
             ],
         }
 
-        result = []
+        schemas = get_filter_values(query, "TABLE_SCHEMA")
+        table_names = get_filter_values(query, "TABLE_NAME")
 
-        for table_name, table in inf_schema.tables.items():
-            table_columns = table.columns
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates["text"].copy()
-                result_row[1] = "information_schema"
-                result_row[2] = table_name
-                result_row[3] = column_name
-                result_row[4] = i
-                result.append(result_row)
+        result = []
 
-        mindsdb_dn = inf_schema.get("MINDSDB")
-        for table_row in mindsdb_dn.get_tables():
-            table_name = table_row.TABLE_NAME
-            table_columns = mindsdb_dn.get_table_columns(table_name)
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates["text"].copy()
-                result_row[1] = "mindsdb"
+        def add_columns(schema_name, table_name, columns, types=None):
+            for i, column_name in enumerate(columns):
+                template = "text" if types is None else cls.get_column_template(types[i])
+                result_row = row_templates[template].copy()
+                result_row[1] = schema_name
                 result_row[2] = table_name
                 result_row[3] = column_name
                 result_row[4] = i
                 result.append(result_row)
 
-        files_dn = inf_schema.get("FILES")
-        for table_name in files_dn.get_tables():
-            table_columns = files_dn.get_table_columns(table_name)
-            for i, column_name in enumerate(table_columns):
-                result_row = row_templates["text"].copy()
-                result_row[1] = "files"
-                result_row[2] = table_name
-                result_row[3] = column_name
-                result_row[4] = i
-                result.append(result_row)
+        if is_selected("information_schema", schemas):
+            for table_name, table in inf_schema.tables.items():
+                if is_selected(table_name, table_names):
+                    add_columns("information_schema", table_name, table.columns)
+
+        if is_selected("mindsdb", schemas):
+            mindsdb_dn = inf_schema.get("MINDSDB")
+            for table_row in mindsdb_dn.get_tables():
+                table_name = table_row.TABLE_NAME
+                if is_selected(table_name, table_names):
+                    add_columns("mindsdb", table_name, mindsdb_dn.get_table_columns(table_name))
+
+        if is_selected("files", schemas):
+            files_dn = inf_schema.get("FILES")
+            for table_row in files_dn.get_tables():
+                table_name = getattr(table_row, "TABLE_NAME", table_row)
+                if is_selected(table_name, table_names):
+                    add_columns("files", table_name, files_dn.get_table_columns(table_name))
+
+        if schemas is not None:
+            ds_names = [
+                ds_name for ds_name in inf_schema.get_integrations_names()
+                if ds_name in schemas
+            ]
+            loaders = {}
+            for ds_name, rows in get_integrations_tables(inf_schema, ds_names).items():
+                for row in rows:
+                    table_name = row[2]
+                    if is_selected(table_name, table_names):
+                        loaders[(ds_name, 'columns', table_name)] = partial(
+                            _load_integration_columns, inf_schema, ds_name, table_name
+                        )
+            integrations_columns = metadata_catalog.get_many(loaders)
+            for key in loaders:
+                if key not in integrations_columns:
+                    continue
+                ds_name, _, table_name = key
+                columns = integrations_columns[key]
+                add_columns(ds_name, table_name, [x[0] for x in columns], [x[1] for x in columns])
 
         df = pd.DataFrame(result, columns=cls.columns)
         return df
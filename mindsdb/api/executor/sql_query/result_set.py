@@ -41,36 +41,76 @@ class ResultSet:
         for i in range(length):
             self._records.append([])
 
+        # columnar storage: dataframe with positional column names (0..N-1).
+        #   if it is set it is used instead of self._records
+        self._df = None
+        # rows of self._df: (dataframe, rows), they are converted once for the dataframe
+        self._df_rows = None
+
         self.is_prediction = False
 
     def __repr__(self):
         col_names = ', '.join([col.name for col in self._columns])
-        data = '\n'.join([str(rec) for rec in self._records[:20]])
+        data = '\n'.join([str(rec) for rec in self._get_df_head(20)])
 
-        if len(self._records) > 20:
+        if self.length() > 20:
             data += '\n...'
 
         return f'{self.__class__.__name__}({self.length()} rows, cols: {col_names})\n {data}'
 
     def __len__(self) -> int:
-        return len(self._records)
+        return self.length()
 
-    # --- converters ---
+    # --- storage ---
 
-    def from_df(self, df, database, table_name, table_alias=None):
+    def is_columnar(self) -> bool:
+        return self._df is not None
 
-        resp_dict = df.to_dict(orient='split')
+    def _set_df(self, df):
+        # keep dataframe as is, only replace column names with positions
+        self._df = df.set_axis(range(len(df.columns)), axis=1, copy=False)
+        self._records = []
+
+    def _get_df(self):
+        # switch to columnar storage
+        if self._df is None:
+            self._df = pd.DataFrame(self._records, columns=range(len(self._columns)))
+            self._records = []
+        return self._df
+
+    def _get_records(self):
+        # switch to row storage
+        if self._df is not None:
+            self._records = self._get_df_rows()
+            self._df = None
+            self._df_rows = None
+        return self._records
 
-        self._records = resp_dict['data']
+    def _get_df_rows(self):
+        # rows of dataframe, converted once for the dataframe. They must not be changed or returned to callers
+        if self._df_rows is None or self._df_rows[0] is not self._df:
+            self._df_rows = (self._df, self._df.to_dict(orient='split')['data'])
+        return self._df_rows[1]
 
-        for col in resp_dict['columns']:
+    def _get_df_head(self, n):
+        if self._df is not None:
+            return self._df.head(n).to_dict(orient='split')['data']
+        return self._records[:n]
+
+    # --- converters ---
+
+    def from_df(self, df, database, table_name, table_alias=None):
+
+        for col, dtype in zip(df.columns, df.dtypes):
             self._columns.append(Column(
                 name=col,
                 table_name=table_name,
                 table_alias=table_alias,
                 database=database,
-                type=df.dtypes[col]
+                type=dtype
             ))
+
+        self._set_df(df)
         return self
 
     def from_df_cols(self, df, col_names, strict=True):
@@ -80,11 +120,7 @@ class ResultSet:
             if col.alias is not None:
                 alias_idx[col.alias] = col
 
-        resp_dict = df.to_dict(orient='split')
-
-        self._records = resp_dict['data']
-
-        for col in resp_dict['columns']:
+        for col in df.columns:
             if col in col_names or strict:
                 column = col_names[col]
             elif col in alias_idx:
@@ -92,11 +128,24 @@ class ResultSet:
             else:
                 column = Column(col)
             self._columns.append(column)
+
+        self._set_df(df)
         return self
 
+    def from_raw_df(self, df, columns):
+        # dataframe with positional column names and list of its columns
+        self._columns = list(columns)
+        self._set_df(df)
+        return self
+
+    def get_raw_df(self):
+        # dataframe with positional column names. is not copied if result set is columnar
+        return self._get_df()
+
     def to_df(self):
+        # copy of data: changes of dataframe don't affect result set
         columns = self.get_column_names()
-        return pd.DataFrame(self._records, columns=columns)
+        return self._get_df().set_axis(columns, axis=1, copy=True)
 
     def to_df_cols(self, prefix=''):
         # returns dataframe and dict of columns
@@ -109,7 +158,7 @@ class ResultSet:
             columns.append(name)
             col_names[name] = col
 
-        return pd.DataFrame(self._records, columns=columns), col_names
+        return self._get_df().set_axis(columns, axis=1, copy=True), col_names
 
     # --- tables ---
 
@@ -141,6 +190,20 @@ class ResultSet:
 
         if values is None:
             values = []
+
+        if self._df is not None:
+            length = len(self._df)
+            if length > 0:
+                values = list(values[:length])
+                values += [None] * (length - len(values))
+            else:
+                values = []
+            # copy of the frame: new column doesn't affect dataframes shared with other result sets
+            df = self._df.copy(deep=False)
+            df[len(self._columns) - 1] = pd.Series(values, index=df.index, dtype=object if len(values) == 0 else None)
+            self._df = df
+            return
+
         # update records
         if len(self._records) > 0:
             for rec in self._records:
@@ -153,6 +216,11 @@ class ResultSet:
     def del_column(self, col):
         idx = self._locate_column(col)
         self._columns.pop(idx)
+        if self._df is not None:
+            df = self._df.drop(columns=idx)
+            self._df = df.set_axis(range(len(df.columns)), axis=1, copy=False)
+            return
+
         for row in self._records:
             row.pop(idx)
 
@@ -182,17 +250,27 @@ class ResultSet:
         # copy with values
         idx = self._locate_column(col)
 
-        values = [row[idx] for row in self._records]
+        if self._df is not None:
+            values = self._df[idx].tolist()
+        else:
+            values = [row[idx] for row in self._records]
 
         col2 = copy.deepcopy(col)
 
         result_set2.add_column(col2, values)
         return col2
 
+    def get_column_values(self, col_idx):
+        # values of one column by its position
+        if self._df is not None:
+            return self._df[col_idx].tolist()
+        return [row[col_idx] for row in self._records]
+
     # --- records ---
 
     def add_records(self, data):
         names = self.get_column_names()
+        records = self._get_records()
         for rec in data:
             # if len(rec) != len(self._columns):
             #     raise ErSqlWrongArguments(f'Record length mismatch columns length: {len(rec)} != {len(self._columns)}')
@@ -201,15 +279,26 @@ class ResultSet:
                 rec[name]
                 for name in names
             ]
-            self._records.append(record)
+            records.append(record)
 
     def get_records_raw(self):
+        if self._df is not None:
+            # don't change storage mode on read. Rows are new lists: they can be changed by caller
+            return [list(row) for row in self._get_df_rows()]
         return self._records
 
     def add_record_raw(self, rec):
         if len(rec) != len(self._columns):
             raise WrongArgumentError(f'Record length mismatch columns length: {len(rec)} != {len(self.columns)}')
-        self._records.append(rec)
+        self._get_records().append(rec)
+
+    def add_records_raw(self, records):
+        # bulk version of add_record_raw
+        if self._df is None and len(self._records) == 0:
+            self._records = records
+            return
+        for rec in records:
+            self.add_record_raw(rec)
 
     @property
     def records(self):
@@ -221,7 +310,8 @@ class ResultSet:
         # if resultSet contents duplicate column name: only one of them will be in output
         names = self.get_column_names()
         records = []
-        for row in self._records:
+        rows = self._get_df_rows() if self._df is not None else self._records
+        for row in rows:
             records.append(dict(zip(names, row)))
         return records
 
@@ -229,4 +319,6 @@ class ResultSet:
     #     self._records = []
 
     def length(self):
+        if self._df is not None:
+            return len(self._df)
         return len(self._records)
@@ -10,13 +10,21 @@
 """
 import re
 import inspect
+import threading
 from textwrap import dedent
+from concurrent.futures import wait, FIRST_COMPLETED
+
+import pandas as pd
 
 from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.planner.step_result import Result
 from mindsdb_sql.planner.steps import (
+    PlanStep,
     ApplyTimeseriesPredictorStep,
     ApplyPredictorRowStep,
     ApplyPredictorStep,
+    FetchDataframeStep,
 )
 
 from mindsdb_sql.exceptions import PlanningException
@@ -35,17 +43,60 @@ from mindsdb.utilities.fs import create_process_mark, delete_process_mark
 
 from . import steps
 from .result_set import ResultSet, Column
+from .steps_executor import get_steps_executor, get_thread_context, submit_to_steps_executor
 from . steps.base import BaseStepCall
+from .steps.fetch_dataframe import FetchDataframeStepCall
 
 superset_subquery = re.compile(r'from[\s\n]*(\(.*\))[\s\n]*as[\s\n]*virtual_table', flags=re.IGNORECASE | re.MULTILINE | re.S)
 
+# steps which can be executed in separate thread: they don't change state of the query
+parallel_steps = (FetchDataframeStep,)
+
+
+def get_step_dependencies(step: PlanStep) -> set:
+    """ Find numbers of steps which results are used by the step:
+        in references, in nested steps and as Parameter(Result) inside the query
+    """
+    step_nums = set()
+    visited = set()
+
+    def _find(obj):
+        if id(obj) in visited:
+            return
+        visited.add(id(obj))
+
+        if isinstance(obj, Result):
+            step_nums.add(obj.step_num)
+        elif isinstance(obj, PlanStep):
+            if obj is not step and obj.step_num is not None:
+                # result of other step
+                step_nums.add(obj.step_num)
+            for key, value in vars(obj).items():
+                if key != 'result_data':
+                    _find(value)
+        elif isinstance(obj, ASTNode):
+            for value in vars(obj).values():
+                _find(value)
+        elif isinstance(obj, (list, tuple, set)):
+            for item in obj:
+                _find(item)
+        elif isinstance(obj, dict):
+            for item in obj.values():
+                _find(item)
+
+    _find(step)
+    return step_nums
+
 
 class SQLQuery:
 
     step_handlers = {}
 
-    def __init__(self, sql, session, execute=True, database=None):
+    def __init__(self, sql, session, execute=True, database=None, stream=False):
         self.session = session
+        # result of the last step can be pulled from the integration by batches
+        self.stream = stream
+        self.stream_batches = None
 
         if database is not None:
             self.database = database
@@ -195,6 +246,9 @@ class SQLQuery:
         )
 
     def fetch(self, view='list'):
+        if self.stream_batches is not None:
+            # read the rest of the result
+            self._fetch_stream()
         data = self.fetched_data
 
         if view == 'dataframe':
@@ -207,6 +261,32 @@ class SQLQuery:
             'result': result
         }
 
+    def _fetch_stream(self):
+        batches, self.stream_batches = self.stream_batches, None
+        results = [self.fetched_data]
+        for batch in batches:
+            for col in batch.find_columns('__mindsdb_row_id'):
+                batch.del_column(col)
+            if batch.length() > 0:
+                results.append(batch)
+        if len(results) > 1:
+            df = pd.concat([result.get_raw_df() for result in results], ignore_index=True)
+            self.fetched_data = ResultSet().from_raw_df(df, self.fetched_data.columns)
+
+    def fetch_batches(self):
+        """ Result of the query by batches (lists of rows).
+            If query was executed with stream=True, batches after the first one are pulled from the integration lazily
+        """
+        yield self.fetched_data.get_records_raw()
+
+        batches, self.stream_batches = self.stream_batches, None
+        if batches is None:
+            return
+        for batch in batches:
+            for col in batch.find_columns('__mindsdb_row_id'):
+                batch.del_column(col)
+            yield batch.get_records_raw()
+
     def prepare_query(self, prepare=True):
         if prepare:
             # it is prepared statement call
@@ -254,11 +334,33 @@ class SQLQuery:
             predict_steps = (ApplyPredictorRowStep, ApplyPredictorStep, ApplyTimeseriesPredictorStep)
             if any(s in predict_steps for s in steps_classes):
                 process_mark = create_process_mark('predict')
-            for step in steps:
-                with profiler.Context(f'step: {step.__class__.__name__}'):
-                    data = self.execute_step(step)
-                step.set_result(data)
+
+            stream_step = None
+            if self.stream and self.outer_query is None and len(steps) > 0 \
+                    and isinstance(steps[-1], FetchDataframeStep):
+                # last step is fetched by batches
+                stream_step = steps.pop()
+
+            executor = None
+            if len([x for x in steps if isinstance(x, parallel_steps)]) > 1:
+                executor = get_steps_executor()
+
+            if executor is not None:
+                self.execute_steps_parallel(steps, executor)
+            else:
+                for step in steps:
+                    with profiler.Context(f'step: {step.__class__.__name__}'):
+                        data = self.execute_step(step)
+                    step.set_result(data)
+                    self.steps_data.append(data)
+
+            if stream_step is not None:
+                batch_size = self.session.config.get('executor', {}).get('stream_batch_size', 1000)
+                batches = FetchDataframeStepCall(self).call_stream(stream_step, batch_size=batch_size)
+                data = next(batches)
+                stream_step.set_result(data)
                 self.steps_data.append(data)
+                self.stream_batches = batches
         except PlanningException as e:
             raise LogicError(e)
         except Exception as e:
@@ -310,6 +412,85 @@ class SQLQuery:
         except Exception as e:
             raise UnknownError("error in column list step") from e
 
+    def execute_steps_parallel(self, steps, executor):
+        """ Execute steps using dependencies between them.
+            Independent fetch steps are executed in thread pool as soon as their input is ready.
+            Other steps are executed in the current thread in the order of the plan
+              and after all previous steps are completed
+        """
+        offset = len(self.steps_data)
+        self.steps_data.extend([None] * len(steps))
+
+        # position of step in the plan by step_num
+        positions = {}
+        for i, step in enumerate(steps):
+            if step.step_num is not None:
+                positions[step.step_num] = i
+
+        # dependencies from the previous steps only: plan order is a valid order of execution
+        dependencies = []
+        for i, step in enumerate(steps):
+            deps = set()
+            for step_num in get_step_dependencies(step):
+                pos = positions.get(step_num)
+                if pos is not None and pos < i:
+                    deps.add(pos)
+            dependencies.append(deps)
+
+        ctx_dump = get_thread_context()
+        cancel_event = threading.Event()
+
+        done = set()
+        running = {}
+        submitted = set()
+
+        def set_result(pos, data):
+            steps[pos].set_result(data)
+            self.steps_data[offset + pos] = data
+            done.add(pos)
+
+        def submit_ready():
+            for pos, step in enumerate(steps):
+                if pos in submitted or not isinstance(step, parallel_steps):
+                    continue
+                if dependencies[pos].issubset(done):
+                    submitted.add(pos)
+                    future = submit_to_steps_executor(
+                        executor, ctx_dump, self.execute_step, step, cancel_event=cancel_event
+                    )
+                    running[future] = pos
+
+        def wait_for(positions):
+            while not positions.issubset(done):
+                if len(running) == 0:
+                    raise LogicError('Unable to resolve order of steps execution')
+                completed, _ = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in completed:
+                    pos = running.pop(future)
+                    set_result(pos, future.result())
+                submit_ready()
+
+        try:
+            submit_ready()
+            for pos, step in enumerate(steps):
+                if pos in submitted:
+                    continue
+                # wait all previous steps
+                wait_for(set(range(pos)))
+
+                with profiler.Context(f'step: {step.__class__.__name__}'):
+                    data = self.execute_step(step)
+                set_result(pos, data)
+                submit_ready()
+
+            wait_for(set(range(len(steps))))
+        finally:
+            # if the query is failed: steps in queue are not started, running steps are stopped
+            #   before the next request to data source. Handlers are returned to the pool by threads of the pool
+            cancel_event.set()
+            for future in running:
+                future.cancel()
+
     def execute_step(self, step):
         cls_name = step.__class__.__name__
         handler = self.step_handlers.get(cls_name)
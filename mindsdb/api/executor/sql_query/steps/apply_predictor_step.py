@@ -20,7 +20,7 @@ from mindsdb_sql.planner.steps import (
 )
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
-from mindsdb.utilities.cache import get_cache, json_checksum
+from mindsdb.utilities.cache import get_cache, dataframe_checksum, json_checksum
 
 from .base import BaseStepCall
 
@@ -73,9 +73,9 @@ class ApplyPredictorRowStepCall(ApplyPredictorBaseCall):
                 rs = self.steps_data[value.value.step_num]
                 if rs.length() == 1:
                     # one value, don't do list
-                    value = rs.get_records_raw()[0][0]
+                    value = rs.get_column_values(0)[0]
                 else:
-                    value = [i[0] for i in rs.get_records_raw()]
+                    value = rs.get_column_values(0)
             where_data[key] = value
 
         version = None
@@ -154,7 +154,11 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
         project_name = step.namespace
         predictor_name = step.predictor.parts[0]
 
-        where_data = data.get_records()
+        # input of the model is passed in columnar form. the frame is a copy: added columns don't change the result set
+        where_data = data.to_df()
+        if where_data.columns.has_duplicates:
+            # the same as for records: the last of columns with the same name is used
+            where_data = where_data.loc[:, ~where_data.columns.duplicated(keep='last')]
 
         # add constants from where
         row_dict = {}
@@ -163,11 +167,11 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                 if isinstance(v, Result):
                     prev_result = self.steps_data[v.step_num]
                     # TODO we await only one value: model.param = (subselect)
-                    v = prev_result.get_records_raw()[0][0]
+                    v = prev_result.get_column_values(0)[0]
                 row_dict[k] = v
 
-            for record in where_data:
-                record.update(row_dict)
+            for k, v in row_dict.items():
+                where_data[k] = [v] * len(where_data)
 
         predictor_metadata = {}
         for pm in self.context['predictor_metadata']:
@@ -187,9 +191,8 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                 # normal mode -- emit a forecast ($HORIZON data points on each) for each provided timestamp
                 params['force_ts_infer'] = True
                 _mdb_forecast_offset = None
-            for row in where_data:
-                if '__mdb_forecast_offset' not in row:
-                    row['__mdb_forecast_offset'] = _mdb_forecast_offset
+            if '__mdb_forecast_offset' not in where_data.columns:
+                where_data['__mdb_forecast_offset'] = [_mdb_forecast_offset] * len(where_data)
 
         # for row in where_data:
         #     for key in row:
@@ -212,30 +215,37 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                 ))
         else:
             predictor_id = predictor_metadata['id']
-            key = f'{predictor_name}_{predictor_id}_{json_checksum(where_data)}'
+            # checksum of input data: dataframe is hashed vectorized, constants are added separately
+            data_checksum = dataframe_checksum(data.to_df())
+            params_checksum = json_checksum([row_dict, _mdb_forecast_offset])
+            key = f'{predictor_name}_{predictor_id}_{data_checksum}_{params_checksum}'
 
             if self.session.predictor_cache is False:
-                data = None
+                predictions = None
             else:
                 predictor_cache = get_cache('predict')
-                data = predictor_cache.get(key)
+                predictions = predictor_cache.get(key)
+                if isinstance(predictions, list):
+                    # cached in old format: list of records
+                    predictions = pd.DataFrame(predictions)
 
-            if data is None:
+            if predictions is None:
                 version = None
                 if len(step.predictor.parts) > 1 and step.predictor.parts[-1].isdigit():
                     version = int(step.predictor.parts[-1])
                 predictions = self.apply_predictor(project_name, predictor_name, where_data, version, params)
 
-                data = predictions.to_dict(orient='records')
-                columns_dtypes = dict(predictions.dtypes)
+                if isinstance(predictions, pd.DataFrame) and self.session.predictor_cache is not False:
+                    predictor_cache.set(key, predictions)
 
-                if data is not None and isinstance(data, list) and self.session.predictor_cache is not False:
-                    predictor_cache.set(key, data)
-            else:
-                columns_dtypes = {}
-            if len(data) > 0:
-                cols = list(data[0].keys())
-                for col in cols:
+            if len(predictions) == 0:
+                return result
+
+            if is_timeseries:
+                # apply filter
+                columns_dtypes = dict(predictions.dtypes)
+                data = predictions.to_dict(orient='records')
+                for col in predictions.columns:
                     result.add_column(Column(
                         name=col,
                         table_name=table_name[1],
@@ -243,10 +253,16 @@ class ApplyPredictorStepCall(ApplyPredictorBaseCall):
                         database=table_name[0],
                         type=columns_dtypes.get(col)
                     ))
-            # apply filter
-            if is_timeseries:
-                data = self.apply_ts_filter(data, where_data, step, predictor_metadata)
-            result.add_records(data)
+                data = self.apply_ts_filter(data, where_data.to_dict(orient='records'), step, predictor_metadata)
+                result.add_records(data)
+            else:
+                # keep predictions in columnar form
+                result.from_df(
+                    predictions,
+                    database=table_name[0],
+                    table_name=table_name[1],
+                    table_alias=table_name[2]
+                )
 
         return result
 
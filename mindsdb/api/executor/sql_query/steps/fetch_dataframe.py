@@ -1,3 +1,5 @@
+import pandas as pd
+
 from mindsdb_sql.parser.ast import (
     Identifier,
     Constant,
@@ -11,6 +13,7 @@ from mindsdb_sql.planner.steps import FetchDataframeStep
 from mindsdb_sql.planner.utils import query_traversal
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+from mindsdb.api.executor.sql_query.steps_executor import check_cancelled
 from mindsdb.api.executor.exceptions import UnknownError
 from mindsdb.interfaces.query_context.context_controller import query_context_controller
 
@@ -50,7 +53,7 @@ def get_fill_param_fnc(steps_data):
         if isinstance(node, BinaryOperation):
             if isinstance(node.args[1], Parameter):
                 rs = steps_data[node.args[1].value.step_num]
-                items = [Constant(i[0]) for i in rs.get_records_raw()]
+                items = [Constant(i) for i in rs.get_column_values(0)]
                 if node.op == '=' and len(items) == 1:
                     # extract one value for option 'col=(subselect)'
                     node.args[1] = items[0]
@@ -60,7 +63,7 @@ def get_fill_param_fnc(steps_data):
 
         if isinstance(node, Parameter):
             rs = steps_data[node.value.step_num]
-            items = [Constant(i[0]) for i in rs.get_records_raw()]
+            items = [Constant(i) for i in rs.get_column_values(0)]
             return Tuple(items)
     return fill_params
 
@@ -77,6 +80,9 @@ class FetchDataframeStepCall(BaseStepCall):
         if dn is None:
             raise UnknownError(f'Unknown integration name: {step.integration}')
 
+        # query can be already failed if the step is executed in parallel with others
+        check_cancelled()
+
         if query is None:
             table_alias = (self.context.get('database'), 'result', 'result')
 
@@ -102,8 +108,23 @@ class FetchDataframeStepCall(BaseStepCall):
             )
 
             if context_callback:
+                # context of failed query is not updated
+                check_cancelled()
                 context_callback(data, columns_info)
 
+        return self._to_result_set(data, columns_info, table_alias)
+
+    @staticmethod
+    def _to_result_set(data, columns_info, table_alias):
+        if isinstance(data, pd.DataFrame):
+            # keep data in columnar form
+            return ResultSet().from_df(
+                data,
+                database=table_alias[0],
+                table_name=table_alias[1],
+                table_alias=table_alias[2]
+            )
+
         result = ResultSet()
         for column in columns_info:
             result.add_column(Column(
@@ -113,7 +134,35 @@ class FetchDataframeStepCall(BaseStepCall):
                 table_alias=table_alias[2],
                 database=table_alias[0]
             ))
-        for record in data:
-            result.add_record_raw(record)
+        result.add_records_raw(data)
 
         return result
+
+    def call_stream(self, step, batch_size: int = 1000):
+        """ Execute step and return result by batches. Data is pulled from the integration lazily
+            if it is possible, otherwise the whole result is returned as one batch
+
+            Returns:
+                Iterator[ResultSet]: at least one result set is returned
+        """
+        dn = self.session.datahub.get(step.integration)
+        if step.query is None or not hasattr(dn, 'query_stream'):
+            yield self.call(step)
+            return
+
+        query = step.query
+        table_alias = get_table_alias(query.from_table, self.context.get('database'))
+
+        fill_params = get_fill_param_fnc(self.steps_data)
+        query_traversal(query, fill_params)
+
+        query, context_callback = query_context_controller.handle_db_context_vars(query, dn, self.session)
+        if context_callback:
+            # context of the query is updated using the whole result
+            data, columns_info = dn.query(query=query, session=self.session)
+            context_callback(data, columns_info)
+            yield self._to_result_set(data, columns_info, table_alias)
+            return
+
+        for data, columns_info in dn.query_stream(query=query, session=self.session, batch_size=batch_size):
+            yield self._to_result_set(data, columns_info, table_alias)
@@ -71,10 +71,14 @@ class JoinStepCall(BaseStepCall):
                        SELECT * FROM table_a {join_type} table_b
                        ON {join_condition}
                    """
+        column_types = {
+            'table_a': {name: col.type for name, col in names_a.items()},
+            'table_b': {name: col.type for name, col in names_b.items()},
+        }
         resp_df, _description = query_df_with_type_infer_fallback(query, {
             'table_a': table_a,
             'table_b': table_b
-        })
+        }, column_types=column_types)
 
         resp_df = resp_df.replace({np.nan: None})
 
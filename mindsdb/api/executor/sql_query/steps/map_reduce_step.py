@@ -1,17 +1,27 @@
 import copy
 
+import pandas as pd
+
 from mindsdb_sql.parser.ast import (
     BinaryOperation,
     UnaryOperation,
+    Identifier,
     Constant,
+    Tuple,
 )
 from mindsdb_sql.planner.steps import (
     MapReduceStep,
     FetchDataframeStep,
     MultipleSteps,
 )
+from mindsdb_sql.planner.utils import query_traversal
 
 from mindsdb.api.executor.sql_query.result_set import ResultSet
+from mindsdb.api.executor.sql_query.steps_executor import (
+    get_steps_executor,
+    get_thread_context,
+    submit_to_steps_executor
+)
 from mindsdb.api.executor.exceptions import LogicError
 
 from .base import BaseStepCall
@@ -52,12 +62,95 @@ def replaceQueryVar(where, var_value, var_name):
             where.value = var_value
 
 
-def join_query_data(target, source):
-    if len(target.columns) == 0:
-        target = source
-    else:
-        target.add_records(source.get_records())
-    return target
+def get_query_var_name(node):
+    if isinstance(node, Constant) and isinstance(node.value, str) and node.value.startswith('$var['):
+        return node.value[5:-1]
+
+
+def split_query_vars(where):
+    """
+    Split condition into list of conditions without vars and vars mapping {var name: Identifier}.
+    It is possible only if vars are used as 'column = $var[name]' in chain of 'and' operations.
+    Returns None otherwise
+    """
+    var_columns = {}
+    conditions = []
+
+    def has_vars(node):
+        found = []
+
+        def _find(node2, **kwargs):
+            if get_query_var_name(node2) is not None:
+                found.append(node2)
+        query_traversal(node, _find)
+        return len(found) > 0
+
+    def _split(node):
+        if isinstance(node, BinaryOperation):
+            if node.op.lower() == 'and':
+                return _split(node.args[0]) and _split(node.args[1])
+            var_name = get_query_var_name(node.args[1])
+            if node.op == '=' and var_name is not None and isinstance(node.args[0], Identifier):
+                if var_name in var_columns:
+                    return False
+                var_columns[var_name] = node.args[0]
+                return True
+        if has_vars(node):
+            return False
+        conditions.append(node)
+        return True
+
+    if where is None or not _split(where):
+        return None
+    return conditions, var_columns
+
+
+def join_conditions(conditions, op):
+    # balanced tree to prevent deep recursion on rendering
+    if len(conditions) == 1:
+        return conditions[0]
+    middle = len(conditions) // 2
+    return BinaryOperation(op, args=[
+        join_conditions(conditions[:middle], op),
+        join_conditions(conditions[middle:], op)
+    ])
+
+
+def build_vars_condition(var_columns, var_groups):
+    """
+    Condition to select data for several var groups at once:
+       'col in (v1, v2, ...)' for one var or '(col1 = v1 and col2 = v2) or (...)' for several
+    """
+    if len(var_columns) == 1:
+        var_name, identifier = list(var_columns.items())[0]
+        values = [Constant(var_group[var_name]) for var_group in var_groups]
+        return BinaryOperation('in', args=[copy.deepcopy(identifier), Tuple(values)])
+
+    group_conditions = []
+    for var_group in var_groups:
+        condition = join_conditions([
+            BinaryOperation('=', args=[copy.deepcopy(identifier), Constant(var_group[var_name])])
+            for var_name, identifier in var_columns.items()
+        ], 'and')
+        condition.parentheses = True
+        group_conditions.append(condition)
+    condition = join_conditions(group_conditions, 'or')
+    condition.parentheses = True
+    return condition
+
+
+def concat_query_data(results):
+    """
+    Union of results of the same query. Data is concatenated in columnar form
+    """
+    results = [result for result in results if len(result.columns) > 0]
+    if len(results) == 0:
+        return ResultSet()
+    if len(results) == 1:
+        return results[0]
+
+    df = pd.concat([result.get_raw_df() for result in results], ignore_index=True)
+    return ResultSet().from_raw_df(df, results[0].columns)
 
 
 class MapReduceStepCall(BaseStepCall):
@@ -81,7 +174,6 @@ class MapReduceStepCall(BaseStepCall):
 
         substep = step.step
         if type(substep) is FetchDataframeStep:
-            query = substep.query
             if len(vars) == 0:
                 substep.query.limit = Constant(0)
                 substep.query.where = None
@@ -92,18 +184,8 @@ class MapReduceStepCall(BaseStepCall):
                     data.add_column(column)
 
                 data.add_records(sub_data.get_records())
-
-            for var_group in vars:
-                markQueryVar(query.where)
-                for name, value in var_group.items():
-                    replaceQueryVar(query.where, value, name)
-                sub_data = self._fetch_dataframe_step(substep)
-                if len(data.columns) == 0:
-                    data = sub_data
-                else:
-                    data.add_records(sub_data.get_records())
-
-                unmarkQueryVar(query.where)
+            else:
+                data = self._fetch_by_vars([substep], vars)
         elif type(substep) is MultipleSteps:
             data = self._multiple_steps_reduce(substep, vars)
         else:
@@ -114,33 +196,125 @@ class MapReduceStepCall(BaseStepCall):
         if step.reduce != 'union':
             raise LogicError(f'Unknown MultipleSteps type: {step.reduce}')
 
-        data = ResultSet()
-
-        # mark vars
-        steps = []
         for substep in step.steps:
             if isinstance(substep, FetchDataframeStep) is False:
                 raise LogicError(f'Wrong step type for MultipleSteps: {step}')
+
+        return self._fetch_by_vars(step.steps, vars)
+
+    def _fetch_by_vars(self, substeps, vars):
+        """
+        Fetch data for every var group and union results.
+        Groups are collapsed to batched queries if it is possible,
+        otherwise there is a query for every group. Queries are executed in parallel
+        """
+        batch_size = self.session.config.get('executor', {}).get('map_reduce_batch_size', 1000)
+
+        var_columns = None
+        batched_steps = []
+        if batch_size > 1:
+            for substep in substeps:
+                split = self._split_batched_query(substep.query, vars)
+                if split is None:
+                    batched_steps = None
+                    break
+                conditions, var_columns = split
+                for i in range(0, len(vars), batch_size):
+                    substep2 = copy.deepcopy(substep)
+                    substep2.query.where = join_conditions(
+                        conditions + [build_vars_condition(var_columns, vars[i: i + batch_size])],
+                        'and'
+                    )
+                    batched_steps.append(substep2)
+
+        if batched_steps:
+            results = self._fetch_dataframe_steps(batched_steps)
+            data = concat_query_data(results)
+            return self._order_by_vars(data, var_columns, vars)
+
+        # query for every var group
+        steps = []
+        for substep in substeps:
             substep = copy.deepcopy(substep)
             markQueryVar(substep.query.where)
             steps.append(substep)
 
+        steps_by_vars = []
         for var_group in vars:
-            steps2 = copy.deepcopy(steps)
-            for name, value in var_group.items():
-                for substep in steps2:
-                    replaceQueryVar(substep.query.where, value, name)
-            sub_data = self._multiple_steps(steps2)
-            data = join_query_data(data, sub_data)
+            for substep in steps:
+                substep2 = copy.deepcopy(substep)
+                for name, value in var_group.items():
+                    replaceQueryVar(substep2.query.where, value, name)
+                steps_by_vars.append(substep2)
 
-        return data
+        results = self._fetch_dataframe_steps(steps_by_vars)
+        return concat_query_data(results)
 
-    def _multiple_steps(self, steps):
-        data = ResultSet()
-        for substep in steps:
-            sub_data = self._fetch_dataframe_step(substep)
-            data = join_query_data(data, sub_data)
-        return data
+    def _split_batched_query(self, query, vars):
+        # query can be batched if vars are only used in filter and there are no limits and grouping
+        if (
+            query is None
+            or query.limit is not None
+            or query.offset is not None
+            or query.group_by is not None
+            or query.having is not None
+        ):
+            return None
+        split = split_query_vars(query.where)
+        if split is None:
+            return None
+        conditions, var_columns = split
+        if len(var_columns) == 0:
+            return None
+        for var_group in vars:
+            if not set(var_columns.keys()).issubset(var_group.keys()):
+                return None
+        return split
+
+    def _order_by_vars(self, data, var_columns, vars):
+        # restore order of data: rows of every var group go together in the order of var groups
+        if data.length() == 0:
+            return data
+
+        col_names = [name.lower() for name in data.get_column_names()]
+        col_idxs = []
+        for identifier in var_columns.values():
+            name = identifier.parts[-1].lower()
+            if name not in col_names:
+                # can't find column, keep order
+                return data
+            col_idxs.append(col_names.index(name))
+
+        var_names = list(var_columns.keys())
+        groups_idx = {}
+        for i, var_group in enumerate(vars):
+            key = tuple(var_group[name] for name in var_names)
+            groups_idx.setdefault(key, i)
+
+        df = data.get_raw_df()
+        keys = zip(*[df[idx] for idx in col_idxs])
+        order = pd.Series([groups_idx.get(key, len(vars)) for key in keys])
+        df = df.iloc[order.argsort(kind='stable').values].reset_index(drop=True)
+        return ResultSet().from_raw_df(df, data.columns)
+
+    def _fetch_dataframe_steps(self, steps):
+        executor = None
+        if len(steps) > 1:
+            executor = get_steps_executor()
+
+        if executor is None:
+            return [self._fetch_dataframe_step(step) for step in steps]
+
+        ctx_dump = get_thread_context()
+        futures = [
+            submit_to_steps_executor(executor, ctx_dump, self._fetch_dataframe_step, step)
+            for step in steps
+        ]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
 
     def _fetch_dataframe_step(self, step):
         return FetchDataframeStepCall(self.sql_query).call(step)
@@ -17,6 +17,15 @@ class LimitOffsetStepCall(BaseStepCall):
     def call(self, step):
         step_data = self.steps_data[step.dataframe.step_num]
 
+        if step_data.is_columnar():
+            # slice of the frame, rows are not materialized
+            df = step_data.get_raw_df()
+            if isinstance(step.offset, int):
+                df = df.iloc[step.offset:]
+            if isinstance(step.limit, int):
+                df = df.iloc[:step.limit]
+            return ResultSet().from_raw_df(df.reset_index(drop=True), step_data.columns)
+
         step_data2 = ResultSet()
         for col in step_data.columns:
             step_data2.add_column(col)
@@ -0,0 +1,89 @@
+import threading
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+
+_steps_executor = None
+_steps_executor_lock = threading.Lock()
+_thread_state = threading.local()
+
+
+class StepCancelled(Exception):
+    """ step is not executed because other step of the query is failed
+    """
+
+
+def get_steps_executor() -> Optional[ThreadPoolExecutor]:
+    """ Thread pool shared between queries to execute steps in parallel.
+        Handlers which are used by the thread are returned to the pool after the step.
+
+        Returns None if parallel execution is disabled in config ('executor.parallel_steps' <= 1)
+        or if it is called from the thread of the pool: nested queries (views) are executed
+        sequentially to prevent a deadlock of the pool
+    """
+    global _steps_executor
+
+    if getattr(_thread_state, 'is_worker', False):
+        return None
+
+    max_workers = Config().get('executor', {}).get('parallel_steps', 4)
+    if max_workers <= 1:
+        return None
+
+    with _steps_executor_lock:
+        if _steps_executor is None or _steps_executor._max_workers != max_workers:
+            if _steps_executor is not None:
+                # config is changed: threads of the old pool are stopped after their steps
+                _steps_executor.shutdown(wait=False)
+            _steps_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sql_query_step')
+    return _steps_executor
+
+
+def get_thread_context() -> dict:
+    """ Copy of the current context for threads of the pool.
+        Profiling is disabled: profiling tree can't be changed from several threads
+    """
+    return ctx.dump()
+
+
+def check_cancelled() -> None:
+    """ Raise StepCancelled if the step is executed in the pool and its query is already failed.
+        It is checked by steps before requests to data sources: a running request can't be interrupted
+    """
+    cancel_event = getattr(_thread_state, 'cancel_event', None)
+    if cancel_event is not None and cancel_event.is_set():
+        raise StepCancelled()
+
+
+def _run_in_thread(fnc, ctx_dump, cancel_event, *args):
+    ctx.load(ctx_dump)
+    _thread_state.is_worker = True
+    _thread_state.cancel_event = cancel_event
+    try:
+        check_cancelled()
+        return fnc(*args)
+    finally:
+        from mindsdb.interfaces.database.integrations import integration_controller
+
+        _thread_state.is_worker = False
+        _thread_state.cancel_event = None
+        integration_controller.handlers_cache.checkin()
+        db.session.remove()
+
+
+def submit_to_steps_executor(executor: ThreadPoolExecutor, ctx_dump: dict, fnc, *args,
+                             cancel_event: Optional[threading.Event] = None) -> Future:
+    """ Run function in the pool with context of the current thread.
+        If cancel_event is set, then the step is stopped at the next check_cancelled
+    """
+    try:
+        return executor.submit(_run_in_thread, fnc, ctx_dump, cancel_event, *args)
+    except RuntimeError:
+        # the pool was replaced during the query
+        new_executor = get_steps_executor()
+        if new_executor is None or new_executor is executor:
+            raise
+        return new_executor.submit(_run_in_thread, fnc, ctx_dump, cancel_event, *args)
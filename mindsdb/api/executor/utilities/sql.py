@@ -1,9 +1,11 @@
 import copy
+import threading
 from typing import List
 
 import duckdb
-from duckdb import InvalidInputException
 import numpy as np
+import pandas as pd
+import pyarrow as pa
 
 from mindsdb_sql import parse_sql
 from mindsdb_sql.render.sqlalchemy_render import SqlalchemyRender
@@ -52,49 +54,153 @@ def get_query_models(query: ASTNode, default_database: str = None) -> List[tuple
     return _get_query_tables(query, resolve_model_identifier, default_database)
 
 
-def query_df_with_type_infer_fallback(query_str: str, dataframes: dict):
-    ''' Duckdb need to infer column types if column.dtype == object. By default it take 1000 rows,
-        but that may be not sufficient for some cases. This func try to run query multiple times
-        increasing butch size for type infer
+# types of columns (lightwood dtypes and sql types) which can be used for arrow conversion
+_arrow_types = {
+    'integer': pa.int64(),
+    'int': pa.int64(),
+    'bigint': pa.int64(),
+    'float': pa.float64(),
+    'double': pa.float64(),
+    'quantity': pa.float64(),
+    'bool': pa.bool_(),
+    'boolean': pa.bool_(),
+    'categorical': pa.string(),
+    'short_text': pa.string(),
+    'rich_text': pa.string(),
+    'text': pa.string(),
+    'varchar': pa.string(),
+}
+
+# kinds of numpy dtypes which can be used for arrow conversion
+_arrow_dtype_kinds = {
+    'i': pa.int64(),
+    'u': pa.int64(),
+    'f': pa.float64(),
+    'b': pa.bool_(),
+}
+
+_duckdb_local = threading.local()
+
+
+def get_duckdb_connection():
+    """ In-memory duckdb connection of the current thread.
+        Connection is not thread-safe, so every thread has own long-lived connection
+    """
+    con = getattr(_duckdb_local, 'connection', None)
+    if con is None:
+        con = duckdb.connect(database=':memory:')
+        _duckdb_local.connection = con
+    return con
+
+
+def _close_duckdb_connection():
+    con = getattr(_duckdb_local, 'connection', None)
+    _duckdb_local.connection = None
+    if con is not None:
+        try:
+            con.close()
+        except Exception:
+            pass
+
+
+def _get_arrow_type(col_type):
+    """ Arrow type for type of column: name of sql/lightwood type or numpy/pandas dtype.
+        Returns None if type is unknown
+    """
+    if isinstance(col_type, str):
+        return _arrow_types.get(col_type.lower())
+    kind = getattr(col_type, 'kind', None)
+    if isinstance(kind, str):
+        return _arrow_dtype_kinds.get(kind)
+    return None
+
+
+def _to_arrow_array(series, col_type=None):
+    """ Convert column of dataframe to arrow array.
+        Type of column is used for 'object' columns if it is known, otherwise type is inferred from all values.
+        Columns with values of different types are converted to strings
+    """
+    if series.dtype == object:
+        arrow_type = _get_arrow_type(col_type)
+        if arrow_type is not None:
+            try:
+                return pa.array(series, type=arrow_type, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                pass
+    try:
+        return pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        values = [None if pd.isna(v) is True else str(v) for v in series]
+        return pa.array(values, type=pa.string())
+
+
+def df_to_arrow(df, column_types: dict = None):
+    """ Convert dataframe to arrow table
+
+        Args:
+            df (pandas.DataFrame): data
+            column_types (dict): optional types of columns: {column name: type},
+                type is name of sql/lightwood type or numpy dtype
+
+        Returns:
+            pyarrow.Table
+    """
+    if column_types is None:
+        column_types = {}
+    arrays = []
+    for i, name in enumerate(df.columns):
+        arrays.append(_to_arrow_array(df.iloc[:, i], column_types.get(name)))
+    return pa.Table.from_arrays(arrays, names=[str(name) for name in df.columns])
+
+
+def query_df_with_type_infer_fallback(query_str: str, dataframes: dict, column_types: dict = None):
+    ''' Execute query on dataframes using duckdb.
+        Dataframes are registered as arrow tables, with types of 'object' columns inferred from all
+        values (or taken from column_types), so duckdb doesn't need to infer types by sample of rows
 
         Args:
             query_str (str): query to execute
-            dataframes (dict): dataframes
+            dataframes (dict): dataframes: {table name: dataframe}
+            column_types (dict): optional types of columns: {table name: {column name: type}}
 
         Returns:
             pandas.DataFrame
             pandas.columns
     '''
+    if column_types is None:
+        column_types = {}
 
-    for name, value in dataframes.items():
-        locals()[name] = value
+    con = get_duckdb_connection()
+    registered = []
+    try:
+        for name, df in dataframes.items():
+            con.register(name, df_to_arrow(df, column_types.get(name)))
+            registered.append(name)
 
-    con = duckdb.connect(database=':memory:')
-    for sample_size in [1000, 10000, 1000000]:
+        result_df = con.execute(query_str).fetchdf()
+        description = con.description
+    finally:
         try:
-            con.execute(f'set global pandas_analyze_sample={sample_size};')
-            result_df = con.execute(query_str).fetchdf()
-        except InvalidInputException:
-            pass
-        else:
-            break
-    else:
-        raise InvalidInputException
-    description = con.description
-    con.close()
+            for name in registered:
+                con.unregister(name)
+        except Exception:
+            # connection is in a bad state, it will be recreated
+            _close_duckdb_connection()
 
     return result_df, description
 
 
-def query_df(df, query, session=None):
-    """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
+def _render_df_query(query, session=None):
+    """ Adapt simple query to duckdb: table is renamed to 'df', mysql functions are replaced
 
         Args:
-            df (pandas.DataFrame): data
             query (mindsdb_sql.parser.ast.Select | str): select query
+            session: current session
 
         Returns:
-            pandas.DataFrame
+            str: name of the table in the query
+            set: columns used in json functions
+            str: query rendered to 'postgres' dialect
     """
 
     if isinstance(query, str):
@@ -138,6 +244,45 @@ def query_df(df, query, session=None):
 
     query_traversal(query_ast, adapt_query)
 
+    render = SqlalchemyRender('postgres')
+    try:
+        query_str = render.get_string(query_ast, with_failback=False)
+    except Exception as e:
+        logger.error(
+            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
+        )
+        query_str = render.get_string(query_ast, with_failback=True)
+
+    return table_name, json_columns, query_str
+
+
+def _rename_result_columns(result_df, description):
+    # duckdb can change names of the columns in dataframe, real names are in description
+    result_df = result_df.replace({np.nan: None})
+
+    new_column_names = {}
+    real_column_names = [x[0] for x in description]
+    for i, duck_column_name in enumerate(result_df.columns):
+        new_column_names[duck_column_name] = real_column_names[i]
+    return result_df.rename(
+        new_column_names,
+        axis='columns'
+    )
+
+
+def query_df(df, query, session=None):
+    """ Perform simple query ('select' from one table, without subqueries and joins) on DataFrame.
+
+        Args:
+            df (pandas.DataFrame): data
+            query (mindsdb_sql.parser.ast.Select | str): select query
+
+        Returns:
+            pandas.DataFrame
+    """
+
+    table_name, json_columns, query_str = _render_df_query(query, session)
+
     # convert json columns
     encoder = CustomJSONEncoder()
 
@@ -151,15 +296,6 @@ def query_df(df, query, session=None):
     for column in json_columns:
         df[column] = df[column].apply(_convert)
 
-    render = SqlalchemyRender('postgres')
-    try:
-        query_str = render.get_string(query_ast, with_failback=False)
-    except Exception as e:
-        logger.error(
-            f"Exception during query casting to 'postgres' dialect. Query: {str(query)}. Error: {e}"
-        )
-        query_str = render.get_string(query_ast, with_failback=True)
-
     # workaround to prevent duckdb.TypeMismatchException
     if len(df) > 0:
         if table_name.lower() in ('models', 'predictors'):
@@ -170,14 +306,36 @@ def query_df(df, query, session=None):
                 df = df.astype({'CONNECTION_DATA': 'string'})
 
     result_df, description = query_df_with_type_infer_fallback(query_str, {'df': df})
-    result_df = result_df.replace({np.nan: None})
+    return _rename_result_columns(result_df, description)
 
-    new_column_names = {}
-    real_column_names = [x[0] for x in description]
-    for i, duck_column_name in enumerate(result_df.columns):
-        new_column_names[duck_column_name] = real_column_names[i]
-    result_df = result_df.rename(
-        new_column_names,
-        axis='columns'
-    )
-    return result_df
+
+def query_parquet(file_path, query, session=None):
+    """ Perform simple query ('select' from one table, without subqueries and joins) on parquet file.
+        File is not loaded to memory: duckdb reads only columns and row groups which are required for the query
+
+        Args:
+            file_path (str): path to parquet file
+            query (mindsdb_sql.parser.ast.Select | str): select query
+
+        Returns:
+            pandas.DataFrame
+    """
+
+    _table_name, _json_columns, query_str = _render_df_query(query, session)
+
+    con = get_duckdb_connection()
+    registered = False
+    try:
+        con.read_parquet(str(file_path)).create_view('df')
+        registered = True
+        result_df = con.execute(query_str).fetchdf()
+        description = con.description
+    finally:
+        try:
+            if registered:
+                con.unregister('df')
+        except Exception:
+            # connection is in a bad state, it will be recreated
+            _close_duckdb_connection()
+
+    return _rename_result_columns(result_df, description)
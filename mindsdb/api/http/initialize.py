@@ -252,6 +252,7 @@ def initialize_app(config, no_studio):
 
     @app.teardown_appcontext
     def remove_session(*args, **kwargs):
+        integration_controller.handlers_cache.checkin()
         db.session.remove()
 
     @app.before_request
@@ -0,0 +1,59 @@
+from typing import Iterator, List
+
+
+class ResultCursor:
+    """ Result of the executed prepared statement which is sent to the client by parts (COM_STMT_FETCH).
+        Rows are pulled from the stream of batches only when client requests them,
+        so the whole result is not kept in memory
+
+        Args:
+            rows (List[List]): rows which are already fetched
+            stream (Iterator[List[List]]): next batches of rows
+    """
+
+    def __init__(self, rows: List[List] = None, stream: Iterator[List[List]] = None):
+        self.buffer = list(rows) if rows is not None else []
+        self.offset = 0
+        self.stream = stream
+
+    def _fill(self, count: int):
+        # read batches from stream until there are enough rows in the buffer
+        while len(self.buffer) - self.offset < count and self.stream is not None:
+            try:
+                batch = next(self.stream)
+            except StopIteration:
+                self.stream = None
+                break
+            if self.offset > 0:
+                self.buffer = self.buffer[self.offset:]
+                self.offset = 0
+            self.buffer.extend(batch)
+
+    def fetch(self, limit: int) -> List[List]:
+        self._fill(limit)
+        rows = self.buffer[self.offset:self.offset + limit]
+        self.offset += len(rows)
+        return rows
+
+    def has_more(self) -> bool:
+        self._fill(1)
+        return self.offset < len(self.buffer)
+
+    def is_streaming(self) -> bool:
+        """ The rest of the result is still read from the integration
+        """
+        return self.stream is not None
+
+    def close(self):
+        # stops the stream: opened cursor in the integration is closed
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+        self.buffer = []
+        self.offset = 0
+
+    def __iter__(self):
+        while self.has_more():
+            rows = self.buffer[self.offset:]
+            self.offset = len(self.buffer)
+            yield from rows
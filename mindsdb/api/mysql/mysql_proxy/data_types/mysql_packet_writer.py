@@ -0,0 +1,106 @@
+"""
+*******************************************************
+ * Copyright (C) 2017 MindsDB Inc. <copyright@mindsdb.com>
+ *
+ * This file is part of MindsDB Server.
+ *
+ * MindsDB Server can not be copied and/or distributed without the express
+ * permission of MindsDB Inc
+ *******************************************************
+"""
+
+import struct
+
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import (
+    MAX_PACKET_SIZE,
+    NULL_VALUE,
+    TWO_BYTE_ENC,
+    THREE_BYTE_ENC,
+    EIGHT_BYTE_ENC,
+)
+
+_pack_uint16 = struct.Struct('<H').pack
+_pack_uint32 = struct.Struct('<I').pack
+_pack_uint64 = struct.Struct('<Q').pack
+
+
+def lenenc_int(value: int) -> bytes:
+    """ Length-encoded integer
+        https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_basic_dt_integers.html
+    """
+    if value < NULL_VALUE[0]:
+        return bytes((value,))
+    if value < 1 << 16:
+        return TWO_BYTE_ENC + _pack_uint16(value)
+    if value < 1 << 24:
+        return THREE_BYTE_ENC + _pack_uint32(value)[:3]
+    return EIGHT_BYTE_ENC + _pack_uint64(value)
+
+
+class PacketWriter:
+    """ Writes packets to the socket through the buffer. Buffer is sent when it exceeds flush_size,
+        so big resultsets are sent in chunks and without creating packet object for every row
+
+        Args:
+            socket: socket of the connection
+            session: session with packet sequence number
+            flush_size (int): size of buffer in bytes to send it to the socket
+    """
+
+    def __init__(self, socket, session, flush_size: int = 256 * 1024):
+        self.socket = socket
+        self.session = session
+        self.flush_size = flush_size
+        self.buffer = bytearray()
+
+    def write_packets(self, packets: list):
+        """ Write packet objects. They already have sequence numbers
+        """
+        for packet in packets:
+            self.buffer += packet.accum()
+            self._flush_if_full()
+
+    def write_payload(self, payload):
+        """ Write payload as a packet using the next sequence number.
+            Payload greater than MAX_PACKET_SIZE is split to several packets
+        """
+        view = memoryview(payload)
+        length = len(view)
+        offset = 0
+        while True:
+            size = min(length - offset, MAX_PACKET_SIZE)
+            self.buffer += _pack_uint32(size)[:3]
+            self.buffer.append(self.session.packet_sequence_number)
+            self.session.inc_packet_sequence_number()
+            self.buffer += view[offset:offset + size]
+            offset += size
+            self._flush_if_full()
+            # payload with size of exactly MAX_PACKET_SIZE is followed by an empty packet
+            if size < MAX_PACKET_SIZE:
+                break
+
+    def write_text_rows(self, rows):
+        """ Write rows of resultset in text protocol
+            https://dev.mysql.com/doc/dev/mysql-server/latest/page_protocol_com_query_response_text_resultset_row.html
+        """
+        null_value = NULL_VALUE[0]
+        row_buffer = bytearray()
+        for row in rows:
+            row_buffer.clear()
+            for value in row:
+                if value is None:
+                    row_buffer.append(null_value)
+                    continue
+                value = str(value).encode('utf-8')
+                row_buffer += lenenc_int(len(value))
+                row_buffer += value
+            self.write_payload(row_buffer)
+
+    def _flush_if_full(self):
+        if len(self.buffer) >= self.flush_size:
+            self.flush()
+
+    def flush(self):
+        if len(self.buffer) > 0:
+            self.socket.sendall(self.buffer)
+            self.buffer.clear()
@@ -32,12 +32,10 @@ class ResultsetRowPacket(Packet):
 
     @property
     def body(self):
-        string = b''
-        for x in self.value:
-            if x is NULL_VALUE:
-                string += x
-            else:
-                string += x.toStringPacket()
+        string = b''.join([
+            x if x is NULL_VALUE else x.toStringPacket()
+            for x in self.value
+        ])
 
         self.setBody(string)
         return self._body
@@ -37,6 +37,8 @@ class Executor:
         self.columns = []
         self.params = []
         self.data = None
+        # iterator of next batches of rows after 'data' (for prepared statements)
+        self.stream = None
         self.state_track = None
         self.server_status = None
         self.is_executed = False
@@ -68,7 +70,7 @@ class Executor:
         params = planner_utils.get_query_params(self.query)
         if len(params) == 0:
             # execute immediately
-            self.do_execute()
+            self.do_execute(stream=True)
 
         else:
             # plan query
@@ -100,7 +102,7 @@ class Executor:
         self.query = planner_utils.fill_query_params(self.query, param_values)
 
         # execute query
-        self.do_execute()
+        self.do_execute(stream=True)
 
     @profiler.profile()
     def query_execute(self, sql):
@@ -159,19 +161,20 @@ class Executor:
                 # or run sql in integration without parsing
 
     @profiler.profile()
-    def do_execute(self):
+    def do_execute(self, stream: bool = False):
         # it can be already run at prepare state
         logger.info("%s.do_execute", self.__class__.__name__)
         if self.is_executed:
             return
 
-        ret = self.command_executor.execute_command(self.query)
+        ret = self.command_executor.execute_command(self.query, stream=stream)
         self.error_code = ret.error_code
         self.error_message = ret.error_message
 
         self.is_executed = True
 
         self.data = ret.data
+        self.stream = ret.stream
         self.server_status = ret.status
         if ret.columns is not None:
             self.columns = ret.columns
@@ -29,6 +29,7 @@ from pandas.api import types as pd_types
 import mindsdb.utilities.hooks as hooks
 import mindsdb.utilities.profiler as profiler
 from mindsdb.api.mysql.mysql_proxy.classes.client_capabilities import ClentCapabilities
+from mindsdb.api.mysql.mysql_proxy.classes.result_cursor import ResultCursor
 from mindsdb.api.mysql.mysql_proxy.classes.server_capabilities import (
     server_capabilities,
 )
@@ -37,6 +38,7 @@ from mindsdb.api.mysql.mysql_proxy.classes.sql_statement_parser import (
 )
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet import Packet
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet_writer import PacketWriter
 from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import (
     BinaryResultsetRowPacket,
     ColumnCountPacket,
@@ -83,6 +85,21 @@ from mindsdb.utilities.wizards import make_ssl_cert
 
 logger = log.getLogger(__name__)
 
+# max length of values for types with limited length of text representation
+COLUMN_TYPE_LENGTH = {
+    TYPES.MYSQL_TYPE_TINY: 4,
+    TYPES.MYSQL_TYPE_SHORT: 6,
+    TYPES.MYSQL_TYPE_INT24: 9,
+    TYPES.MYSQL_TYPE_LONG: 20,
+    TYPES.MYSQL_TYPE_LONGLONG: 20,
+    TYPES.MYSQL_TYPE_FLOAT: 24,
+    TYPES.MYSQL_TYPE_DOUBLE: 24,
+    TYPES.MYSQL_TYPE_DATE: 10,
+    TYPES.MYSQL_TYPE_YEAR: 4,
+}
+# count of rows to calculate max length of values
+COLUMN_LENGTH_SAMPLE_SIZE = 1000
+
 
 def empty_fn():
     pass
@@ -336,22 +353,31 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             logger.warning(f"Access denied for user {username}")
             return False
 
+    def get_packet_writer(self) -> PacketWriter:
+        return PacketWriter(self.socket, self.session)
+
     def send_package_group(self, packages):
-        string = b"".join([x.accum() for x in packages])
-        self.socket.sendall(string)
+        writer = self.get_packet_writer()
+        writer.write_packets(packages)
+        writer.flush()
 
     def answer_stmt_close(self, stmt_id):
+        prepared_stmt = self.session.prepared_stmts.get(stmt_id)
+        if prepared_stmt is not None and prepared_stmt.get("cursor") is not None:
+            prepared_stmt["cursor"].close()
         self.session.unregister_stmt(stmt_id)
 
     def send_query_answer(self, answer: SQLAnswer):
         if answer.type == RESPONSE_TYPE.TABLE:
-            packages = []
-            packages += self.get_tabel_packets(columns=answer.columns, data=answer.data)
+            # rows are encoded directly to the buffer of writer and sent in chunks
+            writer = self.get_packet_writer()
+            writer.write_packets(self.get_table_header_packets(columns=answer.columns, data=answer.data))
+            writer.write_text_rows(answer.data)
             if answer.status is not None:
-                packages.append(self.last_packet(status=answer.status))
+                writer.write_packets([self.last_packet(status=answer.status)])
             else:
-                packages.append(self.last_packet())
-            self.send_package_group(packages)
+                writer.write_packets([self.last_packet()])
+            writer.flush()
         elif answer.type == RESPONSE_TYPE.OK:
             self.packet(OkPacket, state_track=answer.state_track).send()
         elif answer.type == RESPONSE_TYPE.ERROR:
@@ -374,15 +400,7 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             column_name = column.get("name", "column_name")
             column_alias = column.get("alias", column_name)
             flags = column.get("flags", 0)
-            if len(data) == 0:
-                length = 0xFFFF
-            else:
-                length = 1
-                for row in data:
-                    if isinstance(row, dict):
-                        length = max(len(str(row[column_alias])), length)
-                    else:
-                        length = max(len(str(row[i])), length)
+            length = self._get_column_length(column["type"], data, i, column_alias)
 
             packets.append(
                 self.packet(
@@ -400,14 +418,38 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
             )
         return packets
 
-    def get_tabel_packets(self, columns, data, status=0):
+    @staticmethod
+    def _get_column_length(column_type, data, idx, alias):
+        """ Max length of column values. It is fixed for numeric types,
+            for other types it is calculated from sample of rows
+        """
+        if column_type in COLUMN_TYPE_LENGTH:
+            return COLUMN_TYPE_LENGTH[column_type]
+        if len(data) == 0:
+            return 0xFFFF
+
+        length = 1
+        for row in data[:COLUMN_LENGTH_SAMPLE_SIZE]:
+            if isinstance(row, dict):
+                length = max(len(str(row[alias])), length)
+            else:
+                length = max(len(str(row[idx])), length)
+        if len(data) > COLUMN_LENGTH_SAMPLE_SIZE:
+            # not all values were checked
+            length = max(length, 0xFFFF)
+        return length
+
+    def get_table_header_packets(self, columns, data, status=0):
         # TODO remove columns order
         packets = [self.packet(ColumnCountPacket, count=len(columns))]
         packets.extend(self._get_column_defenition_packets(columns, data))
 
         if self.client_capabilities.DEPRECATE_EOF is False:
             packets.append(self.packet(EofPacket, status=status))
+        return packets
 
+    def get_tabel_packets(self, columns, data, status=0):
+        packets = self.get_table_header_packets(columns, data, status=status)
         packets += [self.packet(ResultsetRowPacket, data=x) for x in data]
         return packets
 
@@ -579,12 +621,24 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
         executor.stmt_execute(parameters)
 
+        if prepared_stmt.get("cursor") is not None:
+            prepared_stmt["cursor"].close()
+            prepared_stmt["cursor"] = None
+
         if executor.data is None:
             resp = SQLAnswer(
                 resp_type=RESPONSE_TYPE.OK, state_track=executor.state_track
             )
             return self.send_query_answer(resp)
 
+        # rest of the result is read from integration when client requests it
+        cursor = ResultCursor(executor.data, executor.stream)
+        if executor.stream is not None:
+            # stream can be read only once: query will be executed again at the next call
+            executor.stream = None
+            executor.is_executed = False
+        prepared_stmt["fetched"] = 0
+
         # TODO prepared_stmt['type'] == 'lock' is not used but it works
         columns_def = self.to_mysql_columns(executor.columns)
         packages = [self.packet(ColumnCountPacket, count=len(columns_def))]
@@ -593,40 +647,46 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
 
         if self.client_capabilities.DEPRECATE_EOF is False:
             packages.append(self.packet(EofPacket, status=0x0062))
-        else:
-            # send all
-            for row in executor.data:
-                packages.append(
-                    self.packet(BinaryResultsetRowPacket, data=row, columns=columns_def)
-                )
-
-            server_status = executor.server_status or 0x0002
-            packages.append(self.last_packet(status=server_status))
-            prepared_stmt["fetched"] += len(executor.data)
-
-        return self.send_package_group(packages)
+            prepared_stmt["cursor"] = cursor
+            return self.send_package_group(packages)
+
+        # send all
+        writer = self.get_packet_writer()
+        writer.write_packets(packages)
+        for row in cursor:
+            writer.write_packets([
+                self.packet(BinaryResultsetRowPacket, data=row, columns=columns_def)
+            ])
+            prepared_stmt["fetched"] += 1
+
+        server_status = executor.server_status or 0x0002
+        writer.write_packets([self.last_packet(status=server_status)])
+        writer.flush()
 
     def answer_stmt_fetch(self, stmt_id, limit):
         prepared_stmt = self.session.prepared_stmts[stmt_id]
         executor = prepared_stmt["statement"]
-        fetched = prepared_stmt["fetched"]
+        cursor = prepared_stmt.get("cursor")
 
-        if executor.data is None:
+        if executor.data is None or cursor is None:
             resp = SQLAnswer(
                 resp_type=RESPONSE_TYPE.OK, state_track=executor.state_track
             )
             return self.send_query_answer(resp)
 
-        packages = []
         columns = self.to_mysql_columns(executor.columns)
-        for row in executor.data[fetched:limit]:
-            packages.append(
+        rows = cursor.fetch(limit)
+        writer = self.get_packet_writer()
+        for row in rows:
+            writer.write_packets([
                 self.packet(BinaryResultsetRowPacket, data=row, columns=columns)
-            )
+            ])
 
-        prepared_stmt["fetched"] += len(executor.data[fetched:limit])
+        prepared_stmt["fetched"] += len(rows)
 
-        if len(executor.data) <= limit + fetched:
+        if not cursor.has_more():
+            cursor.close()
+            prepared_stmt["cursor"] = None
             status = sum(
                 [
                     SERVER_STATUS.SERVER_STATUS_AUTOCOMMIT,
@@ -641,8 +701,8 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 ]
             )
 
-        packages.append(self.last_packet(status=status))
-        self.send_package_group(packages)
+        writer.write_packets([self.last_packet(status=status)])
+        writer.flush()
 
     def handle(self):
         """
@@ -826,6 +886,18 @@ class MysqlProxy(SocketServer.BaseRequestHandler):
                 traceback=error_traceback,
             )
 
+            # connections are kept while result of prepared statement is read from integration
+            if not self.has_open_streams():
+                self.session.integration_controller.handlers_cache.checkin()
+
+    def has_open_streams(self) -> bool:
+        """ Result of some prepared statement is not fetched to the end and is still read from integration
+        """
+        return any(
+            stmt.get("cursor") is not None and stmt["cursor"].is_streaming()
+            for stmt in self.session.prepared_stmts.values()
+        )
+
     def packet(self, packetClass=Packet, **kwargs):
         """
         Factory method for packets
@@ -1,3 +1,4 @@
+import copy
 from typing import Union
 
 from mindsdb_sql import parse_sql
@@ -34,6 +35,19 @@ class Executor:
 
         self.command_executor = ExecuteCommands(self.session)
 
+    def copy(self) -> 'Executor':
+        """ New executor of the prepared statement: parsed query, params and columns are reused,
+            execution state is not copied
+        """
+        executor = Executor(session=self.session, proxy_server=self.server, charset=self.charset)
+        executor.sql = self.sql
+        executor.sql_lower = self.sql_lower
+        # query is modified by filling of the params
+        executor.query = copy.deepcopy(self.query)
+        executor.params = list(self.params)
+        executor.columns = list(self.columns)
+        return executor
+
     def parse(self, sql: Union[str, bytes]):
         self.logger.info("%s.parse: sql - %s", self.__class__.__name__, sql)
         if type(sql) == bytes:
@@ -32,3 +32,20 @@ class POSTGRES_TYPES(Enum):
     DOUBLE = 3
     DATETIME = 4
     DATE = 5
+
+
+class POSTGRES_FORMAT:
+    TEXT = 0
+    BINARY = 1
+
+
+# object ids of postgres types for columns which are sent in binary format
+# https://github.com/postgres/postgres/blob/master/src/include/catalog/pg_type.dat
+POSTGRES_BINARY_OIDS = {
+    POSTGRES_TYPES.VARCHAR: 25,  # text
+    POSTGRES_TYPES.INT: 20,  # int8
+    POSTGRES_TYPES.LONG: 20,  # int8
+    POSTGRES_TYPES.DOUBLE: 701,  # float8
+    POSTGRES_TYPES.DATETIME: 1114,  # timestamp
+    POSTGRES_TYPES.DATE: 1082,  # date
+}
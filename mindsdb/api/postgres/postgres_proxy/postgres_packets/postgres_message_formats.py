@@ -1,4 +1,5 @@
-from typing import BinaryIO, Sequence, Dict, Type
+import struct
+from typing import BinaryIO, Sequence, Dict, Type, Optional
 
 from mindsdb.api.mysql.mysql_proxy.classes.sql_statement_parser import SqlStatementParser
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import PostgresField
@@ -10,6 +11,11 @@ from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_packets impor
 from mindsdb.api.postgres.postgres_proxy.utilities import strip_null_byte
 
 
+_pack_int16 = struct.Struct('!h').pack
+_pack_int32 = struct.Struct('!i').pack
+_NULL_LENGTH = _pack_int32(-1)
+
+
 # All docstrings for Messages are taken from
 # https://www.postgresql.org/docs/current/protocol-message-formats.html as of 2023-2-8 for Postgresql 15
 
@@ -389,10 +395,13 @@ class DataRow(PostgresMessage):
     Byten
     The value of the column, in the format indicated by the associated format code. n is the above length. """  # noqa
 
-    rows: Sequence[Sequence[bytes]]
+    rows: Sequence[Sequence[Optional[bytes]]]
     num_cols: int
 
-    def __init__(self, rows: Sequence[Sequence[bytes]]):
+    # size of buffer with encoded rows which is written to the file at once
+    flush_size = 256 * 1024
+
+    def __init__(self, rows: Sequence[Sequence[Optional[bytes]]]):
         self.identifier = PostgresBackendMessageIdentifier.DATA_ROW
         self.backend_capable = True
         self.frontend_capable = False
@@ -404,11 +413,30 @@ class DataRow(PostgresMessage):
         super().__init__()
 
     def send_internal(self, write_file: BinaryIO):
+        # messages are packed directly to the buffer, None is NULL value
+        identifier = self.identifier.value
+        num_cols = _pack_int16(self.num_cols)
+        buffer = bytearray()
         for row in self.rows:
-            self.get_packet_builder() \
-                .add_int16(self.num_cols) \
-                .add_row(row) \
-                .write(write_file=write_file)
+            length = 6
+            values = []
+            for val in row:
+                if val is None:
+                    values.append(_NULL_LENGTH)
+                    length += 4
+                else:
+                    values.append(_pack_int32(len(val)))
+                    values.append(val)
+                    length += 4 + len(val)
+            buffer += identifier
+            buffer += _pack_int32(length)
+            buffer += num_cols
+            buffer += b''.join(values)
+            if len(buffer) >= self.flush_size:
+                write_file.write(buffer)
+                buffer.clear()
+        if len(buffer) > 0:
+            write_file.write(buffer)
 
 
 class NegotiateProtocolVersion(PostgresMessage):
@@ -702,6 +730,20 @@ class Sync(BaseFrontendMessage):
         super().__init__()
 
 
+class Flush(BaseFrontendMessage):
+    """
+    Flush (F)
+    Byte1('H')
+    Identifies the message as a Flush command.
+
+    Int32(4)
+    Length of message contents in bytes, including self. """
+
+    def __init__(self):
+        self.identifier = PostgresFrontendMessageIdentifier.FLUSH
+        super().__init__()
+
+
 class Describe(BaseFrontendMessage):
     """
     Describe (F)
@@ -737,7 +779,7 @@ IMPLEMENTED_BACKEND_POSTGRES_MESSAGE_CLASSES = [
     ParameterDescription
 ]
 IMPLEMENTED_FRONTEND_POSTGRES_MESSAGE_CLASSES = [
-    Query, Terminate, Parse, Bind, Execute, Sync, Describe
+    Query, Terminate, Parse, Bind, Execute, Sync, Flush, Describe
 ]
 FE_MESSAGE_MAP: Dict[PostgresFrontendMessageIdentifier, Type[PostgresMessage]] = {
     PostgresFrontendMessageIdentifier.QUERY: Query,
@@ -746,6 +788,7 @@ FE_MESSAGE_MAP: Dict[PostgresFrontendMessageIdentifier, Type[PostgresMessage]] =
     PostgresFrontendMessageIdentifier.BIND: Bind,
     PostgresFrontendMessageIdentifier.EXECUTE: Execute,
     PostgresFrontendMessageIdentifier.SYNC: Sync,
+    PostgresFrontendMessageIdentifier.FLUSH: Flush,
     PostgresFrontendMessageIdentifier.DESCRIBE: Describe
 }
 SUPPORTED_AUTH_TYPES = [PostgresAuthType.PASSWORD]
@@ -24,6 +24,7 @@ class PostgresFrontendMessageIdentifier(Enum):
     PARSE = b'P'
     BIND = b'B'
     SYNC = b'S'
+    FLUSH = b'H'
     DESCRIBE = b'D'
 
 
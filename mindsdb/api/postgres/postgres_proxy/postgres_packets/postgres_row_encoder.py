@@ -0,0 +1,236 @@
+"""
+Encoding of result rows to the values of DataRow messages.
+
+Rows are encoded by columns: for every column one converter is chosen using types of its values
+(or postgres type of the column for binary format) and the whole column is converted at once.
+"""
+import codecs
+import datetime as dt
+import json
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES, POSTGRES_FORMAT
+
+# days and microseconds between unix and postgres epochs (2000-01-01)
+POSTGRES_EPOCH_DAYS = 10957
+POSTGRES_EPOCH_US = POSTGRES_EPOCH_DAYS * 86400 * 1000000
+POSTGRES_EPOCH = dt.datetime(2000, 1, 1)
+_MICROSECOND = dt.timedelta(microseconds=1)
+
+# encodings in which '\x00' is encoded to zero byte and zero byte is not a part of other characters
+_NULL_SAFE_ENCODINGS = ('utf-8', 'ascii', 'latin-1', 'iso8859-1', 'cp1252')
+
+# values of these types are converted to postgres text format with str()
+_STR_TYPES = (int, float, np.number, Decimal, dt.date, dt.time)
+_BOOL_TYPES = (bool, np.bool_)
+
+NoneType = type(None)
+NaTType = type(pd.NaT)
+_NULL_TYPES = {NoneType, NaTType}
+# NaN of float values is sent as NULL
+_FLOAT_TYPES = (float, np.floating)
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or value is pd.NaT or (isinstance(value, _FLOAT_TYPES) and value != value)
+
+
+def get_format_codes(result_format_codes: Sequence[int], count: int) -> List[int]:
+    """ Format code of every column using result format codes of Bind message:
+        empty list - all columns are text, one code - it is used for all columns
+
+    Args:
+        result_format_codes (Sequence[int]): format codes from Bind message
+        count (int): count of columns
+
+    Returns:
+        List[int]: format codes
+    """
+    if not result_format_codes:
+        return [POSTGRES_FORMAT.TEXT] * count
+    if len(result_format_codes) == 1:
+        return list(result_format_codes) * count
+    return list(result_format_codes)
+
+
+def to_text(value: Any) -> str:
+    """ Postgres text representation of single value
+    """
+    if isinstance(value, _BOOL_TYPES):
+        return 'true' if value else 'false'
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def encode_strings(strings: List[str], charset: str) -> List[bytes]:
+    """ Encode list of strings using one call of encode
+    """
+    if len(strings) == 0:
+        return []
+    joined = '\x00'.join(strings)
+    if (
+        codecs.lookup(charset).name not in _NULL_SAFE_ENCODINGS
+        or joined.count('\x00') != len(strings) - 1
+    ):
+        # separator can't be used
+        return [string.encode(charset) for string in strings]
+    return joined.encode(charset).split(b'\x00')
+
+
+def _text_column(values: Sequence[Any], types: set) -> Sequence[str]:
+    if types == {str}:
+        return values
+    if all(issubclass(value_type, _STR_TYPES) and not issubclass(value_type, _BOOL_TYPES) for value_type in types):
+        return list(map(str, values))
+    return list(map(to_text, values))
+
+
+def _encode_text_column(values: Sequence[Any], charset: str) -> List[Optional[bytes]]:
+    types = set(map(type, values))
+    if types.isdisjoint(_NULL_TYPES) and not any(issubclass(value_type, _FLOAT_TYPES) for value_type in types):
+        return encode_strings(_text_column(values, types), charset)
+
+    nulls = list(map(_is_null, values))
+    if not any(nulls):
+        return encode_strings(_text_column(values, types), charset)
+
+    types -= _NULL_TYPES
+    not_nulls = [value for value, is_null in zip(values, nulls) if not is_null]
+    encoded = iter(encode_strings(_text_column(not_nulls, types), charset))
+    return [None if is_null else next(encoded) for is_null in nulls]
+
+
+def _split_fixed_size(data: np.ndarray) -> List[bytes]:
+    buffer = data.tobytes()
+    size = data.itemsize
+    return [buffer[i:i + size] for i in range(0, len(buffer), size)]
+
+
+def _binary_column(values: Sequence[Any], column_type: POSTGRES_TYPES, charset: str) -> List[Optional[bytes]]:
+    if column_type in (POSTGRES_TYPES.DATETIME, POSTGRES_TYPES.DATE):
+        data = _binary_dates(values, column_type)
+        if data is not None:
+            return data
+
+    elif column_type in (POSTGRES_TYPES.INT, POSTGRES_TYPES.LONG, POSTGRES_TYPES.DOUBLE):
+        types = set(map(type, values))
+        if all(issubclass(value_type, (int, float, np.number)) for value_type in types):
+            data = np.array(values)
+            if not pd.isna(data).any():
+                # numbers without nulls
+                dtype = '>f8' if column_type == POSTGRES_TYPES.DOUBLE else '>i8'
+                return _split_fixed_size(data.astype(dtype))
+
+    series = pd.Series(values, dtype=object)
+    if column_type in (POSTGRES_TYPES.INT, POSTGRES_TYPES.LONG):
+        numbers = pd.to_numeric(series, errors='coerce')
+        nulls = numbers.isna().to_numpy()
+        data = numbers.fillna(0).to_numpy().astype('>i8')
+    elif column_type == POSTGRES_TYPES.DOUBLE:
+        numbers = pd.to_numeric(series, errors='coerce')
+        nulls = series.isna().to_numpy()
+        data = numbers.to_numpy(dtype=np.float64).astype('>f8')
+    elif column_type in (POSTGRES_TYPES.DATETIME, POSTGRES_TYPES.DATE):
+        timestamps = pd.to_datetime(series, errors='coerce', utc=True).dt.tz_localize(None)
+        nulls = timestamps.isna().to_numpy()
+        if column_type == POSTGRES_TYPES.DATE:
+            days = timestamps.to_numpy(dtype='datetime64[D]').astype(np.int64)
+            data = (days - POSTGRES_EPOCH_DAYS).astype('>i4')
+        else:
+            microseconds = timestamps.to_numpy(dtype='datetime64[us]').astype(np.int64)
+            data = (microseconds - POSTGRES_EPOCH_US).astype('>i8')
+    else:
+        # binary format of text types is the same as text format
+        return _encode_text_column(values, charset)
+
+    result = _split_fixed_size(data)
+    for i in np.flatnonzero(nulls):
+        result[i] = None
+    return result
+
+
+def _binary_dates(values: Sequence[Any], column_type: POSTGRES_TYPES) -> Optional[List[Optional[bytes]]]:
+    # python dates are converted without pandas: it is much faster than parsing of object column
+    types = set(map(type, values))
+    types -= _NULL_TYPES
+    if not all(issubclass(value_type, dt.date) for value_type in types):
+        return None
+
+    try:
+        if column_type == POSTGRES_TYPES.DATE:
+            epoch = POSTGRES_EPOCH.toordinal()
+            numbers = [None if _is_null(value) else value.toordinal() - epoch for value in values]
+            dtype = '>i4'
+        else:
+            numbers = [
+                None if _is_null(value) else (value - POSTGRES_EPOCH) // _MICROSECOND
+                for value in values
+            ]
+            dtype = '>i8'
+    except TypeError:
+        # dates or timezone-aware datetimes
+        return None
+
+    not_nulls = iter(_split_fixed_size(np.array([number for number in numbers if number is not None], dtype=dtype)))
+    return [None if number is None else next(not_nulls) for number in numbers]
+
+
+def encode_column(
+    values: Sequence[Any],
+    column_type: POSTGRES_TYPES = POSTGRES_TYPES.VARCHAR,
+    format_code: int = POSTGRES_FORMAT.TEXT,
+    charset: str = 'utf8'
+) -> List[Optional[bytes]]:
+    """ Convert values of column to DataRow values
+
+    Args:
+        values (Sequence[Any]): values of the column
+        column_type (POSTGRES_TYPES): type of the column, is used for binary format
+        format_code (int): text or binary
+        charset (str): encoding of text values
+
+    Returns:
+        List[Optional[bytes]]: encoded values, None is NULL
+    """
+    if format_code == POSTGRES_FORMAT.BINARY:
+        return _binary_column(values, column_type, charset)
+    return _encode_text_column(values, charset)
+
+
+def encode_rows(
+    rows: Sequence[Sequence[Any]],
+    columns: Optional[Sequence[Dict[str, Any]]] = None,
+    format_codes: Optional[Sequence[int]] = None,
+    charset: str = 'utf8'
+) -> List[Sequence[Optional[bytes]]]:
+    """ Convert rows of result to DataRow values
+
+    Args:
+        rows (Sequence[Sequence[Any]]): rows of result
+        columns (Sequence[Dict[str, Any]]): columns of result with postgres types
+        format_codes (Sequence[int]): result format codes from Bind message
+        charset (str): encoding of text values
+
+    Returns:
+        List[Sequence[Optional[bytes]]]: rows with encoded values
+    """
+    if len(rows) == 0:
+        return []
+
+    values_by_column = list(zip(*rows))
+    count = len(values_by_column)
+    formats = get_format_codes(format_codes, count)
+    types = [column['type'] for column in columns] if columns is not None else [POSTGRES_TYPES.VARCHAR] * count
+
+    encoded_columns = [
+        encode_column(values, column_type, format_code, charset)
+        for values, column_type, format_code in zip(values_by_column, types, formats)
+    ]
+    return list(zip(*encoded_columns))
@@ -1,14 +1,17 @@
 import base64
-import datetime
+import io
 import os
-import json
 import select
 import socketserver
 import struct
 import sys
+import time
 from functools import partial
 import socket
-from typing import Callable, Dict, Type, Any, Iterable, Sequence
+from collections import OrderedDict
+from typing import Callable, Dict, Type, Any, Iterable, Sequence, Optional
+
+from mindsdb_sql.parser.ast import Select, Union
 
 from mindsdb.api.executor.controllers import SessionController
 from mindsdb.api.postgres.postgres_proxy.executor import Executor
@@ -17,11 +20,13 @@ from mindsdb.api.executor.data_types.response_type import RESPONSE_TYPE
 from mindsdb.api.common.check_auth import check_auth
 from mindsdb.api.mysql.mysql_proxy.mysql_proxy import SQLAnswer
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.errors import POSTGRES_SYNTAX_ERROR_CODE
-from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import GenericField, PostgresField
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import GenericField, PostgresField, \
+    POSTGRES_TYPES, POSTGRES_FORMAT, POSTGRES_BINARY_OIDS
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_row_encoder import encode_rows, get_format_codes
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import Terminate, \
     Query, AuthenticationClearTextPassword, AuthenticationOk, RowDescriptions, DataRow, CommandComplete, \
     ReadyForQuery, ConnectionFailure, ParameterStatus, Error, Execute, Bind, Parse, Sync, ParseComplete, \
-    InvalidSQLStatementName, BindComplete, Describe, DataException, ParameterDescription
+    InvalidSQLStatementName, BindComplete, Describe, DataException, ParameterDescription, Flush
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message import PostgresMessage
 from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_packets import PostgresPacketReader, \
     PostgresPacketBuilder
@@ -32,6 +37,10 @@ from mindsdb.utilities import log
 from mindsdb.api.mysql.mysql_proxy.external_libs.mysql_scramble import scramble as scramble_func
 
 
+# size of buffered outgoing messages which is written without waiting of Sync/Flush
+OUTPUT_FLUSH_SIZE = 256 * 1024
+
+
 class PostgresProxyHandler(socketserver.StreamRequestHandler):
     client_buffer: PostgresPacketReader
     user_parameters: Dict[bytes, bytes]
@@ -49,6 +58,14 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.named_portals = {}
         self.unnamed_portal = None
         self.transaction_status = b'I'  # I: Idle, T: Transaction Block, E: Failed Transaction Block
+        # parsed statements by (database, sql), they are reused by next Parse with the same sql.
+        # Values are (executor, expiration time): schema can be changed by other connections
+        self.statements_cache = OrderedDict()
+        postgres_config = Config().get('api', {}).get('postgres', {})
+        self.statements_cache_size = postgres_config.get('statements_cache_size', 100)
+        self.statements_cache_ttl = postgres_config.get('statements_cache_ttl', 10)
+        # outgoing messages are buffered until Sync/Flush (if it is not None)
+        self.output_buffer = None
         super().__init__(request, client_address, server)
 
     def handle(self) -> None:
@@ -68,7 +85,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             Bind: self.bind,
             Execute: self.execute,
             Describe: self.describe,
-            Sync: self.sync
+            Sync: self.sync,
+            Flush: self.flush
         }
         self.client_buffer = PostgresPacketReader(self.rfile)
         if self.is_cloud:
@@ -140,16 +158,39 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             'is_cloud': False
         }
 
+    def get_prepared_executor(self, sql) -> Executor:
+        """ Executor of the prepared statement. Parsed and planned statements are cached by sql text
+            for statements_cache_ttl seconds, copy of the cached statement is returned
+        """
+        key = (self.session.database, sql)
+        executor, expires_at = self.statements_cache.get(key, (None, None))
+        if executor is not None and expires_at < time.monotonic():
+            del self.statements_cache[key]
+            executor = None
+        if executor is not None:
+            self.statements_cache.move_to_end(key)
+        else:
+            executor = Executor(
+                session=self.session,
+                proxy_server=self,
+                charset=self.charset
+            )
+            executor.stmt_prepare(sql=sql)
+            self.statements_cache[key] = (executor, time.monotonic() + self.statements_cache_ttl)
+            while len(self.statements_cache) > self.statements_cache_size:
+                self.statements_cache.popitem(last=False)
+        return executor.copy()
+
+    def invalidate_statements_cache(self, executor):
+        # columns of prepared statements can be changed after not select query
+        if not isinstance(executor.query, (Select, Union)):
+            self.statements_cache.clear()
+
     def parse(self, message: Parse):
         self.logger.info("Postgres_Proxy: Parsing")
-        executor = Executor(
-            session=self.session,
-            proxy_server=self,
-            charset=self.charset
-        )
         # TODO: Remove comment if unneeded ot use session since we're storing in this proxy class per session anyway
         # stmt_id = self.session.register_stmt(executor)
-        executor.stmt_prepare(sql=message.query)
+        executor = self.get_prepared_executor(message.query)
         statement = {"executor": executor, "parse": message}
         if message.name:
             self.named_statements[message.name] = statement
@@ -170,6 +211,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
 
         # TODO Should check validity of statement here and not at parse stage
         portal = statement.copy()
+        # every portal is executed separately
+        portal["executor"] = statement["executor"].copy()
         portal["bind"] = message
         if message.name:
             self.named_portals[message.name] = portal
@@ -201,7 +244,11 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             self.send(DataException(message="Describe did not have correct type. Can be 'P' or 'S'"))
             return True
 
-        fields = self.to_postgres_fields(describing["executor"].columns)
+        executor = describing["executor"]
+        format_codes = None
+        if message.describe_type == b'P':
+            format_codes = describing["bind"].result_format_codes
+        fields = self.to_postgres_fields(executor.to_postgres_columns(executor.columns), format_codes)
         self.send(RowDescriptions(fields=fields))
         return True
 
@@ -217,8 +264,14 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         executor = portal["executor"]
         params = portal["bind"].parameters
         executor.stmt_execute(param_values=params)
+        self.invalidate_statements_cache(executor)
         sql_answer = self.return_executor_data(executor)
-        self.respond_from_sql_answer(sql=executor.sql, sql_answer=sql_answer, row_descs=False)
+        self.respond_from_sql_answer(
+            sql=executor.sql,
+            sql_answer=sql_answer,
+            row_descs=False,
+            format_codes=portal["bind"].result_format_codes
+        )
         return True
 
     def sync(self, message: Sync):
@@ -227,6 +280,11 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send_ready()
         return True
 
+    def flush(self, message: Flush):
+        self.logger.info("Postgres_Proxy: Flushing")
+        self.flush_output()
+        return True
+
     def init_session(self):
         self.logger.info('New connection [{ip}:{port}]'.format(
             ip=self.client_address[0], port=self.client_address[1]))
@@ -265,6 +323,7 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
                 error_message=str(e).encode(self.get_encoding()),
                 error_code=POSTGRES_SYNTAX_ERROR_CODE.encode(self.get_encoding())
             )
+        self.invalidate_statements_cache(executor)
         return self.return_executor_data(executor)
 
     def return_executor_data(self, executor):
@@ -291,7 +350,21 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
 
     def send(self, message: PostgresMessage):
         self.logger.debug("Sending message of type %s" % message.__class__.__name__)
-        message.send(self.wfile)
+        if self.output_buffer is None:
+            message.send(self.wfile)
+            return
+        message.send(self.output_buffer)
+        if self.output_buffer.tell() >= OUTPUT_FLUSH_SIZE:
+            self.flush_output()
+
+    def flush_output(self):
+        # write buffered messages with one call
+        if self.output_buffer is None or self.output_buffer.tell() == 0:
+            return
+        with self.output_buffer.getbuffer() as data:
+            self.wfile.write(data)
+        self.output_buffer.seek(0)
+        self.output_buffer.truncate()
 
     def handshake(self):
         self.client_buffer.read_verify_ssl_request()
@@ -351,9 +424,9 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
             sql: str = sql.decode(encoding)
         return strip_null_byte(sql).strip(';')
 
-    def return_table(self, sql_answer: SQLAnswer, row_descs=True):
-        fields = self.to_postgres_fields(sql_answer.columns)
-        rows = self.to_postgres_rows(sql_answer.data)
+    def return_table(self, sql_answer: SQLAnswer, row_descs=True, format_codes: Sequence[int] = None):
+        fields = self.to_postgres_fields(sql_answer.columns, format_codes)
+        rows = self.to_postgres_rows(sql_answer.data, sql_answer.columns, format_codes)
         if row_descs:
             self.send(RowDescriptions(fields=fields))
         self.send(DataRow(rows=rows))
@@ -374,7 +447,8 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         self.send_ready()
         return True
 
-    def respond_from_sql_answer(self, sql, sql_answer: SQLAnswer, row_descs=True) -> bool:
+    def respond_from_sql_answer(self, sql, sql_answer: SQLAnswer, row_descs=True,
+                                format_codes: Sequence[int] = None) -> bool:
         # TODO Add command complete passthrough for Complex Queries that exceed row limit in one go
         rows = 0
         if sql_answer.data:
@@ -382,50 +456,34 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
         if RESPONSE_TYPE.OK == sql_answer.type:
             return self.return_ok(sql, rows=rows)
         elif RESPONSE_TYPE.TABLE == sql_answer.type:
-            return self.return_table(sql_answer, row_descs=row_descs)
+            return self.return_table(sql_answer, row_descs=row_descs, format_codes=format_codes)
         elif RESPONSE_TYPE.ERROR == sql_answer.type:
             return self.return_error(sql_answer)
 
     @staticmethod
-    def to_postgres_fields(columns: Iterable[Dict[str, Any]]) -> Sequence[PostgresField]:
+    def to_postgres_fields(columns: Iterable[Dict[str, Any]],
+                           format_codes: Sequence[int] = None) -> Sequence[PostgresField]:
+        columns = list(columns)
+        formats = get_format_codes(format_codes, len(columns))
         fields = []
         i = 0
-        for column in columns:
-            fields.append(GenericField(
+        for column, format_code in zip(columns, formats):
+            field = GenericField(
                 name=column['name'],
                 object_id=column['type'].value,
                 column_id=i
-            ))
+            )
+            if format_code == POSTGRES_FORMAT.BINARY:
+                # client has to know the real type to decode binary value
+                field.format_code = format_code
+                field.object_id = POSTGRES_BINARY_OIDS.get(column['type'], POSTGRES_BINARY_OIDS[POSTGRES_TYPES.VARCHAR])
+            fields.append(field)
             i += 1
         return fields
 
-    def to_postgres_rows(self, rows: Iterable[Iterable[Any]]) -> Sequence[Sequence[bytes]]:
-        p_rows = []
-        for row in rows:
-            p_row = []
-            for column in row:
-                if column is None:
-                    column = ""
-                elif type(column) == int or type(column) == float:
-                    column = str(column)
-                elif type(column) == list or type(column) == dict:
-                    column = json.dumps(column)
-                if isinstance(column, datetime.date) or isinstance(column, datetime.datetime):
-                    try:
-                        column = datetime.datetime.strftime(column, '%Y-%m-%d')
-                    except ValueError:
-                        try:
-                            column = datetime.datetime.strftime(column, '%Y-%m-%dT%H:%M:%S')
-                        except ValueError:
-                            column = datetime.datetime.strptime(column, '%Y-%m-%dT%H:%M:%S.%f')
-                if isinstance(column, bool):
-                    if column:
-                        column = "true"
-                    else:
-                        column = "false"
-                p_row.append(column.encode(encoding=self.charset))
-            p_rows.append(p_row)
-        return p_rows
+    def to_postgres_rows(self, rows: Sequence[Sequence[Any]], columns: Sequence[Dict[str, Any]] = None,
+                         format_codes: Sequence[int] = None) -> Sequence[Sequence[Optional[bytes]]]:
+        return encode_rows(rows, columns=columns, format_codes=format_codes, charset=self.charset)
 
     def send_initial_data(self):
         server_encoding = self.charset.encode(self.charset)
@@ -444,20 +502,28 @@ class PostgresProxyHandler(socketserver.StreamRequestHandler):
     def send_ready(self):
         self.logger.debug("Ready for Query")
         self.send(ReadyForQuery(transaction_status=self.transaction_status))
+        self.flush_output()
+        # query is done, connections can be used by other clients
+        self.session.integration_controller.handlers_cache.checkin()
 
     def main_loop(self):
-        self.send_ready()
-        while True:
-            message: PostgresMessage = self.client_buffer.read_message()
-            if message is None:  # Empty Data, Buffer done
-                break
-            tof = type(message)
-            if tof in self.message_map:
-                res = self.message_map[tof](message)
-                if not res:
+        self.output_buffer = io.BytesIO()
+        try:
+            self.send_ready()
+            while True:
+                message: PostgresMessage = self.client_buffer.read_message()
+                if message is None:  # Empty Data, Buffer done
                     break
-            else:
-                self.logger.warning("Ignoring unsupported message type %s" % tof)
+                tof = type(message)
+                if tof in self.message_map:
+                    res = self.message_map[tof](message)
+                    if not res:
+                        break
+                else:
+                    self.logger.warning("Ignoring unsupported message type %s" % tof)
+        finally:
+            self.flush_output()
+            self.output_buffer = None
 
     @staticmethod
     def startProxy():
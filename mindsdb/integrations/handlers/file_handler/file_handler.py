@@ -17,7 +17,7 @@ from mindsdb_sql.parser.ast import DropTables, Select
 from mindsdb_sql.parser.ast.base import ASTNode
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
-from mindsdb.api.executor.utilities.sql import query_df
+from mindsdb.api.executor.utilities.sql import query_df, query_parquet
 from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.libs.response import RESPONSE_TYPE
 from mindsdb.integrations.libs.response import HandlerResponse as Response
@@ -91,6 +91,11 @@ class FileHandler(DatabaseHandler):
             return Response(RESPONSE_TYPE.OK)
         elif type(query) is Select:
             table_name = query.from_table.parts[-1]
+            columnar_path = self._get_columnar_path(table_name)
+            if columnar_path is not None:
+                result_df = query_parquet(columnar_path, query)
+                return Response(RESPONSE_TYPE.TABLE, data_frame=result_df)
+
             file_path = self.file_controller.get_file_path(table_name)
             df, _columns = self._handle_source(
                 file_path,
@@ -107,6 +112,18 @@ class FileHandler(DatabaseHandler):
                 error_message="Only 'select' and 'drop' queries allowed for files",
             )
 
+    def _get_columnar_path(self, table_name):
+        """
+        Path to typed copy of the file which was made during upload.
+        Copy is parsed with default options, so it can't be used with custom parsing
+        """
+        if self.custom_parser is not None or self.clean_rows is not True:
+            return None
+        get_columnar_path = getattr(self.file_controller, "get_file_columnar_path", None)
+        if get_columnar_path is None:
+            return None
+        return get_columnar_path(table_name)
+
     def native_query(self, query: str) -> Response:
         ast = self.parser(query, dialect="mindsdb")
         return self.query(ast)
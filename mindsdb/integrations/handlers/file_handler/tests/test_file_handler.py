@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pandas
 import pytest
 import responses
+from mindsdb_sql import parse_sql
 from mindsdb_sql.exceptions import ParsingException
 from mindsdb_sql.parser.ast import CreateTable, DropTables, Identifier, Select, Star
 from pytest_lazyfixture import lazy_fixture
@@ -168,9 +169,9 @@ class TestQuery:
 
         assert response.type == RESPONSE_TYPE.ERROR
 
-    def test_query_select(self, csv_file):
-        """Test a valid select query"""
-        expected_df = pandas.read_csv(csv_file)
+    @pytest.fixture
+    def file_controller(self, csv_file):
+        """File controller with saved csv file"""
 
         # This is temporary because the file controller currently absconds with our file when we save it:
         # https://github.com/mindsdb/mindsdb/issues/8141
@@ -210,6 +211,11 @@ class TestQuery:
         file_controller.save_file(
             os.path.splitext(os.path.basename(csv_file))[0], csv_tmp
         )
+        return file_controller
+
+    def test_query_select(self, csv_file, file_controller):
+        """Test a valid select query"""
+        expected_df = pandas.read_csv(csv_file)
 
         file_handler = FileHandler(file_controller=file_controller)
         response = file_handler.query(
@@ -226,6 +232,28 @@ class TestQuery:
         assert response.error_message is None
         assert expected_df.equals(response.data_frame)
 
+    def test_query_select_columnar(self, csv_file, file_controller):
+        """Test that select reads typed copy of the file instead of parsing the source file"""
+        table_name = os.path.splitext(os.path.basename(csv_file))[0]
+        assert file_controller.get_file_columnar_path(table_name) is not None
+
+        file_handler = FileHandler(file_controller=file_controller)
+        query = parse_sql(
+            f"select col_four from {table_name} where col_one > 1 order by col_one",
+            dialect="mindsdb",
+        )
+        with patch.object(FileHandler, "_handle_source", side_effect=Exception("parsing of source file")):
+            response = file_handler.query(query)
+
+        assert response.type == RESPONSE_TYPE.TABLE
+        assert list(response.data_frame.columns) == ["col_four"]
+        assert list(response.data_frame["col_four"]) == ["B", "C"]
+
+        # custom parsing options: source file is used
+        file_handler = FileHandler(file_controller=file_controller, connection_data={"clean_rows": False})
+        response = file_handler.query(query)
+        assert list(response.data_frame["col_four"]) == ["B", "C"]
+
     def test_query_bad_type(self):
         """Test an invalid query type for files"""
         file_handler = FileHandler(file_controller=MockFileController())
@@ -86,7 +86,7 @@ class HuggingFaceHandler(BaseMLEngine):
                 input_keys.remove(key)
 
         # optional keys
-        for key in ["labels", "max_length", "truncation_policy"]:
+        for key in ["labels", "max_length", "truncation_policy", "batch_size"]:
             if key in input_keys:
                 input_keys.remove(key)
 
@@ -156,95 +156,170 @@ class HuggingFaceHandler(BaseMLEngine):
 
         ###### store and persist in model folder
         self.model_storage.json_set("args", args)
+        self._warm_pipeline = None
 
         ###### persist changes to handler folder
         self.engine_storage.folder_sync(model_name)
 
     # todo move infer tasks to a seperate file
-    def predict_text_classification(self, pipeline, item, args):
+    def predict_text_classification(self, pipeline, items, args, batch_size):
         top_k = args.get("top_k", 1000)
 
-        result = pipeline(
-            [item], top_k=top_k, truncation=True, max_length=args["max_length"]
-        )[0]
-
-        final = {}
-        explain = {}
-        if type(result) == dict:
-            result = [result]
-        final[args["target"]] = args["labels_map"][result[0]["label"]]
-        for elem in result:
-            if args["labels_map"]:
-                explain[args["labels_map"][elem["label"]]] = elem["score"]
-            else:
-                explain[elem["label"]] = elem["score"]
-        final[f"{args['target']}_explain"] = explain
-        return final
-
-    def predict_text_generation(self, pipeline, item, args):
-        result = pipeline([item], max_length=args["max_length"])[0]
-
-        final = {}
-        final[args["target"]] = result["generated_text"]
-
-        return final
-
-    def predict_zero_shot(self, pipeline, item, args):
+        results = pipeline(
+            items, top_k=top_k, truncation=True, max_length=args["max_length"], batch_size=batch_size
+        )
+
+        finals = []
+        for result in results:
+            final = {}
+            explain = {}
+            if type(result) == dict:
+                result = [result]
+            final[args["target"]] = args["labels_map"][result[0]["label"]]
+            for elem in result:
+                if args["labels_map"]:
+                    explain[args["labels_map"][elem["label"]]] = elem["score"]
+                else:
+                    explain[elem["label"]] = elem["score"]
+            final[f"{args['target']}_explain"] = explain
+            finals.append(final)
+        return finals
+
+    def predict_text_generation(self, pipeline, items, args, batch_size):
+        results = pipeline(items, max_length=args["max_length"], batch_size=batch_size)
+
+        finals = []
+        for result in results:
+            if isinstance(result, list):
+                # list of generated sequences
+                result = result[0]
+            finals.append({args["target"]: result["generated_text"]})
+        return finals
+
+    def predict_zero_shot(self, pipeline, items, args, batch_size):
         top_k = args.get("top_k", 1000)
 
-        result = pipeline(
-            [item],
+        results = pipeline(
+            items,
             candidate_labels=args["candidate_labels"],
             truncation=True,
             top_k=top_k,
             max_length=args["max_length"],
-        )[0]
-
-        final = {}
-        final[args["target"]] = result["labels"][0]
+            batch_size=batch_size,
+        )
 
-        explain = dict(zip(result["labels"], result["scores"]))
-        final[f"{args['target']}_explain"] = explain
+        finals = []
+        for result in results:
+            final = {}
+            final[args["target"]] = result["labels"][0]
 
-        return final
+            explain = dict(zip(result["labels"], result["scores"]))
+            final[f"{args['target']}_explain"] = explain
+            finals.append(final)
+        return finals
 
-    def predict_translation(self, pipeline, item, args):
-        result = pipeline([item], max_length=args["max_length"])[0]
+    def predict_translation(self, pipeline, items, args, batch_size):
+        results = pipeline(items, max_length=args["max_length"], batch_size=batch_size)
 
-        final = {}
-        final[args["target"]] = result["translation_text"]
+        return [{args["target"]: result["translation_text"]} for result in results]
 
-        return final
-
-    def predict_summarization(self, pipeline, item, args):
-        result = pipeline(
-            [item],
+    def predict_summarization(self, pipeline, items, args, batch_size):
+        results = pipeline(
+            items,
             min_length=args["min_output_length"],
             max_length=args["max_output_length"],
-        )[0]
-
-        final = {}
-        final[args["target"]] = result["summary_text"]
+            batch_size=batch_size,
+        )
+
+        return [{args["target"]: result["summary_text"]} for result in results]
+
+    def predict_text2text(self, pipeline, items, args, batch_size):
+        results = pipeline(items, max_length=args["max_length"], batch_size=batch_size)
+
+        return [{args["target"]: result["generated_text"]} for result in results]
+
+    def predict_fill_mask(self, pipeline, items, args, batch_size):
+        results = pipeline(items, batch_size=batch_size)
+        if len(items) == 1:
+            # pipeline doesn't wrap result of the single input
+            results = [results]
+
+        finals = []
+        for result in results:
+            final = {}
+            final[args["target"]] = result[0]["sequence"]
+            explain = {elem["sequence"]: elem["score"] for elem in result}
+            final[f"{args['target']}_explain"] = explain
+            finals.append(final)
+        return finals
+
+    def _get_pipeline(self):
+        """
+        Args and pipeline of the model. They are loaded once and kept in the handler:
+        handler of the model is cached in ML process, retrained model gets a new handler
+        """
+        if getattr(self, "_warm_pipeline", None) is not None:
+            return self._warm_pipeline
 
-        return final
-
-    def predict_text2text(self, pipeline, item, args):
-        result = pipeline([item], max_length=args["max_length"])[0]
-
-        final = {}
-        final[args["target"]] = result["generated_text"]
+        args = self.model_storage.json_get("args")
+        try:
+            # load from model storage (finetuned models will use this)
+            hf_model_storage_path = self.model_storage.folder_get(
+                args["model_name"]
+            )
+            pipeline = transformers.pipeline(
+                task=args["task_proper"],
+                model=hf_model_storage_path,
+                tokenizer=hf_model_storage_path,
+            )
+        except OSError:
+            # load from engine storage (i.e. 'common' models)
+            hf_model_storage_path = self.engine_storage.folder_get(
+                args["model_name"]
+            )
+            pipeline = transformers.pipeline(
+                task=args["task_proper"],
+                model=hf_model_storage_path,
+                tokenizer=hf_model_storage_path,
+            )
 
-        return final
+        self._warm_pipeline = (args, pipeline)
+        return self._warm_pipeline
 
-    def predict_fill_mask(self, pipeline, item, args):
-        result = pipeline([item])[0]
+    def _truncate(self, pipeline, items, truncation_policy):
+        """
+        Check length of items in tokens. All items are tokenized in one call.
+        Too long items are cut (policy 'left' or 'right') or replaced by error (policy 'strict')
 
-        final = {}
-        final[args["target"]] = result[0]["sequence"]
-        explain = {elem["sequence"]: elem["score"] for elem in result}
-        final[f"{args['target']}_explain"] = explain
+        Returns:
+            list: items and dicts with errors in place of items which can't be used
+        """
+        max_tokens = pipeline.tokenizer.model_max_length
+        if max_tokens is None:
+            return items
+
+        tokens_list = pipeline.tokenizer(items)["input_ids"]
+
+        results = list(items)
+        for i, tokens in enumerate(tokens_list):
+            if len(tokens) <= max_tokens:
+                continue
+            if truncation_policy == "strict":
+                results[i] = {
+                    "error": f"Tokens count exceed model limit: {len(tokens)} > {max_tokens}"
+                }
+                continue
+            elif truncation_policy == "left":
+                tokens = tokens[
+                    -max_tokens + 1 : -1
+                ]  # cut 2 empty tokens from left and right
+            else:
+                tokens = tokens[
+                    1 : max_tokens - 1
+                ]  # cut 2 empty tokens from left and right
 
-        return final
+            results[i] = pipeline.tokenizer.decode(tokens)
+        return results
 
     def predict(self, df, args=None):
 
@@ -257,8 +332,10 @@ class HuggingFaceHandler(BaseMLEngine):
             "fill-mask": self.predict_fill_mask,
         }
 
+        pred_args = args.get("predict_params", {}) if args else {}
+
         ###### get stuff from model folder
-        args = self.model_storage.json_get("args")
+        args, pipeline = self._get_pipeline()
 
         task = args["task"]
 
@@ -267,72 +344,47 @@ class HuggingFaceHandler(BaseMLEngine):
 
         fnc = fnc_list[task]
 
-        try:
-            # load from model storage (finetuned models will use this)
-            hf_model_storage_path = self.model_storage.folder_get(
-                args["model_name"]
-            )
-            pipeline = transformers.pipeline(
-                task=args["task_proper"],
-                model=hf_model_storage_path,
-                tokenizer=hf_model_storage_path,
-            )
-        except OSError:
-            # load from engine storage (i.e. 'common' models)
-            hf_model_storage_path = self.engine_storage.folder_get(
-                args["model_name"]
-            )
-            pipeline = transformers.pipeline(
-                task=args["task_proper"],
-                model=hf_model_storage_path,
-                tokenizer=hf_model_storage_path,
-            )
-
         input_column = args["input_column"]
         if input_column not in df.columns:
             raise RuntimeError(f'Column "{input_column}" not found in input data')
-        input_list = df[input_column]
+        input_list = [str(item) for item in df[input_column]]
 
-        max_tokens = pipeline.tokenizer.model_max_length
+        batch_size = pred_args.get("batch_size", args.get("batch_size", 32))
+        truncation_policy = args.get("truncation_policy", "strict")
 
+        # input is processed by chunks: error in one of them doesn't affect the others
+        chunk_size = batch_size * 8
         results = []
-        for item in input_list:
-            if max_tokens is not None:
-                tokens = pipeline.tokenizer.encode(item)
-                if len(tokens) > max_tokens:
-                    truncation_policy = args.get("truncation_policy", "strict")
-                    if truncation_policy == "strict":
-                        results.append(
-                            {
-                                "error": f"Tokens count exceed model limit: {len(tokens)} > {max_tokens}"
-                            }
-                        )
-                        continue
-                    elif truncation_policy == "left":
-                        tokens = tokens[
-                            -max_tokens + 1 : -1
-                        ]  # cut 2 empty tokens from left and right
-                    else:
-                        tokens = tokens[
-                            1 : max_tokens - 1
-                        ]  # cut 2 empty tokens from left and right
-
-                    item = pipeline.tokenizer.decode(tokens)
-
-            item = str(item)
-            try:
-                result = fnc(pipeline, item, args)
-            except Exception as e:
-                msg = str(e).strip()
-                if msg == "":
-                    msg = e.__class__.__name__
-                result = {"error": msg}
-            results.append(result)
+        for start in range(0, len(input_list), chunk_size):
+            chunk = self._truncate(pipeline, input_list[start:start + chunk_size], truncation_policy)
+
+            # rows without errors
+            positions = [i for i, item in enumerate(chunk) if isinstance(item, str)]
+            items = [chunk[i] for i in positions]
+            if len(items) > 0:
+                try:
+                    chunk_results = fnc(pipeline, items, args, batch_size)
+                except Exception:
+                    # find out failed rows
+                    chunk_results = [self._predict_item(fnc, pipeline, item, args) for item in items]
+                for i, result in zip(positions, chunk_results):
+                    chunk[i] = result
+            results.extend(chunk)
 
         pred_df = pd.DataFrame(results)
 
         return pred_df
 
+    @staticmethod
+    def _predict_item(fnc, pipeline, item, args):
+        try:
+            return fnc(pipeline, [item], args, 1)[0]
+        except Exception as e:
+            msg = str(e).strip()
+            if msg == "":
+                msg = e.__class__.__name__
+            return {"error": msg}
+
     def describe(self, attribute: Optional[str] = None) -> pd.DataFrame:
         args = self.model_storage.json_get("args")
         if attribute == "args":
@@ -376,6 +428,7 @@ class HuggingFaceHandler(BaseMLEngine):
             # persist changes
             self.model_storage.json_set("args", args)
             self.model_storage.folder_sync(model_folder_name)
+            self._warm_pipeline = None
 
         except Exception as e:
             err_str = f"Finetune failed with error: {str(e)}"
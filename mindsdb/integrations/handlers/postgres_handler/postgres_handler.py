@@ -1,3 +1,5 @@
+from typing import Iterator
+
 import psycopg
 from psycopg.postgres import types
 from psycopg.pq import ExecStatus
@@ -55,6 +57,22 @@ class PostgresHandler(DatabaseHandler):
         if self.is_connected:
             return self.connection
 
+        try:
+            self.connection = self._make_connection()
+            self.is_connected = True
+            return self.connection
+        except psycopg.Error as e:
+            logger.error(f'Error connecting to PostgreSQL {self.database}, {e}!')
+            self.is_connected = False
+            raise
+
+    def _make_connection(self) -> psycopg.Connection:
+        """
+        Opens a new connection to the PostgreSQL database using the connection arguments of the handler.
+
+        Returns:
+            psycopg.Connection: A new connection object.
+        """
         config = {
             'host': self.connection_args.get('host'),
             'port': self.connection_args.get('port'),
@@ -70,14 +88,7 @@ class PostgresHandler(DatabaseHandler):
         if self.connection_args.get('schema'):
             config['options'] = f'-c search_path={self.connection_args.get("schema")},public'
 
-        try:
-            self.connection = psycopg.connect(**config, connect_timeout=10)
-            self.is_connected = True
-            return self.connection
-        except psycopg.Error as e:
-            logger.error(f'Error connecting to PostgreSQL {self.database}, {e}!')
-            self.is_connected = False
-            raise
+        return psycopg.connect(**config, connect_timeout=10)
 
     def disconnect(self):
         """
@@ -209,6 +220,53 @@ class PostgresHandler(DatabaseHandler):
         logger.debug(f"Executing SQL query: {query_str}")
         return self.native_query(query_str)
 
+    def query_stream(self, query: ASTNode, batch_size: int = 1000) -> Iterator[DataFrame]:
+        """
+        Executes a select query using server-side cursor and returns the result by batches.
+        The cursor is opened on a separate connection: commits of other queries on the
+        handler's connection would close it.
+
+        Args:
+            query (ASTNode): An ASTNode representing the SQL query to be executed.
+            batch_size (int): count of rows in batch
+
+        Returns:
+            Iterator[DataFrame]: batches of the result, at least one dataframe is returned
+        """
+        query_str = self.renderer.get_string(query, with_failback=True)
+        logger.debug(f"Executing SQL query with cursor: {query_str}")
+
+        try:
+            connection = self._make_connection()
+        except psycopg.Error as e:
+            logger.error(f'Error connecting to PostgreSQL {self.database}, {e}!')
+            raise
+
+        try:
+            with connection.cursor(name=f'mindsdb_cursor_{id(query)}') as cur:
+                cur.execute(query_str)
+                while True:
+                    result = cur.fetchmany(batch_size)
+                    df = DataFrame(
+                        result,
+                        columns=[x.name for x in cur.description]
+                    )
+                    self._cast_dtypes(df, cur.description)
+                    yield df
+                    if len(result) < batch_size:
+                        break
+            connection.commit()
+        except GeneratorExit:
+            # result wasn't read to the end
+            connection.rollback()
+            raise
+        except Exception as e:
+            logger.error(f'Error running query: {query_str} on {self.database}, {e}!')
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
     def get_tables(self) -> Response:
         """
         Retrieves a list of all non-system tables and views in the current schema of the PostgreSQL database.
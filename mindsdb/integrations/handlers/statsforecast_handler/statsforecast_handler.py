@@ -94,7 +94,8 @@ class StatsForecastHandler(BaseMLEngine):
         prediction horizon, time column (order by) and grouping column(s).
 
         Saves args, models params, and the formatted training df to disk. The training df
-        is used later in the predict() method.
+        is used later in the predict() method. With 'precompute_forecast' in USING,
+        forecasts of all series are also made and saved here.
         """
         time_settings = args["timeseries_settings"]
         using_args = args["using"]
@@ -122,6 +123,7 @@ class StatsForecastHandler(BaseMLEngine):
             training_df = transform_to_nixtla_df(df, model_args)
 
         model_args["model_name"] = DEFAULT_MODEL_NAME if "model_name" not in using_args else using_args["model_name"]
+        model_args["precompute_forecast"] = using_args.get("precompute_forecast", False)
 
         results_df = get_insample_cv_results(model_args, training_df)
         model_args["accuracies"] = get_model_accuracy_dict(results_df, r2_score)
@@ -134,36 +136,100 @@ class StatsForecastHandler(BaseMLEngine):
         self.model_storage.file_set("training_df", dill.dumps(training_df))
         self.model_storage.file_set("fitted_models", dill.dumps(fitted_models))
 
-    def predict(self, df, args={}):
-        """Makes forecasts with the StatsForecast Handler.
-
-        StatsForecast is setup to predict for all groups, so it won't handle
-        a dataframe that's been filtered to one group very well. Instead, we make
-        the prediction for all groups then take care of the filtering after the
-        forecasting. Prediction is nearly instant.
+        state = self._make_fitted_state(model_args, training_df, fitted_models)
+        if model_args["hierarchy"] and HierarchicalReconciliation is not None:
+            state["hier_df"], state["hier_dict"] = hier_df, hier_dict
+        if model_args["precompute_forecast"]:
+            # forecasts of all series are made once, predict only looks them up
+            state["forecast_df"] = self._forecast(state)
+            self.model_storage.file_set("forecast_df", dill.dumps(state["forecast_df"]))
+        self._fitted_state = state
+
+    @staticmethod
+    def _make_fitted_state(model_args, training_df, fitted_models):
+        sf = StatsForecast(models=[], freq=model_args["frequency"], df=training_df)
+        sf.fitted_ = fitted_models
+        return {
+            "model_args": model_args,
+            "training_df": training_df,
+            "sf": sf,
+            # position of series in fitted models
+            "positions": {uid: i for i, uid in enumerate(sf.uids)},
+            "forecast_df": None,
+        }
+
+    def _get_fitted_state(self):
+        """Returns fitted models, training data and precomputed forecast of the model.
+
+        The state is kept in the handler: handlers are cached in the ML process
+        by model id, so it is deserialized once per model version.
         """
-        # Load model arguments
+        state = getattr(self, "_fitted_state", None)
+        if state is not None:
+            return state
+
         model_args = self.model_storage.json_get("model_args")
         training_df = dill.loads(self.model_storage.file_get("training_df"))
         fitted_models = dill.loads(self.model_storage.file_get("fitted_models"))
+        state = self._make_fitted_state(model_args, training_df, fitted_models)
 
-        prediction_df = transform_to_nixtla_df(df, model_args)
-        groups_to_keep = prediction_df["unique_id"].unique()
+        if model_args["hierarchy"] and HierarchicalReconciliation is not None:
+            state["hier_df"] = dill.loads(self.model_storage.file_get("hier_df"))
+            state["hier_dict"] = dill.loads(self.model_storage.file_get("hier_dict"))
+
+        if model_args.get("precompute_forecast"):
+            state["forecast_df"] = dill.loads(self.model_storage.file_get("forecast_df"))
+
+        self._fitted_state = state
+        return state
+
+    def _forecast(self, state, groups=None):
+        """Makes forecasts for the series from the training data.
+
+        Only series from 'groups' are forecasted if they are set. Hierarchical forecasts
+        are reconciled using all series, so they are always made for all groups.
+        """
+        model_args = state["model_args"]
+        is_hierarchical = model_args["hierarchy"] and HierarchicalReconciliation is not None
+
+        sf = state["sf"]
+        if groups is not None and not is_hierarchical:
+            groups = [uid for uid in groups if uid in state["positions"]]
+            if len(groups) == 0:
+                # none of the series were in training data
+                columns = ["ds"] + [str(model) for model in sf.fitted_[0]]
+                return pd.DataFrame(columns=columns, index=pd.Index([], name="unique_id", dtype=str))
+            training_df = state["training_df"]
+            sf = StatsForecast(
+                models=[], freq=model_args["frequency"], df=training_df[training_df["unique_id"].isin(groups)]
+            )
+            sf.fitted_ = state["sf"].fitted_[[state["positions"][uid] for uid in sf.uids]]
 
-        sf = StatsForecast(models=[], freq=model_args["frequency"], df=training_df)
-        sf.fitted_ = fitted_models
-        model_name = str(fitted_models[0][0])
         forecast_df = sf.predict(model_args["horizon"])
         forecast_df.index = forecast_df.index.astype(str)
 
-        if model_args["hierarchy"] and HierarchicalReconciliation is not None:
-            hier_df = dill.loads(self.model_storage.file_get("hier_df"))
-            hier_dict = dill.loads(self.model_storage.file_get("hier_dict"))
-            reconciled_df = reconcile_forecasts(training_df, forecast_df, hier_df, hier_dict)
-            results_df = reconciled_df[reconciled_df.index.isin(groups_to_keep)]
+        if is_hierarchical:
+            forecast_df = reconcile_forecasts(state["training_df"], forecast_df, state["hier_df"], state["hier_dict"])
+        return forecast_df
 
-        else:
-            results_df = forecast_df[forecast_df.index.isin(groups_to_keep)]
+    def predict(self, df, args={}):
+        """Makes forecasts with the StatsForecast Handler.
+
+        Only the groups from the input dataframe are forecasted. If the forecast
+        was precomputed at training time, it is looked up without running the models.
+        """
+        state = self._get_fitted_state()
+        model_args = state["model_args"]
+
+        prediction_df = transform_to_nixtla_df(df, model_args)
+        groups_to_keep = prediction_df["unique_id"].unique()
+
+        model_name = str(state["sf"].fitted_[0][0])
+        forecast_df = state["forecast_df"]
+        if forecast_df is None:
+            forecast_df = self._forecast(state, groups_to_keep)
+
+        results_df = forecast_df[forecast_df.index.isin(groups_to_keep)]
 
         result = get_results_from_nixtla_df(results_df, model_args)
         result = result.rename(columns={model_name: model_args['target']})
@@ -2,13 +2,13 @@ import ast
 import inspect
 import textwrap
 from _ast import AnnAssign, AugAssign
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import pandas as pd
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb.utilities import log
 
-from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse
+from mindsdb.integrations.libs.response import HandlerResponse, HandlerStatusResponse, RESPONSE_TYPE
 
 logger = log.getLogger(__name__)
 
@@ -112,6 +112,26 @@ class DatabaseHandler(BaseHandler):
     def __init__(self, name: str):
         super().__init__(name)
 
+    def query_stream(self, query: ASTNode, batch_size: int = 1000) -> Iterator[pd.DataFrame]:
+        """ Execute query and return result by batches.
+        Default implementation fetches the whole result using `query` method. Handlers which are able
+        to read result partially (using server-side cursors) can override it.
+
+        Args:
+            query (ASTNode): select query
+            batch_size (int): count of rows in batch
+
+        Returns:
+            Iterator[pd.DataFrame]: at least one dataframe (may be empty) is returned
+        """
+        response = self.query(query)
+        if response.type == RESPONSE_TYPE.ERROR:
+            raise Exception(response.error_message)
+        if response.type == RESPONSE_TYPE.OK or response.data_frame is None:
+            yield pd.DataFrame()
+            return
+        yield response.data_frame
+
 
 class ArgProbeMixin:
     """
@@ -1,4 +1,5 @@
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple
+from functools import lru_cache
 import json
 import itertools
 import re
@@ -44,43 +45,62 @@ def get_completed_prompts(base_template: str, df: pd.DataFrame, strict=True) ->
         :return prompts: list of in-filled prompts using `base_template` and relevant columns from `df`
         :return empty_prompt_ids: np.int numpy array (shape (n_missing_rows,)) with the row indexes where in-fill failed due to missing data.
     """  # noqa
-    columns = []
-    spans = []
-    matches = list(re.finditer("{{(.*?)}}", base_template))
+    formatter, columns = _compile_prompt_template(base_template)
 
-    if len(matches) == 0:
+    if len(columns) == 0:
         # no placeholders
         if strict:
             raise AssertionError('No placeholders found in the prompt, please provide a valid prompt template.')
         prompts = [base_template] * len(df)
         return prompts, np.ndarray(0)
 
-    first_span = matches[0].start()
-    last_span = matches[-1].end()
+    # every column is passed to formatter once
+    columns = list(dict.fromkeys(columns))
+    empty_prompt_ids = np.where(df[columns].isna().all(axis=1).values)[0]
 
-    for m in matches:
-        columns.append(m[0].replace('{', '').replace('}', ''))
-        spans.extend((m.start(), m.end()))
+    # values of columns as strings, empty quote if data is missing
+    values = [
+        df[col].replace(to_replace=[None], value='').astype("string")
+        for col in columns
+    ]
+    # values which can't be converted to string make the whole prompt empty
+    is_na = np.logical_or.reduce([col.isna().to_numpy() for col in values])
+    values = [col.to_numpy(dtype=object, na_value='') for col in values]
 
-    spans = spans[1:-1]  # omit first and last, they are added separately
-    template = [base_template[s:e] for s, e in
-                list(zip(spans, spans[1:]))[::2]]  # take every other to skip placeholders  # noqa
-    template.insert(0, base_template[0:first_span])  # add prompt start
-    template.append(base_template[last_span:])  # add prompt end
+    prompts = list(map(formatter, *values))
+    for i in np.flatnonzero(is_na):
+        prompts[i] = pd.NA
 
-    empty_prompt_ids = np.where(df[columns].isna().all(axis=1).values)[0]
+    return prompts, empty_prompt_ids
 
-    df['__mdb_prompt'] = ''
-    for i in range(len(template)):
-        atom = template[i]
-        if i < len(columns):
-            col = df[columns[i]].replace(to_replace=[None], value='')  # add empty quote if data is missing
-            df['__mdb_prompt'] = df['__mdb_prompt'].apply(lambda x: x + atom) + col.astype("string")
-        else:
-            df['__mdb_prompt'] = df['__mdb_prompt'].apply(lambda x: x + atom)
-    prompts = list(df['__mdb_prompt'])
 
-    return prompts, empty_prompt_ids
+@lru_cache(maxsize=256)
+def _compile_prompt_template(base_template: str) -> Tuple[Callable, List[str]]:
+    """
+        Splits template to text and placeholders and makes function to render it.
+
+        :return formatter: function which gets values of columns (unique, in order of appearance) and returns a prompt
+        :return columns: names of columns in order of placeholders in template
+    """
+    columns = []
+    atoms = []
+    last_end = 0
+    for m in re.finditer("{{(.*?)}}", base_template):
+        atoms.append(base_template[last_end:m.start()])
+        columns.append(m[0].replace('{', '').replace('}', ''))
+        last_end = m.end()
+    atoms.append(base_template[last_end:])
+
+    unique_columns = list(dict.fromkeys(columns))
+    positions = [unique_columns.index(col) for col in columns]
+
+    # text of template is escaped, placeholders refer to arguments of formatter
+    fmt = ''
+    for atom, position in zip(atoms, positions):
+        fmt += atom.replace('{', '{{').replace('}', '}}') + '{' + str(position) + '}'
+    fmt += atoms[-1].replace('{', '{{').replace('}', '}}')
+
+    return fmt.format, columns
 
 
 def get_llm_config(provider: str, config: Dict) -> BaseLLMConfig:
@@ -22,11 +22,13 @@ import datetime as dt
 from types import ModuleType
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import func, null
 from sqlalchemy.sql.functions import coalesce
 
 from mindsdb.utilities.config import Config
+from mindsdb.utilities.cache import get_cache, json_checksum, rows_hash
 import mindsdb.interfaces.storage.db as db
 from mindsdb.__about__ import __version__ as mindsdb_version
 from mindsdb.utilities.hooks import after_predict as after_predict_hook
@@ -176,7 +178,7 @@ class BaseMLEngineExec:
 
     @profiler.profile()
     @mark_process(name='predict')
-    def predict(self, model_name: str, data: list, pred_format: str = 'dict',
+    def predict(self, model_name: str, data: Union[list, dict, pd.DataFrame], pred_format: str = 'dict',
                 project_name: str = None, version=None, params: dict = None):
         """ Generates predictions with some model and input data. """
         if isinstance(data, dict):
@@ -200,13 +202,29 @@ class BaseMLEngineExec:
         if predictor_record.status != PREDICTOR_STATUS.COMPLETE:
             raise Exception("Error: model creation not completed")
 
-        using = {} if params is None else params
+        using = {} if params is None else params.copy()
+        row_cache = using.pop('row_cache', self.config['cache'].get('row_cache', False))
         args = {
             'pred_format': pred_format,
             'predict_params': using,
             'using': using
         }
 
+        if row_cache and not self._is_timeseries(predictor_record) and len(df) > 0:
+            predictions = self._predict_with_row_cache(model_name, predictor_record, df, args)
+        else:
+            predictions = self._predict_df(model_name, predictor_record, df, args)
+
+        after_predict_hook(
+            company_id=ctx.company_id,
+            predictor_id=predictor_record.id,
+            rows_in_count=df.shape[0],
+            columns_in_count=df.shape[1],
+            rows_out_count=len(predictions)
+        )
+        return predictions
+
+    def _predict_df(self, model_name: str, predictor_record: db.Predictor, df: pd.DataFrame, args: dict):
         with self._catch_exception(model_name):
             task = self.base_ml_executor.apply_async(
                 task_type=ML_TASK_TYPE.PREDICT,
@@ -228,16 +246,58 @@ class BaseMLEngineExec:
         # mdb indexes
         if '__mindsdb_row_id' not in predictions.columns and '__mindsdb_row_id' in df.columns:
             predictions['__mindsdb_row_id'] = df['__mindsdb_row_id']
-
-        after_predict_hook(
-            company_id=ctx.company_id,
-            predictor_id=predictor_record.id,
-            rows_in_count=df.shape[0],
-            columns_in_count=df.shape[1],
-            rows_out_count=len(predictions)
-        )
         return predictions
 
+    @staticmethod
+    def _is_timeseries(predictor_record: db.Predictor) -> bool:
+        learn_args = predictor_record.learn_args or {}
+        return learn_args.get('timeseries_settings', {}).get('is_timeseries') is True
+
+    def _predict_with_row_cache(self, model_name: str, predictor_record: db.Predictor, df: pd.DataFrame, args: dict):
+        """ Predict using cache of predictions for separate rows, it is useful only for deterministic models.
+            Every row is a separate record of cache, keyed by model id, version, params and columns of input
+            and by hash of row values. Only rows which are not in cache are sent to the model,
+            predictions are merged in order of input rows
+        """
+        input_df = df.drop(columns=['__mindsdb_row_id'], errors='ignore')
+        prefix = '_'.join([
+            str(predictor_record.id),
+            str(predictor_record.version),
+            json_checksum([args, [[str(col), str(dtype)] for col, dtype in input_df.dtypes.items()]])
+        ])
+        keys = np.array([f'{prefix}_{row_hash:016x}' for row_hash in rows_hash(input_df).values])
+
+        max_rows = self.config['cache'].get('row_cache_max_rows', 1000000)
+        cache = get_cache('predict_rows', max_size=max_rows)
+        # duplicated rows are requested once
+        unique_keys = list(dict.fromkeys(keys))
+        cached = dict(zip(unique_keys, cache.get_many(unique_keys)))
+        hit_mask = np.array([cached[key] is not None for key in keys], dtype=bool)
+
+        positions = np.arange(len(df))
+        parts = []
+        if hit_mask.any():
+            hits = pd.DataFrame([cached[key] for key in keys[hit_mask]], index=positions[hit_mask])
+            if '__mindsdb_row_id' in df.columns:
+                hits['__mindsdb_row_id'] = df['__mindsdb_row_id'].values[hit_mask]
+            parts.append(hits)
+
+        if not hit_mask.all():
+            miss_mask = ~hit_mask
+            predictions = self._predict_df(model_name, predictor_record, df[miss_mask].reset_index(drop=True), args)
+            if len(predictions) != miss_mask.sum():
+                # output doesn't match rows of input: can't be cached by rows
+                if hit_mask.any():
+                    return self._predict_df(model_name, predictor_record, df, args)
+                return predictions
+
+            fresh = predictions.drop(columns=['__mindsdb_row_id'], errors='ignore')
+            cache.set_many(dict(zip(keys[miss_mask], fresh.to_dict(orient='records'))))
+
+            parts.append(predictions.set_axis(positions[miss_mask], axis=0))
+
+        return pd.concat(parts).sort_index().reset_index(drop=True)
+
     def create_validation(self, target, args, integration_id):
         with self._catch_exception():
             task = self.base_ml_executor.apply_async(
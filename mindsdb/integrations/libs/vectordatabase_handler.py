@@ -41,6 +41,13 @@ class TableField(Enum):
     DISTANCE = "distance"
 
 
+def gen_content_id(content) -> str:
+    """
+    Id of document which is inserted without id: hash of its content
+    """
+    return hashlib.md5(str(content).encode()).hexdigest()
+
+
 class VectorStoreHandler(BaseHandler):
     """
     Base class for handlers associated to vector databases.
@@ -268,17 +275,14 @@ class VectorStoreHandler(BaseHandler):
         id_col = TableField.ID.value
         content_col = TableField.CONTENT.value
 
-        def gen_hash(v):
-            return hashlib.md5(str(v).encode()).hexdigest()
-
         if id_col not in df.columns:
             # generate for all
-            df[id_col] = df[content_col].apply(gen_hash)
+            df[id_col] = df[content_col].apply(gen_content_id)
         else:
             # generate for empty
             for i in range(len(df)):
                 if pd.isna(df.loc[i, id_col]):
-                    df.loc[i, id_col] = gen_hash(df.loc[i, content_col])
+                    df.loc[i, id_col] = gen_content_id(df.loc[i, content_col])
 
         # remove duplicated ids
         df = df.drop_duplicates([TableField.ID.value])
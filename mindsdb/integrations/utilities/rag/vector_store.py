@@ -1,23 +1,87 @@
+import threading
 import time
-from datetime import timedelta
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
 
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_core.vectorstores import VectorStore
 
 from mindsdb.integrations.utilities.rag.loaders.vector_store_loader.vector_store_loader import VectorStoreLoader
-from mindsdb.integrations.utilities.rag.settings import VectorStoreConfig
+from mindsdb.integrations.utilities.rag.settings import VectorStoreConfig, DEFAULT_MAX_CONCURRENCY
+from mindsdb.utilities import log
+
+# tiktoken is an optional dependency
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = log.getLogger(__name__)
 
 # gpt-3.5-turbo
 _DEFAULT_TPM_LIMIT = 60000
-_DEFAULT_RATE_LIMIT_INTERVAL = timedelta(seconds=10)
-_INITIAL_TOKEN_USAGE = 0
+_DEFAULT_BATCH_SIZE = 100
+# average length of token in characters, it is used if tokenizer is not available
+_CHARS_PER_TOKEN = 4
+
+_token_counter = None
+
+
+def count_tokens(texts: List[str]) -> int:
+    """
+    Count of tokens in texts. cl100k_base encoding (used by OpenAI embeddings models) is used if it is available,
+    otherwise count is estimated by length of texts
+    """
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = _get_token_counter()
+    return _token_counter(texts)
+
+
+def _get_token_counter() -> Callable[[List[str]], int]:
+    if tiktoken is not None:
+        try:
+            encoding = tiktoken.get_encoding('cl100k_base')
+            return lambda texts: sum(len(tokens) for tokens in encoding.encode_ordinary_batch(texts))
+        except Exception as e:
+            logger.debug(f"Can't load tokenizer, count of tokens will be estimated: {e}")
+    return lambda texts: sum(len(text) // _CHARS_PER_TOKEN + 1 for text in texts)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: the bucket holds up to 'capacity' tokens and is refilled by 'rate' tokens per second.
+    Request waits until there are enough tokens in the bucket. Request which is bigger than the bucket
+    waits until the bucket is full.
+    """
+
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float):
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_time = (tokens - self._tokens) / self.rate
+            time.sleep(wait_time)
 
 
 class VectorStoreOperator:
     """
     Encapsulates the logic for adding documents to a vector store with rate limiting.
+    Documents are added by batches, several batches can be embedded at the same time.
     """
 
     def __init__(self,
@@ -26,15 +90,16 @@ class VectorStoreOperator:
                  documents: List[Document] = None,
                  vector_store_config: VectorStoreConfig = None,
                  token_per_minute_limit: int = _DEFAULT_TPM_LIMIT,
-                 rate_limit_interval: timedelta = _DEFAULT_RATE_LIMIT_INTERVAL,
-
+                 batch_size: int = _DEFAULT_BATCH_SIZE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
                  ):
 
         self.documents = documents
         self.embeddings_model = embeddings_model
         self.token_per_minute_limit = token_per_minute_limit
-        self.rate_limit_interval = rate_limit_interval
-        self.current_token_usage = _INITIAL_TOKEN_USAGE
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = TokenBucket(token_per_minute_limit, token_per_minute_limit / 60)
         self._vector_store = None
         self.vector_store_config = vector_store_config
 
@@ -54,36 +119,44 @@ class VectorStoreOperator:
     def vector_store(self):
         return self._vector_store
 
-    @staticmethod
-    def _calculate_token_usage(document):
-        return len(document.page_content)
-
-    def _rate_limit(self):
-        if self.current_token_usage >= self.token_per_minute_limit:
-            time.sleep(self.rate_limit_interval.total_seconds())
-            self.current_token_usage = _INITIAL_TOKEN_USAGE
-
-    def _update_token_usage(self, document: Document):
-        self._rate_limit()
-        self.current_token_usage += self._calculate_token_usage(document)
-
-    def _add_document(self, document: Document):
-        self._update_token_usage(document)
-        self.vector_store.add_documents([document])
+    def _add_batch(self, documents: List[Document]):
+        self.rate_limiter.acquire(count_tokens([document.page_content for document in documents]))
+        self.vector_store.add_documents(documents)
 
     def _add_documents_to_store(self, documents: List[Document], vector_store: VectorStore):
-        self._init_vector_store(documents, vector_store)
-        self.add_documents(documents)
+        # the first batch creates the store
+        self._init_vector_store(documents[:self.batch_size], vector_store)
+        self.add_documents(documents[self.batch_size:], done=min(self.batch_size, len(documents)))
 
     def _init_vector_store(self, documents: List[Document], vector_store: VectorStore):
         if len(documents) > 0:
+            self.rate_limiter.acquire(count_tokens([document.page_content for document in documents]))
             self._vector_store = vector_store.from_documents(
-                documents=[documents[0]], embedding=self.embeddings_model
+                documents=documents, embedding=self.embeddings_model
             )
 
-    def add_documents(self, documents: List[Document]):
-        for document in documents:
-            self._add_document(document)
+    def add_documents(self, documents: List[Document], done: int = 0):
+        """
+        Add documents to vector store by batches
+        :param documents: documents to add
+        :param done: count of documents which were added before, it is used in progress
+        """
+        total = done + len(documents)
+        batches = [documents[i:i + self.batch_size] for i in range(0, len(documents), self.batch_size)]
+        if len(batches) == 0:
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='vector_store') as executor:
+            futures = [executor.submit(self._add_batch, batch) for batch in batches]
+            try:
+                for batch, future in zip(batches, futures):
+                    future.result()
+                    done += len(batch)
+                    logger.info(f'Documents added to vector store: {done}/{total}')
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
 
 
 def load_vector_store(embeddings_model: Embeddings, config: VectorStoreConfig) -> VectorStore:
@@ -41,33 +41,40 @@ class ChatBotTask(BaseTask):
 
         database_name = db.Integration.query.get(bot_record.database_id).name
 
-        self.chat_handler = self.session.integration_controller.get_data_handler(database_name)
-        if not isinstance(self.chat_handler, APIChatHandler):
-            raise Exception(f"Can't use chat database: {database_name}")
-
-        # get chat handler info
-        self.bot_params = bot_record.params or {}
-
-        chat_params = self.chat_handler.get_chat_config()
-        self.bot_params['bot_username'] = self.chat_handler.get_my_user_name()
-
-        polling = chat_params['polling']['type']
-        if polling == 'message_count':
-            self.chat_pooling = MessageCountPolling(self, chat_params)
-            self.memory = HandlerMemory(self, chat_params)
-
-        elif polling == 'realtime':
-            self.chat_pooling = RealtimePolling(self, chat_params)
-            self.memory = DBMemory(self, chat_params)
-        else:
-            raise Exception(f"Not supported polling: {polling}")
-
-        if self.bot_params.get('modes') is None:
-            self.bot_executor_cls = BotExecutor
-        else:
-            self.bot_executor_cls = MultiModeBotExecutor
-
-        self.chat_pooling.run(stop_event)
+        # handler is used until the task is stopped, it doesn't take place in the pool
+        self.chat_handler = self.session.integration_controller.get_data_handler(database_name, pooled=False)
+        try:
+            if not isinstance(self.chat_handler, APIChatHandler):
+                raise Exception(f"Can't use chat database: {database_name}")
+
+            # get chat handler info
+            self.bot_params = bot_record.params or {}
+
+            chat_params = self.chat_handler.get_chat_config()
+            self.bot_params['bot_username'] = self.chat_handler.get_my_user_name()
+
+            polling = chat_params['polling']['type']
+            if polling == 'message_count':
+                self.chat_pooling = MessageCountPolling(self, chat_params)
+                self.memory = HandlerMemory(self, chat_params)
+
+            elif polling == 'realtime':
+                self.chat_pooling = RealtimePolling(self, chat_params)
+                self.memory = DBMemory(self, chat_params)
+            else:
+                raise Exception(f"Not supported polling: {polling}")
+
+            if self.bot_params.get('modes') is None:
+                self.bot_executor_cls = BotExecutor
+            else:
+                self.bot_executor_cls = MultiModeBotExecutor
+
+            self.chat_pooling.run(stop_event)
+        finally:
+            try:
+                self.chat_handler.disconnect()
+            except Exception:
+                pass
 
     def on_message(self, chat_memory, message: ChatBotMessage):
 
@@ -1,5 +1,7 @@
 import os
 import sys
+import ast
+import json
 import base64
 import shutil
 import tempfile
@@ -10,9 +12,10 @@ import multiprocessing
 from time import time
 from pathlib import Path
 from copy import deepcopy
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 from textwrap import dedent
 from collections import OrderedDict
+from collections.abc import MutableMapping
 
 from sqlalchemy import func
 
@@ -22,6 +25,7 @@ from mindsdb.utilities.exception import EntityNotExistsError
 from mindsdb.interfaces.storage.fs import FsStore, FileStorage, RESOURCE_GROUP
 from mindsdb.interfaces.storage.model_fs import HandlerStorage
 from mindsdb.interfaces.file.file_controller import FileController
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.integrations.libs.base import DatabaseHandler
 from mindsdb.integrations.libs.base import BaseMLEngine
 from mindsdb.integrations.libs.api_handler import APIHandler
@@ -29,26 +33,120 @@ from mindsdb.integrations.libs.const import HANDLER_CONNECTION_ARG_TYPE as ARG_T
 from mindsdb.interfaces.model.functions import get_model_records
 from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities import log
+from mindsdb.utilities.functions import get_handler_install_message
 from mindsdb.integrations.libs.ml_exec_base import BaseMLEngineExec
 from mindsdb.integrations.libs.base import BaseHandler
 import mindsdb.utilities.profiler as profiler
+from mindsdb.metrics import metrics
+from mindsdb.__about__ import __version__ as mindsdb_version
 
 logger = log.getLogger(__name__)
 
 
+class HandlersPool:
+    """ Pool of connected handlers of one integration of one company
+
+        Args:
+            name (str): name of the integration
+            min_size (int): count of handlers which are not closed by idle timeout
+            max_size (int): max count of handlers (idle and in use)
+            ttl (int): time (in seconds) after which idle handler is closed
+            checkout_timeout (int): how long thread waits for a free handler if pool is full
+            health_check_interval (int): handler is checked on checkout if it was idle longer than this time
+    """
+
+    def __init__(self, name: str, min_size: int = 0, max_size: int = 10, ttl: int = 60,
+                 checkout_timeout: int = 30, health_check_interval: int = 30):
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.ttl = ttl
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.idle = []
+        self.in_use = 0
+        self.closed = False
+
+    def size(self) -> int:
+        return len(self.idle) + self.in_use
+
+    def _change_state(self, idle_delta: int, in_use_delta: int) -> None:
+        self.in_use += in_use_delta
+        if idle_delta != 0:
+            metrics.HANDLERS_POOL_CONNECTIONS.labels(self.name, 'idle').inc(idle_delta)
+        if in_use_delta != 0:
+            metrics.HANDLERS_POOL_CONNECTIONS.labels(self.name, 'in_use').inc(in_use_delta)
+
+    def take_idle(self) -> Tuple[DatabaseHandler, float]:
+        """ get most recently used idle handler
+
+            Returns:
+                DatabaseHandler: handler
+                float: time when handler was returned to the pool
+        """
+        handler, checked_in_at = self.idle.pop()
+        self._change_state(-1, 1)
+        return handler, checked_in_at
+
+    def reserve(self) -> None:
+        """ take place in the pool for a new handler
+        """
+        self._change_state(0, 1)
+
+    def free(self) -> None:
+        """ release place of handler which was not returned to the pool
+        """
+        self._change_state(0, -1)
+
+    def put(self, handler: DatabaseHandler) -> None:
+        """ return handler to the pool
+        """
+        self.idle.append((handler, time()))
+        self._change_state(1, -1)
+
+    def evict(self, force: bool = False) -> List[DatabaseHandler]:
+        """ remove from the pool handlers which are idle longer than ttl
+
+            Args:
+                force (bool): remove all idle handlers
+
+            Returns:
+                List[DatabaseHandler]: handlers which have to be disconnected
+        """
+        evicted = []
+        expired_at = time() - self.ttl
+        while len(self.idle) > 0 and (
+            force
+            or (self.idle[0][1] < expired_at and self.size() > self.min_size)
+        ):
+            handler, _ = self.idle.pop(0)
+            evicted.append(handler)
+        if len(evicted) > 0:
+            self._change_state(-len(evicted), 0)
+        return evicted
+
+
 class HandlersCache:
-    """ Cache for data handlers that keep connections opened during ttl time from handler last use
+    """ Pools of data handlers that keep connections opened during ttl time from handler last use.
+
+        Handler is checked out from the pool of the integration by a thread and is used only by this thread
+        until the thread returns it with 'checkin'. Handlers which are not returned are reclaimed
+        when their thread is finished or when they are not used (and not referenced) for ttl time.
+        Long-lived tasks (triggers, chatbots) never return their handlers, they get handlers
+        created outside of the pools (pooled=False), so they don't take the places of the pools.
     """
 
     def __init__(self, ttl: int = 60):
         """ init cache
 
             Args:
-                ttl (int): time to live (in seconds) for record in cache
+                ttl (int): default time to live (in seconds) for idle handler in the pool
         """
         self.ttl = ttl
-        self.handlers = {}
-        self._lock = threading.RLock()
+        self.pools = {}
+        # handlers checked out by threads: {thread_id: {(name, company_id): lease}}
+        self.leases = {}
+        self._lock = threading.Condition(threading.RLock())
         self._stop_event = threading.Event()
         self.cleaner_thread = None
 
@@ -73,80 +171,234 @@ class HandlersCache:
         """
         self._stop_event.set()
 
-    def set(self, handler: DatabaseHandler):
-        """ add (or replace) handler in cache
-
-            Args:
-                handler (DatabaseHandler)
-        """
-        # do not cache connections in handlers processes
-        if multiprocessing.current_process().name.startswith('HandlerProcess'):
-            return
-        with self._lock:
+    @staticmethod
+    def _disconnect(handlers: List[DatabaseHandler]) -> None:
+        for handler in handlers:
             try:
-                key = (handler.name, ctx.company_id, threading.get_native_id())
-                handler.connect()
-                self.handlers[key] = {
-                    'handler': handler,
-                    'expired_at': time() + self.ttl
-                }
+                handler.disconnect()
             except Exception:
                 pass
-            self._start_clean()
 
-    def get(self, name: str) -> Optional[DatabaseHandler]:
-        """ get handler from cache by name
+    @staticmethod
+    def _is_alive(handler: DatabaseHandler) -> bool:
+        try:
+            return handler.check_connection().success is True
+        except Exception:
+            return False
+
+    def _get_pool(self, key: tuple) -> HandlersPool:
+        pool = self.pools.get(key)
+        if pool is None:
+            pool_config = Config().get('handlers_pool', {})
+            pool = HandlersPool(
+                name=key[0],
+                min_size=pool_config.get('min_size', 0),
+                max_size=pool_config.get('max_size', 10),
+                ttl=pool_config.get('idle_timeout', self.ttl),
+                checkout_timeout=pool_config.get('checkout_timeout', 30),
+                health_check_interval=pool_config.get('health_check_interval', 30)
+            )
+            self.pools[key] = pool
+        return pool
+
+    def _checkin_lease(self, thread_id: int, key: tuple) -> List[DatabaseHandler]:
+        """ return handler of the lease to its pool
+
+            Returns:
+                List[DatabaseHandler]: handlers which have to be disconnected
+        """
+        thread_leases = self.leases[thread_id]
+        lease = thread_leases.pop(key)
+        if len(thread_leases) == 0:
+            del self.leases[thread_id]
+        pool = lease['pool']
+        if pool.closed:
+            pool.free()
+            return [lease['handler']]
+        pool.put(lease['handler'])
+        self._lock.notify_all()
+        return []
+
+    def checkout(self, name: str, create_handler: Callable[[], DatabaseHandler],
+                 pooled: bool = True) -> DatabaseHandler:
+        """ get handler from the pool. Thread gets the same handler until it returns it to the pool.
+            If pool is full, then wait until other thread returns handler
 
             Args:
                 name (str): handler name
+                create_handler (Callable): function to create new handler if there is no idle handlers in the pool
+                pooled (bool): if False, then new handler is created outside of the pool,
+                    caller has to disconnect it when it is not needed
 
             Returns:
                 DatabaseHandler
         """
+        # do not cache connections in handlers processes
+        if pooled is False or multiprocessing.current_process().name.startswith('HandlerProcess'):
+            return create_handler()
+
+        key = (name, ctx.company_id)
+        thread_id = threading.get_native_id()
+        started_at = time()
+        to_disconnect = []
         with self._lock:
-            key = (name, ctx.company_id, threading.get_native_id())
-            if (
-                key not in self.handlers
-                or self.handlers[key]['expired_at'] < time()
-            ):
-                return None
-            self.handlers[key]['expired_at'] = time() + self.ttl
-            return self.handlers[key]['handler']
+            lease = self.leases.get(thread_id, {}).get(key)
+            if lease is not None:
+                if lease['pool'].closed is False:
+                    lease['expired_at'] = time() + lease['pool'].ttl
+                    return lease['handler']
+                # integration was changed
+                to_disconnect = self._checkin_lease(thread_id, key)
+
+            pool = self._get_pool(key)
+            handler = None
+            while True:
+                if len(pool.idle) > 0:
+                    handler, checked_in_at = pool.take_idle()
+                    break
+                if pool.size() < pool.max_size:
+                    pool.reserve()
+                    break
+                remaining = started_at + pool.checkout_timeout - time()
+                if remaining <= 0:
+                    raise Exception(
+                        f"Can't get connection to '{name}': all {pool.max_size} connections are in use"
+                    )
+                self._lock.wait(remaining)
+        self._disconnect(to_disconnect)
+        metrics.HANDLERS_POOL_WAIT_TIME.labels(name).observe(time() - started_at)
+
+        if (
+            handler is not None
+            and time() - checked_in_at > pool.health_check_interval
+            and self._is_alive(handler) is False
+        ):
+            self._disconnect([handler])
+            handler = None
+
+        if handler is None:
+            try:
+                handler = create_handler()
+                handler.connect()
+            except Exception:
+                with self._lock:
+                    pool.free()
+                    self._lock.notify_all()
+                if handler is None:
+                    raise
+                # handler is not cached, connection error will be raised on its use
+                return handler
+
+        with self._lock:
+            self.leases.setdefault(thread_id, {})[key] = {
+                'handler': handler,
+                'pool': pool,
+                'expired_at': time() + pool.ttl
+            }
+            self._start_clean()
+        return handler
+
+    def checkin(self) -> None:
+        """ return to pools all handlers which are used by the current thread
+        """
+        thread_id = threading.get_native_id()
+        to_disconnect = []
+        with self._lock:
+            for key in list(self.leases.get(thread_id, {}).keys()):
+                to_disconnect += self._checkin_lease(thread_id, key)
+        self._disconnect(to_disconnect)
 
     def delete(self, name: str) -> None:
-        """ delete handler from cache
+        """ close all handlers of integration
 
             Args:
                 name (str): handler name
         """
+        key = (name, ctx.company_id)
+        thread_id = threading.get_native_id()
+        to_disconnect = []
         with self._lock:
-            key = (name, ctx.company_id, threading.get_native_id())
-            if key in self.handlers:
-                try:
-                    self.handlers[key].disconnect()
-                except Exception:
-                    pass
-                del self.handlers[key]
-            if len(self.handlers) == 0:
+            pool = self.pools.pop(key, None)
+            if pool is not None:
+                # handlers which are in use by other threads are closed on checkin
+                pool.closed = True
+                to_disconnect += pool.evict(force=True)
+            if key in self.leases.get(thread_id, {}):
+                to_disconnect += self._checkin_lease(thread_id, key)
+            if len(self.pools) == 0 and len(self.leases) == 0:
                 self._stop_clean()
+        self._disconnect(to_disconnect)
 
-    def _clean(self) -> None:
-        """ worker that delete from cache handlers that was not in use for ttl
+    def _clean_step(self) -> None:
+        """ return to the pools handlers of finished threads and handlers that were not in use for ttl,
+            and close handlers that were idle for ttl
         """
-        while self._stop_event.wait(timeout=3) is False:
-            with self._lock:
-                for key in list(self.handlers.keys()):
+        to_disconnect = []
+        with self._lock:
+            alive_threads = set(thread.native_id for thread in threading.enumerate())
+            for thread_id in list(self.leases.keys()):
+                for key, lease in list(self.leases[thread_id].items()):
                     if (
-                        self.handlers[key]['expired_at'] < time()
-                        and sys.getrefcount(self.handlers[key]) == 2    # returned ref count is always 1 higher
+                        thread_id not in alive_threads
+                        or (
+                            lease['expired_at'] < time()
+                            # referenced only by lease and by getrefcount argument
+                            and sys.getrefcount(lease['handler']) == 2
+                        )
                     ):
-                        try:
-                            self.handlers[key].disconnect()
-                        except Exception:
-                            pass
-                        del self.handlers[key]
-                if len(self.handlers) == 0:
-                    self._stop_event.set()
+                        to_disconnect += self._checkin_lease(thread_id, key)
+
+            for key in list(self.pools.keys()):
+                pool = self.pools[key]
+                to_disconnect += pool.evict()
+                if pool.size() == 0:
+                    del self.pools[key]
+
+            if len(self.pools) == 0 and len(self.leases) == 0:
+                self._stop_event.set()
+        self._disconnect(to_disconnect)
+
+    def _clean(self) -> None:
+        """ worker that cleans the pools until they are empty
+        """
+        while self._stop_event.wait(timeout=3) is False:
+            self._clean_step()
+
+
+class LazyHandlersDict(MutableMapping):
+    """ Dict of handlers data (modules or import status) by name of handler.
+
+        Handler is imported on first access to its value, iteration over dict imports all handlers.
+    """
+
+    def __init__(self, import_handler: Callable[[str], None], import_all: Callable[[], None]):
+        self._data = {}
+        self._import_handler = import_handler
+        self._import_all = import_all
+
+    def __getitem__(self, name):
+        if name not in self._data:
+            self._import_handler(name)
+        return self._data[name]
+
+    def __contains__(self, name):
+        if name not in self._data:
+            self._import_handler(name)
+        return name in self._data
+
+    def __setitem__(self, name, value):
+        self._data[name] = value
+
+    def __delitem__(self, name):
+        del self._data[name]
+
+    def __iter__(self):
+        self._import_all()
+        return iter(list(self._data))
+
+    def __len__(self):
+        self._import_all()
+        return len(self._data)
 
 
 class IntegrationController:
@@ -170,6 +422,8 @@ class IntegrationController:
         return integration_record.id
 
     def add(self, name, engine, connection_args):
+        # metadata of removed integration with the same name
+        metadata_catalog.invalidate(name)
 
         logger.debug(
             "%s: add method calling name=%s, engine=%s, connection_args=%s, company_id=%s",
@@ -211,6 +465,7 @@ class IntegrationController:
 
     def modify(self, name, data):
         self.handlers_cache.delete(name)
+        metadata_catalog.invalidate(name)
         integration_record = self._get_integration_record(name)
         old_data = deepcopy(integration_record.data)
         for k in old_data:
@@ -225,6 +480,7 @@ class IntegrationController:
             raise Exception('Unable to drop: is system database')
 
         self.handlers_cache.delete(name)
+        metadata_catalog.invalidate(name)
 
         # check permanent integration
         if name in self.handler_modules:
@@ -481,19 +737,32 @@ class IntegrationController:
         return handler
 
     @profiler.profile()
-    def get_data_handler(self, name: str, case_sensitive: bool = False) -> BaseHandler:
+    def get_data_handler(self, name: str, case_sensitive: bool = False, pooled: bool = True) -> BaseHandler:
         """Get DATA handler (DB or API) by name
         Args:
             name (str): name of the handler
             case_sensitive (bool): should case be taken into account when searching by name
+            pooled (bool): take handler from the pool of the integration. Handler which is used
+                for the whole life of a task (subscriptions) must not be pooled, it is disconnected by the task
 
         Returns:
             BaseHandler: data handler
         """
-        handler = self.handlers_cache.get(name)
-        if handler is not None:
-            return handler
+        return self.handlers_cache.checkout(
+            name,
+            lambda: self._create_data_handler(name, case_sensitive),
+            pooled=pooled
+        )
+
+    def _create_data_handler(self, name: str, case_sensitive: bool = False) -> BaseHandler:
+        """Create DATA handler (DB or API) by name
+        Args:
+            name (str): name of the handler
+            case_sensitive (bool): should case be taken into account when searching by name
 
+        Returns:
+            BaseHandler: data handler
+        """
         integration_record = self._get_integration_record(name, case_sensitive)
         integration_engine = integration_record.engine
 
@@ -561,10 +830,7 @@ class IntegrationController:
             integration_engine, handler_ars
         )
         HandlerClass = self.handler_modules[integration_engine].Handler
-        handler = HandlerClass(**handler_ars)
-        self.handlers_cache.set(handler)
-
-        return handler
+        return HandlerClass(**handler_ars)
 
     def reload_handler_module(self, handler_name):
         importlib.reload(self.handler_modules[handler_name])
@@ -610,14 +876,13 @@ class IntegrationController:
             handler_meta['import']['error_message'] = str(import_error)
 
         # for ml engines, patch the connection_args from the argument probing
-        if hasattr(module, 'Handler'):
+        if hasattr(module, 'Handler') and getattr(module, 'type', None) == HANDLER_TYPE.ML:
             handler_class = module.Handler
             try:
-                prediction_args = handler_class.prediction_args()
-                creation_args = getattr(module, 'creation_args', handler_class.creation_args())
+                probed_args = self._get_probed_args(handler_dir, handler_class)
                 connection_args = {
-                    "prediction": prediction_args,
-                    "creation_args": creation_args
+                    "prediction": probed_args['prediction'],
+                    "creation_args": getattr(module, 'creation_args', probed_args['creation_args'])
                 }
                 setattr(module, 'connection_args', connection_args)
                 logger.debug("Patched connection_args for %s", handler_folder_name)
@@ -669,7 +934,89 @@ class IntegrationController:
 
         return handler_meta
 
+    def _get_args_cache_path(self) -> Path:
+        return Path(Config()['paths']['cache']).joinpath('handlers_args.json')
+
+    def _get_probed_args(self, handler_dir: Path, handler_class) -> dict:
+        """ Arguments of ml handler which are found by probing of its source code.
+            Probing parses the code and it is slow, so result is cached on disk
+            until files of the handler or version of mindsdb are changed
+        """
+        folder = handler_dir.name
+        key = [mindsdb_version, max((f.stat().st_mtime for f in handler_dir.rglob('*.py')), default=0)]
+        with self._args_cache_lock:
+            if self._args_cache is None:
+                try:
+                    with open(self._get_args_cache_path(), 'rt') as f:
+                        self._args_cache = json.load(f)
+                except Exception:
+                    self._args_cache = {}
+            entry = self._args_cache.get(folder)
+            if entry is not None and entry['key'] == key:
+                return entry['args']
+
+        args = {
+            'prediction': handler_class.prediction_args(),
+            'creation_args': handler_class.creation_args()
+        }
+
+        with self._args_cache_lock:
+            self._args_cache[folder] = {'key': key, 'args': args}
+            cache_path = self._get_args_cache_path()
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('wt', dir=cache_path.parent, delete=False) as f:
+                    json.dump(self._args_cache, f)
+                os.replace(f.name, cache_path)
+            except Exception as e:
+                logger.debug(f"Can't save arguments of handlers to cache: {e}")
+        return args
+
+    @staticmethod
+    def _read_handler_meta(handler_dir: Path) -> Optional[dict]:
+        """ Read metadata of handler from its __init__.py without import of the handler
+
+            Returns:
+                dict: name, type, title, icon_path, permanent of handler
+                    or None if name of handler can't be found without import
+        """
+        try:
+            tree = ast.parse(handler_dir.joinpath('__init__.py').read_text())
+        except Exception:
+            return None
+
+        handler_meta = {}
+        for node in tree.body:
+            if not (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)):
+                continue
+            attr = node.targets[0].id
+            if attr not in ('name', 'type', 'title', 'icon_path', 'permanent'):
+                continue
+            value = node.value
+            if isinstance(value, ast.Constant):
+                handler_meta[attr] = value.value
+            elif (
+                attr == 'type'
+                and isinstance(value, ast.Attribute)
+                and isinstance(value.value, ast.Name)
+                and value.value.id == 'HANDLER_TYPE'
+            ):
+                handler_meta[attr] = getattr(HANDLER_TYPE, value.attr, None)
+            else:
+                # value is known only after import
+                handler_meta.pop(attr, None)
+
+        if not isinstance(handler_meta.get('name'), str):
+            return None
+        if 'permanent' not in handler_meta:
+            handler_meta['permanent'] = handler_meta['name'] in ('files', 'views', 'lightwood')
+        handler_meta['import'] = {'folder': handler_dir.name}
+        return handler_meta
+
     def _load_handler_modules(self):
+        """ Handlers are not imported here: their metadata is read from source files
+            and handler is imported on first access to handler_modules or handlers_import_status
+        """
         mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent
         handlers_path = mindsdb_path.joinpath('integrations/handlers')
 
@@ -678,23 +1025,46 @@ class IntegrationController:
             mindsdb_path = Path(importlib.util.find_spec('mindsdb').origin).parent.joinpath('mindsdb')
             handlers_path = mindsdb_path.joinpath('integrations/handlers')
 
-        self.handler_modules = {}
-        self.handlers_import_status = {}
+        self._import_lock = threading.RLock()
+        self._args_cache_lock = threading.Lock()
+        self._args_cache = None
+        # handlers which are not imported yet: {name: (base_import, handler_dir)}
+        self._lazy_handlers = {}
+        self.handlers_metadata = {}
+        self.handler_modules = LazyHandlersDict(self._import_lazy_handler, self._import_all_handlers)
+        self.handlers_import_status = LazyHandlersDict(self._import_lazy_handler, self._import_all_handlers)
         for handler_dir in handlers_path.iterdir():
             if handler_dir.is_dir() is False or handler_dir.name.startswith('__'):
                 continue
-            self.import_handler('mindsdb.integrations.handlers.', handler_dir)
+            handler_meta = self._read_handler_meta(handler_dir)
+            if handler_meta is None:
+                self.import_handler('mindsdb.integrations.handlers.', handler_dir)
+                continue
+            self.handlers_metadata[handler_meta['name']] = handler_meta
+            self._lazy_handlers[handler_meta['name']] = ('mindsdb.integrations.handlers.', handler_dir)
+
+    def _import_lazy_handler(self, handler_name: str) -> None:
+        with self._import_lock:
+            lazy_handler = self._lazy_handlers.pop(handler_name, None)
+            if lazy_handler is not None:
+                base_import, handler_dir = lazy_handler
+                self.import_handler(base_import, handler_dir, handler_name=handler_name)
 
-    def import_handler(self, base_import: str, handler_dir: Path):
+    def _import_all_handlers(self) -> None:
+        for handler_name in list(self._lazy_handlers.keys()):
+            self._import_lazy_handler(handler_name)
+
+    def import_handler(self, base_import: str, handler_dir: Path, handler_name: str = None):
         handler_folder_name = str(handler_dir.name)
 
         try:
             handler_module = importlib.import_module(f'{base_import}{handler_folder_name}')
             handler_meta = self._get_handler_meta(handler_module)
         except Exception as e:
-            handler_name = handler_folder_name
-            if handler_name.endswith('_handler'):
-                handler_name = handler_name[:-8]
+            if handler_name is None:
+                handler_name = handler_folder_name
+                if handler_name.endswith('_handler'):
+                    handler_name = handler_name[:-8]
             dependencies = self._read_dependencies(handler_dir)
             handler_meta = {
                 'import': {
@@ -706,10 +1076,25 @@ class IntegrationController:
                 'name': handler_name
             }
 
+        if handler_meta['import']['success'] is not True:
+            logger.debug(f"Dependencies for the handler '{handler_meta['name']}' are not installed.")
+            logger.debug(get_handler_install_message(handler_meta['name']))
+
         self.handlers_import_status[handler_meta['name']] = handler_meta
+        if handler_meta['name'] not in self.handlers_metadata:
+            self.handlers_metadata[handler_meta['name']] = handler_meta
 
     def get_handlers_import_status(self):
         return self.handlers_import_status
 
+    def get_handlers_metadata(self) -> dict:
+        """ Metadata of all handlers which is available without import of handlers:
+            name, type, title, icon_path, permanent
+
+            Returns:
+                dict: {name of handler: metadata}
+        """
+        return self.handlers_metadata
+
 
 integration_controller = IntegrationController()
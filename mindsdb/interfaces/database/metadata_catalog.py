@@ -0,0 +1,138 @@
+import threading
+from time import time
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from mindsdb.interfaces.storage import db
+from mindsdb.utilities import log
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
+
+logger = log.getLogger(__name__)
+
+
+class MetadataCatalog:
+    """ Cache of metadata (lists of tables and columns) of integrations which is used by information_schema.
+
+        Entries are loaded in thread pool, so slow integration doesn't hold up other integrations.
+        Expired entry is returned while it is refreshed in background.
+        Key of entry is a tuple, first element of it is the name of integration: ('my_db', 'tables')
+
+        Config ('metadata_catalog' section):
+            ttl (int): time (in seconds) after which entry is refreshed
+            timeout (float): how long to wait for entries which are not in cache yet
+            max_workers (int): count of threads to load metadata
+    """
+
+    def __init__(self):
+        # {(company_id, key): {'value': ..., 'updated_at': float}}
+        self.entries = {}
+        # loads in progress: {(company_id, key): {'future': Future}}
+        self.loads = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    @staticmethod
+    def _get_config() -> dict:
+        return Config().get('metadata_catalog', {})
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        max_workers = self._get_config().get('max_workers', 8)
+        if self._executor is None or self._executor._max_workers != max_workers:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='metadata_catalog')
+        return self._executor
+
+    @staticmethod
+    def _release_resources() -> None:
+        # handlers and db session which were used by the worker thread
+        from mindsdb.interfaces.database.integrations import integration_controller
+
+        integration_controller.handlers_cache.checkin()
+        db.session.remove()
+
+    def _load(self, entry_key: tuple, load: dict, loader: Callable[[], Any], ctx_dump: dict) -> Any:
+        ctx.load(ctx_dump)
+        try:
+            value = loader()
+            with self._lock:
+                # result is not saved if entry was invalidated during the load
+                if self.loads.get(entry_key) is load:
+                    self.entries[entry_key] = {'value': value, 'updated_at': time()}
+            return value
+        except Exception as e:
+            logger.warning(f"Can't load metadata of '{entry_key[1][0]}': {e}")
+            raise
+        finally:
+            with self._lock:
+                if self.loads.get(entry_key) is load:
+                    del self.loads[entry_key]
+            self._release_resources()
+
+    def _start_load(self, entry_key: tuple, loader: Callable[[], Any]) -> dict:
+        # must be called with lock: worker can't finish the load before it is registered
+        load = self.loads.get(entry_key)
+        if load is None:
+            load = {}
+            load['future'] = self._get_executor().submit(self._load, entry_key, load, loader, ctx.dump())
+            self.loads[entry_key] = load
+        return load
+
+    def get_many(self, loaders: Dict[tuple, Callable[[], Any]], timeout: Optional[float] = None) -> dict:
+        """ Get metadata from cache, entries which are absent are loaded in parallel
+
+            Args:
+                loaders (dict): {key: function to load value}
+                timeout (float): how long to wait for absent entries, 'timeout' from config is used by default
+
+            Returns:
+                dict: {key: value}, entries which were not loaded in time (or loaded with errors) are skipped
+        """
+        config = self._get_config()
+        ttl = config.get('ttl', 60)
+        if timeout is None:
+            timeout = config.get('timeout', 5)
+
+        result = {}
+        futures = {}
+        with self._lock:
+            for key, loader in loaders.items():
+                entry_key = (ctx.company_id, key)
+                entry = self.entries.get(entry_key)
+                if entry is None:
+                    futures[key] = self._start_load(entry_key, loader)['future']
+                    continue
+                result[key] = entry['value']
+                if entry['updated_at'] + ttl < time():
+                    # stale entry is used, it will be updated for next queries
+                    self._start_load(entry_key, loader)
+
+        if len(futures) > 0:
+            wait(futures.values(), timeout=timeout)
+        for key, future in futures.items():
+            if not future.done():
+                logger.warning(f"Metadata of '{key[0]}' was not loaded in {timeout} seconds")
+            elif future.exception() is None:
+                result[key] = future.result()
+        return result
+
+    def get(self, key: tuple, loader: Callable[[], Any], timeout: Optional[float] = None) -> Optional[Any]:
+        """ Get one entry of metadata, see 'get_many'
+        """
+        return self.get_many({key: loader}, timeout=timeout).get(key)
+
+    def invalidate(self, integration_name: str) -> None:
+        """ Remove all entries of the integration of current company
+
+            Args:
+                integration_name (str): name of integration
+        """
+        name = integration_name.lower()
+        with self._lock:
+            for entries in (self.entries, self.loads):
+                for entry_key in list(entries.keys()):
+                    company_id, key = entry_key
+                    if company_id == ctx.company_id and key[0].lower() == name:
+                        del entries[entry_key]
+
+
+metadata_catalog = MetadataCatalog()
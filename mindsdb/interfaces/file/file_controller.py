@@ -3,6 +3,10 @@ import os
 import shutil
 from pathlib import Path
 
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from mindsdb.api.executor.utilities.sql import df_to_arrow
 from mindsdb.integrations.handlers.file_handler import Handler as FileHandler
 from mindsdb.interfaces.storage import db
 from mindsdb.interfaces.storage.fs import FsStore
@@ -12,6 +16,9 @@ from mindsdb.utilities.context import context as ctx
 
 logger = log.getLogger(__name__)
 
+# typed copy of the parsed file, it is stored near the source file
+COLUMNAR_FILE_NAME = "__columnar__.parquet"
+
 
 class FileController:
     def __init__(self):
@@ -101,10 +108,16 @@ class FileController:
             db.session.commit()
 
             file_dir = Path(self.dir).joinpath(store_file_path)
+            # storage can contain leftovers of deleted file with the same id, they must not be merged with new file
+            if file_dir.exists():
+                shutil.rmtree(file_dir)
+            self.fs_store.delete(store_file_path)
             file_dir.mkdir(parents=True, exist_ok=True)
             source = file_dir.joinpath(file_name)
             # NOTE may be delay between db record exists and file is really in folder
             shutil.move(file_path, str(source))
+            if file_name != COLUMNAR_FILE_NAME:
+                self._save_columnar_copy(df, file_dir.joinpath(COLUMNAR_FILE_NAME))
 
             self.fs_store.put(store_file_path, base_dir=self.dir)
         except Exception as e:
@@ -116,6 +129,25 @@ class FileController:
 
         return file_record.id
 
+    @staticmethod
+    def _save_columnar_copy(df, path):
+        """Write parsed file to parquet, so it is not necessary to parse the source file on every select
+
+        Args:
+            df (pandas.DataFrame): parsed file
+            path (Path): path to parquet file
+        """
+        try:
+            table = df_to_arrow(df)
+            if any(pa.types.is_nested(field.type) for field in table.schema):
+                # json values are converted to strings only during the query
+                return
+            pq.write_table(table, str(path))
+        except Exception as e:
+            logger.warning(f"Can't create columnar copy of the file: {e}")
+            if path.exists():
+                path.unlink()
+
     def delete_file(self, name):
         file_record = (
             db.session.query(db.File)
@@ -130,7 +162,7 @@ class FileController:
         self.fs_store.delete(f"file_{ctx.company_id}_{file_id}")
         return True
 
-    def get_file_path(self, name):
+    def _get_file_dir(self, name):
         file_record = (
             db.session.query(db.File)
             .filter_by(company_id=ctx.company_id, name=name)
@@ -140,8 +172,23 @@ class FileController:
             raise Exception(f"File '{name}' does not exists")
         file_dir = f"file_{ctx.company_id}_{file_record.id}"
         self.fs_store.get(file_dir, base_dir=self.dir)
-        return str(
-            Path(self.dir)
-            .joinpath(file_dir)
-            .joinpath(Path(file_record.source_file_path).name)
-        )
+        return file_record, Path(self.dir).joinpath(file_dir)
+
+    def get_file_path(self, name):
+        file_record, file_dir = self._get_file_dir(name)
+        return str(file_dir.joinpath(Path(file_record.source_file_path).name))
+
+    def get_file_columnar_path(self, name):
+        """Get path to typed copy of the file
+
+        Args:
+            name (str): name of the file
+
+        Returns:
+            str: path to parquet file or None if file doesn't have the copy (was uploaded before it was added)
+        """
+        _file_record, file_dir = self._get_file_dir(name)
+        path = file_dir.joinpath(COLUMNAR_FILE_NAME)
+        if not path.exists():
+            return None
+        return str(path)
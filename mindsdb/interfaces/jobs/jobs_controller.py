@@ -1,7 +1,7 @@
 import re
 import datetime as dt
 from dateutil.relativedelta import relativedelta
-from typing import List
+from typing import List, Optional
 
 import sqlalchemy as sa
 
@@ -355,6 +355,23 @@ class JobsExecutor:
 
         return query.all()
 
+    def get_next_run_at(self, exclude_ids: List[int] = None) -> Optional[dt.datetime]:
+        """ The earliest time of the next run of active jobs
+
+            Args:
+                exclude_ids (List[int]): ids of jobs to skip (for example, they are running now)
+
+            Returns:
+                datetime: time of the next run or None if there is nothing to run
+        """
+        query = db.session.query(sa.func.min(db.Jobs.next_run_at)).filter(
+            db.Jobs.deleted_at == sa.null(),
+            db.Jobs.active == True,  # noqa
+        )
+        if exclude_ids:
+            query = query.filter(db.Jobs.id.notin_(exclude_ids))
+        return query.scalar()
+
     def update_task_schedule(self, record):
         # calculate next run
 
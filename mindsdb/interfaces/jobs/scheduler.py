@@ -1,8 +1,8 @@
 import datetime as dt
-import queue
 import random
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from time import time
 
 from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
 from mindsdb.interfaces.storage import db
@@ -11,105 +11,206 @@ from mindsdb.utilities.config import Config
 
 logger = log.getLogger(__name__)
 
+# the shortest time between checks of timetable, seconds
+MIN_WAIT_TIME = 1
 
-def execute_async(q_in, q_out):
 
-    while True:
-        task = q_in.get()
-
-        if task["type"] != "task":
-            return
-
-        record_id = task["record_id"]
-        history_id = task["history_id"]
-
-        executor = JobsExecutor()
-        try:
-            executor.execute_task_local(record_id, history_id)
-        except (KeyboardInterrupt, SystemExit):
-            q_out.put(True)
-            raise
-
-        except Exception:
-            db.session.rollback()
-
-        q_out.put(True)
+class Scheduler:
+    """ Runs jobs which are due in a pool of threads
 
+        Config ('jobs' section):
+            max_workers (int): count of jobs which are executed at the same time by the instance
+            max_workers_per_company (int): count of jobs of one company which are executed at the same time
+            check_interval (int): the longest time between checks of timetable
+                (jobs created by other instances can be found only by check)
+            heartbeat_interval (int): how often 'updated_at' of history records of running jobs is updated
+    """
 
-class Scheduler:
     def __init__(self, config=None):
         self.config = config
 
-        self.q_in = queue.Queue()
-        self.q_out = queue.Queue()
-        self.work_thread = threading.Thread(
-            target=execute_async, args=(self.q_in, self.q_out)
-        )
-        self.work_thread.start()
+        # {job id: {'history_id': int, 'company_id': int, 'future': Future}}
+        self.running = {}
+        # there are due jobs which wait for a free worker
+        self.is_waiting = False
+        # due jobs which can't be locked: they are executed by other instance
+        self.locked_ids = set()
+        self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._executor = None
+        self._heartbeat_at = 0
 
     def __del__(self):
         self.stop_thread()
 
+    def _get_config(self) -> dict:
+        return self.config.get("jobs", {})
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            max_workers = self._get_config().get("max_workers", 4)
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobs_scheduler")
+        return self._executor
+
     def stop_thread(self):
-        self.q_in.put({"type": "exit"})
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def wait_tasks(self, timeout=None):
+        """ Wait until all running jobs are finished
+        """
+        with self._lock:
+            futures = [task["future"] for task in self.running.values()]
+        wait(futures, timeout=timeout)
 
     def scheduler_monitor(self):
-        check_interval = self.config.get("jobs", {}).get("check_interval", 30)
+        check_interval = self._get_config().get("check_interval", 30)
 
-        while True:
+        while not self._stop_event.is_set():
+            # event is cleared before check: job finished during the check will wake up the next one
+            self._wake_event.clear()
 
             logger.debug("Scheduler check timetable")
+            timeout = check_interval
             try:
                 self.check_timetable()
+                self.send_heartbeats()
+                timeout = self.get_wait_time()
             except (SystemExit, KeyboardInterrupt):
                 raise
             except Exception as e:
                 logger.error(e)
+            finally:
+                db.session.remove()
+
+            self._wake_event.wait(timeout)
+
+    def get_wait_time(self) -> float:
+        """ Time until the next check of timetable: next due job, heartbeat of running jobs
+            or finish of running job (it wakes the monitor up)
+        """
+        config = self._get_config()
+        timeout = config.get("check_interval", 30)
+
+        with self._lock:
+            running_ids = list(self.running.keys())
+            exclude_ids = running_ids + list(self.locked_ids)
+            is_waiting = self.is_waiting
+        if len(running_ids) > 0:
+            timeout = min(timeout, config.get("heartbeat_interval", 3))
+
+        if not is_waiting:
+            next_run_at = JobsExecutor().get_next_run_at(exclude_ids=exclude_ids)
+            if next_run_at is not None:
+                # different instances should start in not the same time
+                due_in = (next_run_at - dt.datetime.now()).total_seconds() + random.uniform(0, 1)
+                # overdue job which wasn't started must not make the monitor spin
+                timeout = min(timeout, max(due_in, MIN_WAIT_TIME))
+        return timeout
+
+    def send_heartbeats(self):
+        """ Update 'updated_at' of history records of all running jobs in one query,
+            it shows to other instances that jobs are not stuck
+        """
+        heartbeat_interval = self._get_config().get("heartbeat_interval", 3)
+        if time() - self._heartbeat_at < heartbeat_interval:
+            return
+
+        with self._lock:
+            history_ids = [task["history_id"] for task in self.running.values()]
+        if len(history_ids) == 0:
+            return
 
-            # different instances should start in not the same time
+        db.session.query(db.JobsHistory).filter(
+            db.JobsHistory.id.in_(history_ids)
+        ).update({"updated_at": dt.datetime.now()}, synchronize_session=False)
+        db.session.commit()
+        self._heartbeat_at = time()
 
-            time.sleep(check_interval + random.randint(1, 10))
+    def _has_free_worker(self, company_id) -> bool:
+        # must be called with lock
+        config = self._get_config()
+        max_workers = config.get("max_workers", 4)
+        max_workers_per_company = config.get("max_workers_per_company", max_workers)
+
+        if len(self.running) >= max_workers:
+            return False
+        company_running = [task for task in self.running.values() if task["company_id"] == company_id]
+        return len(company_running) < max_workers_per_company
 
     def check_timetable(self):
+        """ Start all due jobs if there are free workers, it doesn't wait for the end of jobs
+        """
         executor = JobsExecutor()
 
-        exec_method = self.config.get("jobs", {}).get("executor", "local")
+        exec_method = self._get_config().get("executor", "local")
 
+        is_waiting = False
+        locked_ids = set()
         for record in executor.get_next_tasks():
+            with self._lock:
+                if record.id in self.running:
+                    continue
+                if not self._has_free_worker(record.company_id):
+                    is_waiting = True
+                    continue
+
             logger.info(f"Job execute: {record.name}({record.id})")
-            self.execute_task(record.id, exec_method)
+            future = self.execute_task(record.id, exec_method, company_id=record.company_id)
+            if future is None:
+                locked_ids.add(record.id)
+
+        with self._lock:
+            self.is_waiting = is_waiting
+            self.locked_ids = locked_ids
 
         db.session.remove()
 
-    def execute_task(self, record_id, exec_method):
+    @staticmethod
+    def _release_resources():
+        # handlers and db session of the worker thread, it is reused by other jobs
+        from mindsdb.interfaces.database.integrations import integration_controller
 
+        integration_controller.handlers_cache.checkin()
+        db.session.remove()
+
+    def _run_task(self, record_id, history_id):
+        executor = JobsExecutor()
+        try:
+            executor.execute_task_local(record_id, history_id)
+        except Exception as e:
+            logger.error(f"Job {record_id} failed: {e}")
+            db.session.rollback()
+        finally:
+            self._release_resources()
+            with self._lock:
+                self.running.pop(record_id, None)
+            self._wake_event.set()
+
+    def execute_task(self, record_id, exec_method, company_id=None):
+        """ Start job in worker thread
+
+            Returns:
+                Future: future of the job or None if it is locked by other instance
+        """
         executor = JobsExecutor()
         if exec_method == "local":
             history_id = executor.lock_record(record_id)
             if history_id is None:
-                # db.session.remove()
                 logger.info(f"Unable create history record for {record_id}, is locked?")
-                return
-
-            # run in thread
+                return None
 
-            self.q_in.put(
-                {
-                    "type": "task",
-                    "record_id": record_id,
+            with self._lock:
+                self.running[record_id] = {
                     "history_id": history_id,
+                    "company_id": company_id,
                 }
-            )
-
-            while True:
-                try:
-                    self.q_out.get(timeout=3)
-                    break
-                except queue.Empty:
-                    # update last date:
-                    history_record = db.JobsHistory.query.get(history_id)
-                    history_record.updated_at = dt.datetime.now()
-                    db.session.commit()
+                future = self._get_executor().submit(self._run_task, record_id, history_id)
+                self.running[record_id]["future"] = future
+            return future
 
         else:
             # TODO add microservice mode
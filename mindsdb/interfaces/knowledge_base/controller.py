@@ -1,6 +1,11 @@
 import copy
-from typing import List
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 import mindsdb_sql.planner.utils as utils
@@ -16,9 +21,97 @@ from mindsdb_sql.parser.ast import (
 from mindsdb_sql.parser.dialects.mindsdb import CreatePredictor
 
 import mindsdb.interfaces.storage.db as db
-from mindsdb.integrations.libs.vectordatabase_handler import TableField
+from mindsdb.integrations.libs.vectordatabase_handler import TableField, gen_content_id
+from mindsdb.integrations.utilities.sql_utils import FilterCondition, FilterOperator
 from mindsdb.interfaces.database.projects import ProjectController
+from mindsdb.interfaces.storage.fs import RESOURCE_GROUP
+from mindsdb.interfaces.storage.json import get_json_storage
+from mindsdb.utilities.cache import dataframe_checksum, get_cache, json_checksum
+from mindsdb.utilities.config import Config
+from mindsdb.utilities.context import context as ctx
 from mindsdb.utilities.exception import EntityExistsError, EntityNotExistsError
+from mindsdb.utilities import log
+from mindsdb.metrics import metrics
+
+logger = log.getLogger(__name__)
+
+# count of ids in one lookup of stored documents
+STORED_ROWS_CHUNK_SIZE = 1000
+# name of json storage record with progress of interrupted insert
+INSERT_CHECKPOINT_KEY = 'insert_checkpoint'
+
+
+class QueryEmbeddingsCache:
+    """
+    LRU cache of embeddings of texts from queries to knowledge bases (content = '...').
+    Key is (model id, model version, text).
+    If redis is used as cache of mindsdb, it is also used as shared cache for embeddings.
+
+    Config ('knowledge_bases' section):
+        query_cache_size (int): count of texts in local cache, 0 - cache is disabled
+    """
+
+    def __init__(self):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self._shared = None
+
+    @staticmethod
+    def _get_max_size() -> int:
+        return Config().get('knowledge_bases', {}).get('query_cache_size', 1000)
+
+    def _get_shared(self):
+        if self._shared is None and Config().get('cache', {}).get('type') == 'redis':
+            self._shared = get_cache('kb_query_embeddings')
+        return self._shared
+
+    def get(self, key: tuple) -> Optional[list]:
+        if self._get_max_size() <= 0:
+            return None
+
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+        if value is not None:
+            metrics.CACHE_HITS.labels('kb_query_embeddings').inc()
+            return value
+        metrics.CACHE_MISSES.labels('kb_query_embeddings').inc()
+
+        shared = self._get_shared()
+        if shared is not None:
+            value = shared.get(json_checksum(list(key)))
+            if value is not None:
+                self._set_local(key, value)
+        return value
+
+    def set(self, key: tuple, value: list):
+        if self._get_max_size() <= 0:
+            return
+        self._set_local(key, value)
+
+        shared = self._get_shared()
+        if shared is not None:
+            shared.set(json_checksum(list(key)), value)
+
+    def _set_local(self, key: tuple, value: list):
+        max_size = self._get_max_size()
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+query_embeddings_cache = QueryEmbeddingsCache()
+
+# {model id: {'info': dict, 'updated_at': float}}
+_models_info = {}
+_models_info_lock = threading.Lock()
 
 
 class KnowledgeBaseTable:
@@ -30,6 +123,8 @@ class KnowledgeBaseTable:
     def __init__(self, kb: db.KnowledgeBase, session):
         self._kb = kb
         self._vector_db = None
+        # vector db handler is used by thread of insert and by thread of its writes
+        self._vector_db_lock = threading.Lock()
         self.session = session
 
     def select_query(self, query: Select) -> pd.DataFrame:
@@ -112,26 +207,215 @@ class KnowledgeBaseTable:
         """
         db_handler = self._get_vector_db()
         db_handler.delete(self._kb.vector_database_table)
+        self._get_checkpoints().delete(INSERT_CHECKPOINT_KEY)
 
     def insert(self, df: pd.DataFrame):
         """
         Insert dataframe to KB table
-        Adds embedding column to dataframe and calls .upsert method of vector db
+        Dataframe is inserted by batches: embeddings of the next batch are calculated while
+        previous batches are upserted to vector db. Count of upserted rows is saved in checkpoint,
+        insert of the same dataframe after a failure continues from it.
+
+        Config ('knowledge_bases' section):
+            insert_batch_size (int): count of rows which are embedded and upserted at once
+            insert_queue_size (int): count of embedded batches which can wait for upsert
         :param df: input dataframe
 
         """
         if df.empty:
             return
 
+        config = Config().get('knowledge_bases', {})
+        batch_size = config.get('insert_batch_size', 1000)
+        queue_size = config.get('insert_queue_size', 2)
+
+        total = len(df)
+        checkpoints = self._get_checkpoints()
+        checkpoint = {'checksum': dataframe_checksum(df), 'rows_done': 0}
+        saved_checkpoint = checkpoints.get(INSERT_CHECKPOINT_KEY)
+        if saved_checkpoint is not None and saved_checkpoint.get('checksum') == checkpoint['checksum']:
+            checkpoint['rows_done'] = saved_checkpoint['rows_done']
+            logger.info(
+                f"Knowledge base '{self._kb.name}': insert continues from checkpoint, "
+                f"{checkpoint['rows_done']}/{total} rows are already inserted"
+            )
+
+        self._get_vector_db()
+        # one thread: batches are upserted in the same order as they are in dataframe
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='kb_insert')
+        # upserts which are not finished yet: [(future, rows_done)]
+        pending = deque()
+        try:
+            for start in range(checkpoint['rows_done'], total, batch_size):
+                end = min(start + batch_size, total)
+                batch = self._prepare_batch(df.iloc[start:end])
+
+                while len(pending) >= queue_size:
+                    self._finish_upsert(pending[0], checkpoint, total)
+                    pending.popleft()
+
+                future = None
+                if not batch.empty:
+                    future = executor.submit(self._upsert_batch, batch, ctx.dump())
+                pending.append((future, end))
+
+            while len(pending) > 0:
+                self._finish_upsert(pending[0], checkpoint, total)
+                pending.popleft()
+        except Exception:
+            # save progress of batches which were upserted before the failure,
+            # failed upsert (if it is the cause) is the first in the queue
+            for future, rows_done in pending:
+                if future is not None and future.exception() is not None:
+                    break
+                self._save_checkpoint(checkpoint, rows_done)
+            raise
+        finally:
+            executor.shutdown(wait=True)
+
+        checkpoints.delete(INSERT_CHECKPOINT_KEY)
+
+    def _get_checkpoints(self):
+        return get_json_storage(resource_id=self._kb.id, resource_group=RESOURCE_GROUP.KNOWLEDGE_BASE)
+
+    def _save_checkpoint(self, checkpoint: dict, rows_done: int):
+        checkpoint['rows_done'] = rows_done
+        self._get_checkpoints().set(INSERT_CHECKPOINT_KEY, checkpoint)
+
+    def _finish_upsert(self, upsert: tuple, checkpoint: dict, total: int):
+        """
+        Wait for upsert of the batch and save progress
+        :param upsert: future of upsert (None if batch was empty) and count of inserted rows after it
+        """
+        future, rows_done = upsert
+        if future is not None:
+            future.result()
+        self._save_checkpoint(checkpoint, rows_done)
+        logger.info(f"Knowledge base '{self._kb.name}': {rows_done}/{total} rows are inserted")
+
+    def _prepare_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert batch of input dataframe to documents with embeddings,
+        only new or changed content is sent to embedding model
+        """
         df = self._adapt_column_names(df)
+        df = self._fill_ids(df)
+        return self._add_embeddings(df)
 
-        # add embeddings
-        df_emb = self._df_to_embeddings(df)
-        df = pd.concat([df, df_emb], axis=1)
+    def _upsert_batch(self, df: pd.DataFrame, ctx_dump: dict):
+        ctx.load(ctx_dump)
+        with self._vector_db_lock:
+            self._get_vector_db().do_upsert(self._kb.vector_database_table, df)
 
-        # send to vector db
+    @staticmethod
+    def _fill_ids(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Set ids of documents in the same way as vector db handler does it: hash of content for empty ids
+        """
+        id_col = TableField.ID.value
+        content_col = TableField.CONTENT.value
+
+        df = df.reset_index(drop=True)
+        if id_col not in df.columns:
+            ids = df[content_col].map(gen_content_id)
+        else:
+            ids = df[id_col].astype(object)
+            empty = ids.isna()
+            if empty.any():
+                ids[empty] = df.loc[empty, content_col].map(gen_content_id)
+        df[id_col] = ids.map(str)
+        return df
+
+    def _get_stored_rows(self, ids: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Get documents which are already stored in vector db
+        :param ids: ids of documents
+        :return: dataframe with id, content, metadata and embeddings or None if vector db can't find them
+        """
         db_handler = self._get_vector_db()
-        db_handler.do_upsert(self._kb.vector_database_table, df)
+        columns = [
+            TableField.ID.value,
+            TableField.CONTENT.value,
+            TableField.METADATA.value,
+            TableField.EMBEDDINGS.value,
+        ]
+        parts = []
+        try:
+            for i in range(0, len(ids), STORED_ROWS_CHUNK_SIZE):
+                with self._vector_db_lock:
+                    parts.append(db_handler.select(
+                        self._kb.vector_database_table,
+                        columns=columns,
+                        conditions=[FilterCondition(
+                            column=TableField.ID.value,
+                            op=FilterOperator.IN,
+                            value=ids[i:i + STORED_ROWS_CHUNK_SIZE]
+                        )]
+                    ))
+        except Exception as e:
+            logger.debug(f"Can't get stored documents of knowledge base '{self._kb.name}': {e}")
+            return None
+
+        if len(parts) == 0:
+            return None
+        df = pd.concat(parts, ignore_index=True)
+        if not {TableField.ID.value, TableField.CONTENT.value, TableField.EMBEDDINGS.value}.issubset(df.columns):
+            return None
+        df[TableField.ID.value] = df[TableField.ID.value].map(str)
+        return df.drop_duplicates(TableField.ID.value).set_index(TableField.ID.value)
+
+    def _add_embeddings(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add embeddings column to documents.
+        Vector db is used as the cache of embeddings of the model of the knowledge base:
+        - documents with the same id, content and metadata as in vector db are skipped
+        - embeddings of documents with the same id and content are taken from vector db
+        - the same content is embedded once
+        :param df: documents with id, content and metadata
+        :return: documents to upsert with embeddings
+        """
+        id_col = TableField.ID.value
+        content_col = TableField.CONTENT.value
+        metadata_col = TableField.METADATA.value
+        emb_col = TableField.EMBEDDINGS.value
+
+        embeddings = pd.Series([None] * len(df), index=df.index, dtype=object)
+
+        stored = self._get_stored_rows(list(df[id_col].unique()))
+        if stored is not None and not stored.empty:
+            is_stored = df[id_col].isin(stored.index).to_numpy()
+            stored = stored.reindex(df[id_col])
+            same_content = is_stored & (stored[content_col].to_numpy() == df[content_col].to_numpy())
+
+            if metadata_col in df.columns and metadata_col in stored.columns:
+                same_metadata = (stored[metadata_col].map(str).to_numpy() == df[metadata_col].map(str).to_numpy())
+            else:
+                same_metadata = metadata_col not in df.columns
+            unchanged = same_content & same_metadata
+
+            # reuse stored embeddings
+            stored_embeddings = stored[emb_col].to_numpy()
+            is_vector = np.array([isinstance(value, (list, np.ndarray)) for value in stored_embeddings], dtype=bool)
+            for i in np.flatnonzero(same_content & ~unchanged & is_vector):
+                embeddings.iat[i] = stored_embeddings[i]
+
+            metrics.CACHE_HITS.labels('kb_embeddings').inc(int((same_content & is_vector).sum()))
+            df = df[~unchanged]
+            embeddings = embeddings[~unchanged]
+
+        to_embed = embeddings.isna().to_numpy()
+        if to_embed.any():
+            contents = df.loc[to_embed, content_col]
+            unique_contents = contents.drop_duplicates()
+            df_emb = self._df_to_embeddings(pd.DataFrame({content_col: unique_contents.to_numpy()}))
+            content_embeddings = dict(zip(unique_contents.to_numpy(), df_emb[emb_col].to_numpy()))
+            for i, content in zip(np.flatnonzero(to_embed), contents.to_numpy()):
+                embeddings.iat[i] = content_embeddings.get(content)
+            metrics.CACHE_MISSES.labels('kb_embeddings').inc(len(unique_contents))
+
+        df = df.copy()
+        df[emb_col] = embeddings
+        return df.reset_index(drop=True)
 
     def _adapt_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
 
@@ -259,6 +543,38 @@ class KnowledgeBaseTable:
             self._vector_db = self.session.integration_controller.get_data_handler(database_name)
         return self._vector_db
 
+    def _get_model_info(self) -> dict:
+        """
+        Description of embedding model which is required to call it.
+        It is cached for 'knowledge_bases.model_info_ttl' seconds, so repeated queries don't read db
+        :return: dict with id, version, name, project_name, input_column and target
+        """
+        model_id = self._kb.embedding_model_id
+        ttl = Config().get('knowledge_bases', {}).get('model_info_ttl', 60)
+
+        with _models_info_lock:
+            cached = _models_info.get(model_id)
+        if cached is not None and cached['updated_at'] + ttl > time():
+            return cached['info']
+
+        model_rec = db.session.query(db.Predictor).filter_by(id=model_id).first()
+
+        assert model_rec is not None, f"Model not found: {model_id}"
+        model_project = db.session.query(db.Project).filter_by(id=model_rec.project_id).first()
+
+        info = {
+            'id': model_rec.id,
+            # record is updated when the model is retrained
+            'version': f'{model_rec.version}:{model_rec.updated_at}',
+            'name': model_rec.name,
+            'project_name': model_project.name,
+            'input_column': model_rec.learn_args.get('using', {}).get('question_column'),
+            'target': model_rec.to_predict[0],
+        }
+        with _models_info_lock:
+            _models_info[model_id] = {'info': info, 'updated_at': time()}
+        return info
+
     def _df_to_embeddings(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Returns embeddings for input dataframe.
@@ -271,19 +587,14 @@ class KnowledgeBaseTable:
         if df.empty:
             return pd.DataFrame([], columns=[TableField.EMBEDDINGS.value])
 
-        model_id = self._kb.embedding_model_id
-        # get the input columns
-        model_rec = db.session.query(db.Predictor).filter_by(id=model_id).first()
+        model_info = self._get_model_info()
 
-        assert model_rec is not None, f"Model not found: {model_id}"
-        model_project = db.session.query(db.Project).filter_by(id=model_rec.project_id).first()
-
-        project_datanode = self.session.datahub.get(model_project.name)
+        project_datanode = self.session.datahub.get(model_info['project_name'])
 
         # keep only content
         df = df[[TableField.CONTENT.value]]
 
-        input_col = model_rec.learn_args.get('using', {}).get('question_column')
+        input_col = model_info['input_column']
 
         if input_col is not None and input_col != TableField.CONTENT.value:
             df = df.rename(columns={TableField.CONTENT.value: input_col})
@@ -291,11 +602,11 @@ class KnowledgeBaseTable:
         data = df.to_dict('records')
 
         df_out = project_datanode.predict(
-            model_name=model_rec.name,
+            model_name=model_info['name'],
             data=data,
         )
 
-        target = model_rec.to_predict[0]
+        target = model_info['target']
         if target != TableField.EMBEDDINGS.value:
             # adapt output for vectordb
             df_out = df_out.rename(columns={target: TableField.EMBEDDINGS.value})
@@ -305,13 +616,21 @@ class KnowledgeBaseTable:
 
     def _content_to_embeddings(self, content: str) -> List[float]:
         """
-        Converts string to embeddings
+        Converts string to embeddings, results are cached
         :param content: input string
         :return: embeddings
         """
+        model_info = self._get_model_info()
+        key = (model_info['id'], model_info['version'], str(content))
+        embeddings = query_embeddings_cache.get(key)
+        if embeddings is not None:
+            return embeddings
+
         df = pd.DataFrame([[content]], columns=[TableField.CONTENT.value])
         res = self._df_to_embeddings(df)
-        return res[TableField.EMBEDDINGS.value][0]
+        embeddings = res[TableField.EMBEDDINGS.value][0]
+        query_embeddings_cache.set(key, embeddings)
+        return embeddings
 
 
 class KnowledgeBaseController:
@@ -489,6 +808,10 @@ class KnowledgeBaseController:
             except EntityNotExistsError:
                 pass
 
+        get_json_storage(resource_id=kb.id, resource_group=RESOURCE_GROUP.KNOWLEDGE_BASE).clean()
+        with _models_info_lock:
+            _models_info.pop(kb.embedding_model_id, None)
+
         # kb exists
         db.session.delete(kb)
         db.session.commit()
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Union
 
 import pandas as pd
 
@@ -83,7 +83,7 @@ class QueryContextController:
 
     def _result_callback(self, l_query: LastQuery,
                          context_name: str, query_str: str,
-                         data: List[dict], columns_info: list):
+                         data: Union[List[list], pd.DataFrame], columns_info: list):
         """
         This function handlers result from executed query and updates context variables with new values
 
@@ -93,14 +93,17 @@ class QueryContextController:
           - context_name: name of the context
           - query_str: rendered query to search in context table
         - result of the query
-          - data: list of dicts
+          - data: list of rows or dataframe
           - columns_info: list
 
         """
         if len(data) == 0:
             return
 
-        df = pd.DataFrame(data, columns=[col['name'] for col in columns_info])
+        if isinstance(data, pd.DataFrame):
+            df = data
+        else:
+            df = pd.DataFrame(data, columns=[col['name'] for col in columns_info])
         values = {}
         # get max values
         for info in l_query.get_last_columns():
@@ -165,7 +168,10 @@ class QueryContextController:
             if len(data) == 0:
                 value = None
             else:
-                row = data[0]
+                if isinstance(data, pd.DataFrame):
+                    row = data.iloc[0].tolist()
+                else:
+                    row = data[0]
 
                 idx = None
                 for i, col in enumerate(columns_info):
@@ -207,8 +213,8 @@ class QueryContextController:
             context_stack = ctx.context_stack or []
         except AttributeError:
             context_stack = []
-        context_stack.append(self.gen_context_name(object_type, object_id))
-        ctx.context_stack = context_stack
+        # stack is not changed in place: it can be shared with snapshots of the context
+        ctx.context_stack = context_stack + [self.gen_context_name(object_type, object_id)]
 
     def release_context(self, object_type: str = None, object_id: int = None):
         """
@@ -222,8 +228,7 @@ class QueryContextController:
             return
         context_name = self.gen_context_name(object_type, object_id)
         if context_stack[-1] == context_name:
-            context_stack.pop()
-        ctx.context_stack = context_stack
+            ctx.context_stack = context_stack[:-1]
 
     def gen_context_name(self, object_type: str, object_id: int) -> str:
         """
@@ -1,16 +1,29 @@
+from functools import partial
 from typing import Iterable, List, Optional
 
 import pandas as pd
 from mindsdb_sql import parse_sql, Identifier
+from mindsdb_sql.parser.ast import Select, Constant
 from mindsdb_sql.planner.utils import query_traversal
 
-
+from mindsdb.integrations.libs.response import RESPONSE_TYPE
+from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
 from mindsdb.utilities import log
+from mindsdb.utilities.config import Config
 
 logger = log.getLogger(__name__)
 
 
 class SQLAgent:
+    """ Tools of text-to-SQL skill
+
+        Lists of tables and descriptions of tables (columns and sample rows) are kept in metadata catalog,
+        so they are not requested from integration on every call of the tool. They are loaded in parallel
+        by workers of the catalog and removed from it when the integration is modified.
+
+        Config ('sql_agent' section):
+            timeout (float): how long to wait for descriptions of tables which are not in cache yet
+    """
 
     def __init__(
             self,
@@ -59,26 +72,38 @@ class SQLAgent:
 
         query_traversal(ast_query, _check_f)
 
+    @staticmethod
+    def _get_timeout() -> float:
+        return Config().get('sql_agent', {}).get('timeout', 60)
+
+    def _load_table_names(self) -> List[str]:
+        # it is called by workers of metadata catalog: tables are requested from handler, without the shared executor
+        response = self._integration_controller.get_data_handler(self._database).get_tables()
+        if response.type == RESPONSE_TYPE.ERROR:
+            raise Exception(response.error_message)
+        df = response.data_frame
+        columns = {col.lower(): col for col in df.columns}
+        names = df[columns.get('table_name', df.columns[0])].to_list()
+        return [name for name in names if name != 'information_schema']
+
     def get_usable_table_names(self) -> Iterable[str]:
         if self._tables_to_include:
             return self._tables_to_include
 
-        ret = self._call_engine('show databases;')
-        dbs = [lst[0] for lst in ret.data if lst[0] != 'information_schema']
-        usable_tables = []
-        for db in dbs:
-            if db != 'mindsdb' and db == self._database:
-                try:
-                    ret = self._call_engine('show tables', database=db)
-                    tables = [lst[0] for lst in ret.data if lst[0] != 'information_schema']
-                    for table in tables:
-                        # By default, include all tables in a database unless expilcitly ignored.
-                        table_name = f'{db}.{table}'
-                        if table_name not in self._tables_to_ignore:
-                            usable_tables.append(table_name)
-                except Exception as e:
-                    logger.warning('Unable to get tables for %s: %s', db, str(e))
+        if self._database in ('mindsdb', 'information_schema'):
+            return []
 
+        # unavailable database doesn't have tables
+        tables = metadata_catalog.get(
+            (self._database, 'sql_agent_tables'), self._load_table_names, timeout=self._get_timeout()
+        ) or []
+
+        usable_tables = []
+        for table in tables:
+            # By default, include all tables in a database unless expilcitly ignored.
+            table_name = f'{self._database}.{table}'
+            if table_name not in self._tables_to_ignore:
+                usable_tables.append(table_name)
         return usable_tables
 
     def get_table_info(self, table_names: Optional[List[str]] = None) -> str:
@@ -94,12 +119,20 @@ class SQLAgent:
                 raise ValueError(f"table_names {missing_tables} not found in database")
             all_table_names = table_names
 
-        tables = []
+        loaders = {}
         for table in all_table_names:
-            table_info = self._get_single_table_info(table)
-            tables.append(table_info)
+            integration, table_name = table.split('.')
+            key = (integration, 'sql_agent_table_info', table_name, self._sample_rows_in_table_info)
+            loaders[key] = (table, partial(self._get_single_table_info, table))
+        tables_info = metadata_catalog.get_many(
+            {key: loader for key, (_, loader) in loaders.items()}, timeout=self._get_timeout()
+        )
 
-        final_str = "\n\n".join(tables)
+        missing_tables = [table for key, (table, _) in loaders.items() if key not in tables_info]
+        if missing_tables:
+            raise ValueError(f"Unable to get info of tables: {', '.join(missing_tables)}")
+
+        final_str = "\n\n".join(tables_info[key] for key in loaders)
         return final_str
 
     def get_table_columns(self, table_name: str) -> List[str]:
@@ -123,12 +156,21 @@ class SQLAgent:
         return info
 
     def _get_sample_rows(self, table: str, fields: List[str]) -> str:
-        command = f"select {','.join(fields)} from {table} limit {self._sample_rows_in_table_info};"
+        # it is called by workers of metadata catalog: query is sent to handler, without the shared executor
+        integration, table_name = table.split('.')
+        query = Select(
+            targets=[Identifier(field) for field in fields],
+            from_table=Identifier(table_name),
+            limit=Constant(self._sample_rows_in_table_info)
+        )
         try:
-            ret = self._call_engine(command)
-            sample_rows = ret.data
+            handler = self._integration_controller.get_data_handler(integration)
+            response = handler.query(query)
+            if response.error_message is not None:
+                raise Exception(response.error_message)
+            sample_rows = response.data_frame.values.tolist()
             sample_rows = list(
-                map(lambda ls: [str(i) if len(str(i)) < 100 else str[:100] + '...' for i in ls], sample_rows))
+                map(lambda ls: [str(i) if len(str(i)) < 100 else str(i)[:100] + '...' for i in ls], sample_rows))
             sample_rows_str = "\n" + "\n".join(["\t".join(row) for row in sample_rows])
         except Exception:
             sample_rows_str = "\n" + "\t [error] Couldn't retrieve sample rows!"
@@ -1,5 +1,9 @@
 import copy
+import threading
 import traceback
+from time import time
+from typing import List, Tuple
+
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Data, Identifier
 from mindsdb_sql.planner.utils import query_traversal
@@ -11,22 +15,54 @@ from mindsdb.api.executor.command_executor import ExecuteCommands
 
 from mindsdb.interfaces.database.projects import ProjectController
 from mindsdb.utilities import log
+from mindsdb.utilities.config import Config
 from mindsdb.interfaces.tasks.task import BaseTask
 from mindsdb.utilities.context import context as ctx
+from mindsdb.metrics import metrics
 
 logger = log.getLogger(__name__)
 
 
 class TriggerTask(BaseTask):
+    """ Executes query of trigger for changed rows of the table
+
+        Changed rows are collected in batches, query is executed once for the batch
+        and TABLE_DELTA contains all rows of it. Batch is executed when it has 'batch_size' rows
+        or when its first row waits longer than 'batch_window'.
+
+        Config ('triggers' section):
+            batch_size (int): max count of rows in batch, 1 - execute query for every row
+            batch_window (float): how long (in seconds) rows are collected
+            max_pending_rows (int): max count of received rows which are not processed yet,
+                if it is reached then the handler is blocked until rows are processed
+    """
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.command_executor = None
         self.query = None
 
+        config = Config().get('triggers', {})
+        self.batch_size = config.get('batch_size', 100)
+        self.batch_window = config.get('batch_window', 1)
+        self.max_pending_rows = config.get('max_pending_rows', 10000)
+
+        # changed rows with time when they were received: [(row, received_at)]
+        self._rows = []
+        self._rows_lock = threading.Lock()
+        # notified when rows are taken from the buffer
+        self._rows_taken = threading.Condition(self._rows_lock)
+        self._batch_event = threading.Event()
+        self._subscribe_finished = threading.Event()
+        self._stop_event = threading.Event()
+        self._process_error = None
+        self._metric_labels = (str(self.object_id),)
+
         # callback might be without context
         self._ctx_dump = ctx.dump()
 
     def run(self, stop_event):
+        self._stop_event = stop_event
         trigger = db.Triggers.query.get(self.object_id)
 
         # parse query
@@ -42,9 +78,9 @@ class TriggerTask(BaseTask):
 
         self.command_executor = ExecuteCommands(session)
 
-        # subscribe
+        # subscribe. Handler is used until the task is stopped, it doesn't take place in the pool
         database = session.integration_controller.get_by_id(trigger.database_id)
-        data_handler = session.integration_controller.get_data_handler(database['name'])
+        data_handler = session.integration_controller.get_data_handler(database['name'], pooled=False)
 
         columns = trigger.columns
         if columns is not None:
@@ -53,21 +89,104 @@ class TriggerTask(BaseTask):
             else:
                 columns = columns.split('|')
 
-        data_handler.subscribe(stop_event, self._callback, trigger.table_name, columns=columns)
+        process_thread = threading.Thread(target=self._process_rows, name=f'trigger_{self.object_id}')
+        process_thread.start()
+        try:
+            data_handler.subscribe(stop_event, self._callback, trigger.table_name, columns=columns)
+        finally:
+            # rows which were received before the stop are processed
+            self._subscribe_finished.set()
+            self._batch_event.set()
+            process_thread.join()
+            try:
+                data_handler.disconnect()
+            except Exception:
+                pass
+
+        if self._process_error is not None:
+            # rows which were not processed are lost, task is restarted by task monitor
+            with self._rows_lock:
+                lost, self._rows = len(self._rows), []
+            metrics.TRIGGER_PENDING_ROWS.labels(*self._metric_labels).dec(lost)
+            raise self._process_error
 
     def _callback(self, row, key=None):
         logger.debug(f'trigger call: {row}, {key}')
 
-        # set up environment
+        if key is not None:
+            row.update(key)
+
+        with self._rows_lock:
+            # backpressure: handler waits until the query processes rows
+            while (
+                len(self._rows) >= self.max_pending_rows
+                and self._process_error is None
+                and not self._stop_event.is_set()
+            ):
+                self._rows_taken.wait(1)
+            if self._process_error is not None:
+                # rows are not processed anymore, subscription is being stopped
+                return
+            self._rows.append((row, time()))
+            rows_count = len(self._rows)
+        metrics.TRIGGER_PENDING_ROWS.labels(*self._metric_labels).inc()
+
+        if rows_count >= self.batch_size:
+            self._batch_event.set()
+
+    def _take_batch(self, force: bool = False) -> Tuple[List[tuple], float]:
+        """ Get rows of the next batch if it is ready
+
+            Args:
+                force (bool): get rows even if batch is not full and its window is not over
+
+            Returns:
+                Tuple[List[tuple], float]: rows of batch and time to wait for the batch if it is not ready
+        """
+        with self._rows_lock:
+            if len(self._rows) == 0:
+                return [], self.batch_window
+
+            wait_time = self._rows[0][1] + self.batch_window - time()
+            if not force and len(self._rows) < self.batch_size and wait_time > 0:
+                return [], wait_time
+
+            batch = self._rows[:self.batch_size]
+            del self._rows[:self.batch_size]
+            self._rows_taken.notify_all()
+        metrics.TRIGGER_PENDING_ROWS.labels(*self._metric_labels).dec(len(batch))
+        return batch, 0
+
+    def _process_rows(self):
+        # query is executed in this thread: callback can be called by several threads of handler
         ctx.load(self._ctx_dump)
-
         try:
-            if key is not None:
-                row.update(key)
-            table = [
-                row
-            ]
+            while True:
+                # event is cleared before check: a batch filled during the check will wake up the next wait
+                self._batch_event.clear()
+                is_finished = self._subscribe_finished.is_set()
+
+                batch, wait_time = self._take_batch(force=is_finished)
+                if len(batch) > 0:
+                    self._execute_batch(batch)
+                    continue
+                if is_finished:
+                    return
+                self._batch_event.wait(wait_time)
+        except Exception as e:
+            logger.error(f'Trigger {self.object_id} stopped processing of rows: {e}')
+            # subscription is stopped: without processing rows would pile up
+            with self._rows_lock:
+                self._process_error = e
+                self._rows_taken.notify_all()
+            self._stop_event.set()
+        finally:
+            db.session.remove()
+
+    def _execute_batch(self, batch: List[tuple]):
+        table = [row for row, _ in batch]
 
+        try:
             # inject data to query
             query = copy.deepcopy(self.query)
 
@@ -93,3 +212,8 @@ class TriggerTask(BaseTask):
             self.set_error(str(traceback.format_exc()))
 
         db.session.commit()
+        # handlers are not held by the thread between batches
+        self.command_executor.session.integration_controller.handlers_cache.checkin()
+
+        metrics.TRIGGER_BATCH_SIZE.labels(*self._metric_labels).observe(len(batch))
+        metrics.TRIGGER_LAG.labels(*self._metric_labels).observe(time() - batch[0][1])
@@ -2,7 +2,7 @@ from http import HTTPStatus
 import functools
 import time
 
-from prometheus_client import Histogram, Summary
+from prometheus_client import Counter, Gauge, Histogram, Summary
 
 
 INTEGRATION_HANDLER_QUERY_TIME = Summary(
@@ -17,6 +17,57 @@ INTEGRATION_HANDLER_RESPONSE_SIZE = Summary(
     ('integration', 'response_type')
 )
 
+CACHE_HITS = Counter(
+    'mindsdb_cache_hits',
+    'How many times a value was found in cache',
+    ('category',)
+)
+
+CACHE_MISSES = Counter(
+    'mindsdb_cache_misses',
+    'How many times a value was not found in cache',
+    ('category',)
+)
+
+CACHE_EVICTIONS = Counter(
+    'mindsdb_cache_evictions',
+    'How many values were removed from cache to fit its size limits',
+    ('category',)
+)
+
+HANDLERS_POOL_WAIT_TIME = Histogram(
+    'mindsdb_handlers_pool_wait_seconds',
+    'How long threads wait to check out a data handler from the pool',
+    ('integration',)
+)
+
+HANDLERS_POOL_CONNECTIONS = Gauge(
+    'mindsdb_handlers_pool_connections',
+    'How many data handlers are in the pool, grouped by state (idle or in_use)',
+    ('integration', 'state'),
+    multiprocess_mode='livesum'
+)
+
+TRIGGER_LAG = Histogram(
+    'mindsdb_trigger_lag_seconds',
+    'Time from receiving of a changed row to the end of execution of trigger query for it '
+    '(the oldest row of the batch)',
+    ('trigger',)
+)
+
+TRIGGER_BATCH_SIZE = Summary(
+    'mindsdb_trigger_batch_size',
+    'How many changed rows are passed to one execution of trigger query',
+    ('trigger',)
+)
+
+TRIGGER_PENDING_ROWS = Gauge(
+    'mindsdb_trigger_pending_rows',
+    'How many changed rows wait for execution of trigger query',
+    ('trigger',),
+    multiprocess_mode='livesum'
+)
+
 _REST_API_LATENCY = Histogram(
     'mindsdb_rest_api_latency_seconds',
     'How long REST API requests take to complete, grouped by method, endpoint, and status',
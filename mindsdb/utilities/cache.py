@@ -19,7 +19,11 @@ How to use it:
 Configuration:
 
 - max_size size of cache in count of records, default is 50
+- max_bytes size of cache in bytes, default is not limited (only for local cache)
 - serializer, module for serialization, default is dill
+- row_cache, cache predictions of models by rows, default is false.
+    Can be enabled for a query: `select ... using row_cache=true`. Useful only for deterministic models
+- row_cache_max_rows, count of rows to keep in cache of predictions by rows (of all models), default is 1000000
 
 It can be set via:
 - get_cache function:
@@ -29,9 +33,16 @@ It can be set via:
 - using mindsdb config file:
     "cache": {
         "type": "redis",
-        "max_size": 2
+        "max_size": 2,
+        "max_bytes": 104857600
     }
 
+Local cache is LRU: the least recently used records are removed first.
+Metadata of cached files (size, last access) is kept in memory and re-read from disk periodically.
+
+Metrics:
+    hits, misses and evictions of cache are counted in prometheus counters, labeled by category
+
 Cache engines:
 
 Can be specified in mindsdb config json. Possible values:
@@ -54,8 +65,10 @@ How to test:
 
 import os
 import time
+import threading
 from abc import ABC
 from pathlib import Path
+from collections import OrderedDict
 import hashlib
 import typing as t
 
@@ -66,11 +79,42 @@ from mindsdb.utilities.config import Config
 from mindsdb.utilities.json_encoder import CustomJSONEncoder
 from mindsdb.interfaces.storage.fs import FileLock
 from mindsdb.utilities.context import context as ctx
+from mindsdb.metrics import metrics
+
+
+def _typed_value(value, encoder=CustomJSONEncoder()) -> str:
+    """ Value of object column as string with its type: 1 and '1', None and 'None' have to be different
+    """
+    if isinstance(value, (list, dict)) or hasattr(value, '__array__'):
+        value = encoder.encode(value)
+    return f'{type(value).__name__}:{value}'
+
+
+def rows_hash(df: pd.DataFrame) -> pd.Series:
+    """ 64-bit hash of every row of dataframe. Index of dataframe and names of columns are not used
+    """
+    columns = {}
+    converted = False
+    for i in range(len(df.columns)):
+        series = df.iloc[:, i]
+        if series.dtype == object and pd.api.types.infer_dtype(series, skipna=False) != 'string':
+            # pandas hashes mixed or unhashable values by str(value) and loses their types
+            series = series.map(_typed_value)
+            converted = True
+        columns[i] = series
+    if converted:
+        df = pd.DataFrame(columns)
+    return pd.util.hash_pandas_object(df, index=False)
 
 
 def dataframe_checksum(df: pd.DataFrame):
-    checksum = str_checksum(df.to_json())
-    return checksum
+    """ Checksum of dataframe content. Rows are hashed vectorized by pandas,
+        hashes of rows, names and types of columns are hashed by sha256
+    """
+    header = CustomJSONEncoder().encode([[str(col), str(dtype)] for col, dtype in zip(df.columns, df.dtypes)])
+    hasher = hashlib.sha256(header.encode())
+    hasher.update(rows_hash(df).values.tobytes())
+    return hasher.hexdigest()
 
 
 def json_checksum(obj: t.Union[dict, list]):
@@ -99,12 +143,32 @@ class BaseCache(ABC):
 
     # default functions
 
+    def _count_get(self, value):
+        if value is None:
+            metrics.CACHE_MISSES.labels(self.category).inc()
+        else:
+            metrics.CACHE_HITS.labels(self.category).inc()
+        return value
+
+    def _count_evictions(self, count):
+        if count > 0:
+            metrics.CACHE_EVICTIONS.labels(self.category).inc(count)
+
     def set_df(self, name, df):
         return self.set(name, df)
 
     def get_df(self, name):
         return self.get(name)
 
+    def set_many(self, values: dict):
+        for name, value in values.items():
+            self.set(name, value)
+
+    def get_many(self, names: list) -> list:
+        """ values of records in order of names, None for missed records
+        """
+        return [self.get(name) for name in names]
+
     def serialize(self, value):
         return self.serializer.dumps(value)
 
@@ -112,13 +176,85 @@ class BaseCache(ABC):
         return self.serializer.loads(value)
 
 
+class FileCacheIndex:
+    """ In-memory metadata of cache directory: size of files in order of access (LRU first).
+        It is shared between FileCache instances of the process and re-read from disk
+        periodically to take into account changes made by other processes
+    """
+    rescan_interval = 60
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.files = OrderedDict()
+        self.total_bytes = 0
+        self.scanned_at = None
+
+    def scan(self):
+        files = []
+        for file in self.path.iterdir():
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, file.name, stat.st_size))
+        files.sort()
+
+        with self.lock:
+            self.files = OrderedDict((name, size) for _, name, size in files)
+            self.total_bytes = sum(self.files.values())
+            self.scanned_at = time.time()
+
+    def is_outdated(self) -> bool:
+        return self.scanned_at is None or time.time() - self.scanned_at > self.rescan_interval
+
+    def count(self) -> int:
+        return len(self.files)
+
+    def touch(self, name: str, size: int = None):
+        with self.lock:
+            if size is None:
+                if name not in self.files:
+                    return
+                self.files.move_to_end(name)
+                return
+            self.total_bytes += size - self.files.pop(name, 0)
+            self.files[name] = size
+
+    def remove(self, name: str):
+        with self.lock:
+            self.total_bytes -= self.files.pop(name, 0)
+
+    def get_lru(self) -> t.Optional[str]:
+        with self.lock:
+            if len(self.files) == 0:
+                return None
+            return next(iter(self.files))
+
+
+_file_cache_indexes = {}
+_file_cache_indexes_lock = threading.Lock()
+
+
+def get_file_cache_index(path: Path) -> FileCacheIndex:
+    with _file_cache_indexes_lock:
+        if path not in _file_cache_indexes:
+            _file_cache_indexes[path] = FileCacheIndex(path)
+        return _file_cache_indexes[path]
+
+
 class FileCache(BaseCache):
-    def __init__(self, category, path=None, **kwargs):
+    def __init__(self, category, path=None, max_bytes=None, **kwargs):
         super().__init__(**kwargs)
 
         if path is None:
             path = self.config['paths']['cache']
 
+        if max_bytes is None:
+            max_bytes = self.config['cache'].get('max_bytes')
+        self.max_bytes = max_bytes
+
+        self.category = category
         cache_path = Path(path) / category
 
         company_id = ctx.company_id
@@ -127,32 +263,65 @@ class FileCache(BaseCache):
         cache_path.mkdir(parents=True, exist_ok=True)
 
         self.path = cache_path
+        self.index = get_file_cache_index(cache_path)
+        if self.index.is_outdated():
+            self.index.scan()
 
-    def clear_old_cache(self):
-        with FileLock(self.path):
-            # buffer to delete, to not run delete on every adding
-            buffer_size = 5
+    def _is_oversized(self, buffer_size=0):
+        if self.max_size is not None and self.index.count() > self.max_size + buffer_size:
+            return True
+        if self.max_bytes is not None and self.index.total_bytes > self.max_bytes:
+            return True
+        return False
 
-            if self.max_size is None:
-                return
+    def clear_old_cache(self):
+        # buffer to delete, to not run delete on every adding
+        buffer_size = 5
 
-            cur_count = len(os.listdir(self.path))
+        # check in-memory index without access to disk
+        if not self._is_oversized(buffer_size):
+            return
 
-            if cur_count > self.max_size + buffer_size:
+        with FileLock(self.path):
+            if self.index.is_outdated():
+                self.index.scan()
+
+            evicted = 0
+            while self._is_oversized():
+                name = self.index.get_lru()
+                if name is None:
+                    break
                 try:
-                    files = sorted(Path(self.path).iterdir(), key=os.path.getmtime)
-                    for file in files[:cur_count - self.max_size]:
-                        self.delete_file(file)
+                    self.delete_file(self.file_path(name))
+                    evicted += 1
                 except FileNotFoundError:
-                    pass
+                    self.index.remove(name)
+            self._count_evictions(evicted)
 
     def file_path(self, name):
         return self.path / name
 
+    def _file_added(self, name, clear=True):
+        path = self.file_path(name)
+        try:
+            self.index.touch(name, os.path.getsize(path))
+        except FileNotFoundError:
+            pass
+        if clear:
+            self.clear_old_cache()
+
+    def _file_used(self, name):
+        # update access time for LRU: in memory and on disk (for other processes)
+        self.index.touch(name)
+        try:
+            os.utime(self.file_path(name))
+        except FileNotFoundError:
+            pass
+
     def set_df(self, name, df):
         path = self.file_path(name)
         df.to_pickle(path)
-        self.clear_old_cache()
+        self._file_added(name)
 
     def set(self, name, value):
         path = self.file_path(name)
@@ -160,26 +329,51 @@ class FileCache(BaseCache):
 
         with open(path, 'wb') as fd:
             fd.write(value)
+        self._file_added(name)
+
+    def set_many(self, values: dict):
+        for name, value in values.items():
+            with open(self.file_path(name), 'wb') as fd:
+                fd.write(self.serialize(value))
+            self._file_added(name, clear=False)
         self.clear_old_cache()
 
+    def get_many(self, names: list) -> list:
+        raw_values = []
+        with FileLock(self.path):
+            for name in names:
+                try:
+                    with open(self.file_path(name), 'rb') as fd:
+                        raw_values.append(fd.read())
+                except FileNotFoundError:
+                    raw_values.append(None)
+                    continue
+                self._file_used(name)
+        return [
+            self._count_get(None if value is None else self.deserialize(value))
+            for value in raw_values
+        ]
+
     def get_df(self, name):
         path = self.file_path(name)
         with FileLock(self.path):
             if not os.path.exists(path):
-                return None
+                return self._count_get(None)
             value = pd.read_pickle(path)
-        return value
+            self._file_used(name)
+        return self._count_get(value)
 
     def get(self, name):
         path = self.file_path(name)
 
         with FileLock(self.path):
             if not os.path.exists(path):
-                return None
+                return self._count_get(None)
             with open(path, 'rb') as fd:
                 value = fd.read()
+            self._file_used(name)
         value = self.deserialize(value)
-        return value
+        return self._count_get(value)
 
     def delete(self, name):
         path = self.file_path(name)
@@ -187,6 +381,7 @@ class FileCache(BaseCache):
 
     def delete_file(self, path):
         os.unlink(path)
+        self.index.remove(Path(path).name)
 
 
 class RedisCache(BaseCache):
@@ -205,8 +400,9 @@ class RedisCache(BaseCache):
         if self.max_size is None:
             return
 
-        # buffer to delete, to not run delete on every adding
-        buffer_size = 5
+        # buffer to delete, to not run delete on every adding.
+        # For big caches (rows of predictions) it is proportional to size: all keys are read on delete
+        buffer_size = max(5, self.max_size // 100)
 
         cur_count = self.client.hlen(self.category)
 
@@ -222,6 +418,7 @@ class RedisCache(BaseCache):
 
             for key, _ in keys[:cur_count - self.max_size]:
                 self.delete_key(key)
+            self._count_evictions(cur_count - self.max_size)
 
     def redis_key(self, name):
         return f'{self.category}_{name}'
@@ -241,8 +438,32 @@ class RedisCache(BaseCache):
         value = self.client.get(key)
         if value is None:
             # no value in cache
-            return None
-        return self.deserialize(value)
+            return self._count_get(None)
+        return self._count_get(self.deserialize(value))
+
+    def set_many(self, values: dict):
+        if len(values) == 0:
+            return
+        timestamp = int(time.time() * 1000)
+        keys = {}
+        pipe = self.client.pipeline()
+        for name, value in values.items():
+            key = self.redis_key(name)
+            pipe.set(key, self.serialize(value))
+            keys[key] = timestamp
+        pipe.hset(self.category, mapping=keys)
+        pipe.execute()
+
+        self.clear_old_cache(None)
+
+    def get_many(self, names: list) -> list:
+        if len(names) == 0:
+            return []
+        values = self.client.mget([self.redis_key(name) for name in names])
+        return [
+            self._count_get(None if value is None else self.deserialize(value))
+            for value in values
+        ]
 
     def delete(self, name):
         key = self.redis_key(name)
@@ -267,6 +488,12 @@ class NoCache:
     def set(self, name, value):
         pass
 
+    def get_many(self, names):
+        return [None] * len(names)
+
+    def set_many(self, values):
+        pass
+
 
 def get_cache(category, **kwargs):
     config = Config()
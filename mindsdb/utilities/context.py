@@ -1,11 +1,23 @@
-
 from contextvars import ContextVar
 from typing import Any
 from copy import deepcopy
 
 
+def _default_profiling() -> dict:
+    return {
+        'level': 0,
+        'enabled': False,
+        'pointer': None,
+        'tree': None
+    }
+
+
 class Context:
     ''' Thread independent storage
+
+        Storage is copy-on-write: setting of attribute makes a shallow copy of the storage,
+        values are shared between copies and must not be changed in place (set a new value instead).
+        The only exception is 'profiling', it is never shared between snapshots.
     '''
     __slots__ = ('_storage',)
 
@@ -17,12 +29,7 @@ class Context:
         self._storage.set({
             'company_id': None,
             'user_class': 0,
-            'profiling': {
-                'level': 0,
-                'enabled': False,
-                'pointer': None,
-                'tree': None
-            }
+            'profiling': _default_profiling()
         })
 
     def __getattr__(self, name: str) -> Any:
@@ -32,22 +39,45 @@ class Context:
         return storage[name]
 
     def __setattr__(self, name: str, value: Any) -> None:
-        storage = deepcopy(self._storage.get({}))
+        storage = self._storage.get({}).copy()
         storage[name] = value
         self._storage.set(storage)
 
     def __delattr__(self, name: str) -> None:
-        storage = deepcopy(self._storage.get({}))
+        storage = self._storage.get({}).copy()
         if name not in storage:
             raise AttributeError(name)
-        del storage['name']
+        del storage[name]
         self._storage.set(storage)
 
-    def dump(self) -> dict:
-        storage = deepcopy(self._storage.get({}))
-        return storage
+    def dump(self, with_profiling: bool = False) -> dict:
+        ''' Snapshot of the context to load it in other thread or process
+
+            Args:
+                with_profiling (bool): add profiling data to the snapshot, it is skipped by default:
+                    profiling tree of a query can be big and it can't be changed from other threads
+
+            Returns:
+                dict: picklable snapshot
+        '''
+        storage = self._storage.get({})
+        snapshot = {key: value for key, value in storage.items() if key != 'profiling'}
+        if with_profiling and 'profiling' in storage:
+            snapshot['profiling'] = deepcopy(storage['profiling'])
+        return snapshot
 
     def load(self, storage: dict) -> None:
+        ''' Set the context from snapshot, profiling is disabled if the snapshot doesn't have it
+
+            Args:
+                storage (dict): snapshot created by dump()
+        '''
+        storage = storage.copy()
+        if 'profiling' in storage:
+            # the same snapshot can be loaded in several threads
+            storage['profiling'] = deepcopy(storage['profiling'])
+        else:
+            storage['profiling'] = _default_profiling()
         self._storage.set(storage)
 
 
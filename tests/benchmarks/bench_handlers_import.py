@@ -0,0 +1,60 @@
+"""
+Compares server startup with lazy import of handlers (only metadata is read at start)
+and with import of all handlers at start (previous behaviour of IntegrationController)
+
+Every run is made in a new process, it is measured:
+    - time of creation of integration_controller
+    - count of loaded modules
+    - time of first use of a handler
+
+Usage:
+    python -m tests.benchmarks.bench_handlers_import [repeats] [handler]
+"""
+import json
+import subprocess
+import sys
+
+CODE = '''
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from mindsdb.interfaces.database.integrations import integration_controller
+if {eager}:
+    integration_controller._import_all_handlers()
+startup_time = time.perf_counter() - start
+modules_count = len(sys.modules)
+
+start = time.perf_counter()
+integration_controller.handler_modules.get({handler!r})
+first_use_time = time.perf_counter() - start
+
+print(json.dumps([startup_time, modules_count, first_use_time]))
+'''
+
+
+def measure(eager, handler):
+    output = subprocess.run(
+        [sys.executable, '-c', CODE.format(eager=eager, handler=handler)],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeats, handler):
+    for name, eager in (('import all', True), ('lazy', False)):
+        results = [measure(eager, handler) for _ in range(repeats)]
+        startup_time = min(r[0] for r in results)
+        modules_count = results[0][1]
+        first_use_time = min(r[2] for r in results)
+        print(
+            f'{name:>10}: startup {startup_time:.2f}s, {modules_count} modules, '
+            f'first use of {handler}: {first_use_time * 1000:.1f}ms'
+        )
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    handler = sys.argv[2] if len(sys.argv) > 2 else 'mysql'
+    run(repeats, handler)
@@ -0,0 +1,80 @@
+"""
+Compares templating of prompts for LLM handlers: column by column with apply (previous implementation)
+and compiled template rendered over whole columns, on templates with different count of placeholders
+
+Usage:
+    python -m tests.benchmarks.bench_llm_prompts [rows] [repeats]
+"""
+import re
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.integrations.libs.llm.utils import get_completed_prompts
+
+
+def get_completed_prompts_apply(base_template, df):
+    # previous implementation
+    columns = []
+    spans = []
+    matches = list(re.finditer("{{(.*?)}}", base_template))
+
+    first_span = matches[0].start()
+    last_span = matches[-1].end()
+
+    for m in matches:
+        columns.append(m[0].replace('{', '').replace('}', ''))
+        spans.extend((m.start(), m.end()))
+
+    spans = spans[1:-1]
+    template = [base_template[s:e] for s, e in list(zip(spans, spans[1:]))[::2]]
+    template.insert(0, base_template[0:first_span])
+    template.append(base_template[last_span:])
+
+    empty_prompt_ids = np.where(df[columns].isna().all(axis=1).values)[0]
+
+    df['__mdb_prompt'] = ''
+    for i in range(len(template)):
+        atom = template[i]
+        if i < len(columns):
+            col = df[columns[i]].replace(to_replace=[None], value='')
+            df['__mdb_prompt'] = df['__mdb_prompt'].apply(lambda x: x + atom) + col.astype("string")
+        else:
+            df['__mdb_prompt'] = df['__mdb_prompt'].apply(lambda x: x + atom)
+    prompts = list(df['__mdb_prompt'])
+
+    return prompts, empty_prompt_ids
+
+
+def make_workload(rows, placeholders):
+    columns = 5
+    df = pd.DataFrame({
+        f'col_{i}': np.random.choice(['short text', 'a bit longer text of the row', None], rows)
+        for i in range(columns)
+    })
+    template = 'Answer the question using the context.\n' + '\n'.join(
+        f'field {i}: {{{{col_{i % columns}}}}}' for i in range(placeholders)
+    ) + '\nAnswer:'
+    return template, df
+
+
+def run(rows, repeats):
+    for placeholders in (1, 5, 20):
+        template, df = make_workload(rows, placeholders)
+        for name, fnc in (
+            ('apply', get_completed_prompts_apply),
+            ('compiled', get_completed_prompts),
+        ):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                fnc(template, df.copy())
+            elapsed = (time.perf_counter() - start) / repeats
+            print(f'{placeholders:>3} placeholders {name:>9}: {rows} rows, {elapsed * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    run(rows, repeats)
@@ -0,0 +1,74 @@
+"""
+Compares per value encoding of rows for DataRow messages (previous implementation of
+PostgresProxyHandler.to_postgres_rows) with encoding by columns
+
+Usage:
+    python -m tests.benchmarks.bench_postgres_rows [rows] [repeats]
+"""
+import datetime as dt
+import json
+import sys
+import time
+
+import numpy as np
+
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES, POSTGRES_FORMAT
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_row_encoder import encode_rows
+
+
+def encode_per_value(rows, charset='utf8'):
+    # previous implementation
+    p_rows = []
+    for row in rows:
+        p_row = []
+        for column in row:
+            if column is None:
+                column = ""
+            elif type(column) == int or type(column) == float:
+                column = str(column)
+            elif type(column) == list or type(column) == dict:
+                column = json.dumps(column)
+            if isinstance(column, dt.date) or isinstance(column, dt.datetime):
+                column = dt.datetime.strftime(column, '%Y-%m-%d')
+            if isinstance(column, bool):
+                column = "true" if column else "false"
+            p_row.append(column.encode(encoding=charset))
+        p_rows.append(p_row)
+    return p_rows
+
+
+def make_rows(count):
+    start = dt.datetime(2020, 1, 1)
+    return [
+        [i, float(i) / 3, f'name {i}', start + dt.timedelta(minutes=i), None if i % 10 == 0 else 'x']
+        for i in np.arange(count).tolist()
+    ]
+
+
+COLUMNS = [
+    {'name': 'id', 'type': POSTGRES_TYPES.LONG},
+    {'name': 'value', 'type': POSTGRES_TYPES.DOUBLE},
+    {'name': 'name', 'type': POSTGRES_TYPES.VARCHAR},
+    {'name': 'created_at', 'type': POSTGRES_TYPES.DATETIME},
+    {'name': 'tag', 'type': POSTGRES_TYPES.VARCHAR},
+]
+
+
+def run(count, repeats):
+    rows = make_rows(count)
+    for name, fnc in (
+        ('per value', lambda: encode_per_value(rows)),
+        ('text', lambda: encode_rows(rows, COLUMNS)),
+        ('binary', lambda: encode_rows(rows, COLUMNS, format_codes=[POSTGRES_FORMAT.BINARY])),
+    ):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fnc()
+        elapsed = (time.perf_counter() - start) / repeats
+        print(f'{name:>10}: {count} rows, {elapsed * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    run(count, repeats)
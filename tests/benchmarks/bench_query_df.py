@@ -0,0 +1,76 @@
+"""
+Compares duckdb connection per query (with pandas scan) and persistent connection with arrow registration
+on join and filter workloads of the executor
+
+Usage:
+    python -m tests.benchmarks.bench_query_df [rows] [repeats]
+"""
+import sys
+import time
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.executor.utilities.sql import query_df_with_type_infer_fallback
+
+
+def make_df(rows, prefix):
+    return pd.DataFrame({
+        f'{prefix}_id': np.arange(rows),
+        f'{prefix}_a': np.random.rand(rows),
+        # 'object' columns: duckdb has to infer their types
+        f'{prefix}_b': pd.Series(np.random.randint(0, 1000, rows), dtype=object),
+        f'{prefix}_c': np.random.choice(['x', 'y', 'z'], rows).astype(object),
+    })
+
+
+def query_per_connection(query_str, dataframes):
+    # previous implementation: new connection and pandas scan for every query
+    for name, value in dataframes.items():
+        locals()[name] = value
+
+    con = duckdb.connect(database=':memory:')
+    con.execute('set global pandas_analyze_sample=1000;')
+    result_df = con.execute(query_str).fetchdf()
+    description = con.description
+    con.close()
+    return result_df, description
+
+
+def workloads(rows):
+    table_a = make_df(rows, 'A')
+    table_b = make_df(rows // 10, 'B')
+    return {
+        'join': (
+            'SELECT * FROM table_a JOIN table_b ON table_a.A_id = table_b.B_id',
+            {'table_a': table_a, 'table_b': table_b}
+        ),
+        'filter': (
+            "SELECT A_id, A_b FROM df WHERE A_c = 'x' AND A_a > 0.5",
+            {'df': table_a}
+        ),
+        'small filter': (
+            "SELECT * FROM df WHERE B_c = 'y'",
+            {'df': table_b.head(100)}
+        ),
+    }
+
+
+def run(rows, repeats):
+    for workload, (query_str, dataframes) in workloads(rows).items():
+        for name, fnc in (
+            ('per query', query_per_connection),
+            ('persistent', query_df_with_type_infer_fallback),
+        ):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                fnc(query_str, dataframes)
+            elapsed = (time.perf_counter() - start) / repeats
+            print(f'{workload:>12} {name:>10}: {rows} rows, {elapsed * 1000:.2f}ms per query')
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(rows, repeats)
@@ -0,0 +1,62 @@
+"""
+Compares list-backed and columnar (dataframe-backed) ResultSet on typical executor operations
+
+Usage:
+    python -m tests.benchmarks.bench_result_set [rows]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+
+
+def make_df(rows):
+    return pd.DataFrame({
+        'id': np.arange(rows),
+        'a': np.random.rand(rows),
+        'b': np.random.randint(0, 1000, rows),
+        'c': np.random.choice(['x', 'y', 'z'], rows),
+    })
+
+
+def make_list_result_set(df):
+    result = ResultSet()
+    for col in df.columns:
+        result.add_column(Column(name=col, table_name='t', database='db'))
+    result.add_records_raw(df.to_dict(orient='split')['data'])
+    return result
+
+
+def make_columnar_result_set(df):
+    return ResultSet().from_df(df, database='db', table_name='t')
+
+
+def pipeline(result_set):
+    # the same sequence of calls as in: join -> add row id -> join -> project
+    result = result_set
+    for _ in range(2):
+        df, col_names = result.to_df_cols(prefix='A')
+        result = ResultSet().from_df_cols(df, col_names)
+        result.add_column(Column(name='__mindsdb_row_id'), list(range(result.length())))
+        result.del_column(result.find_columns('__mindsdb_row_id')[0])
+    return result.to_df()
+
+
+def run(rows):
+    df = make_df(rows)
+    for name, factory in (
+        ('list', make_list_result_set),
+        ('columnar', make_columnar_result_set),
+    ):
+        start = time.perf_counter()
+        pipeline(factory(df))
+        elapsed = time.perf_counter() - start
+        print(f'{name:>10}: {rows} rows, {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run(rows)
@@ -276,6 +276,10 @@ class BaseExecutorTest(BaseUnitTest):
         r = self.db.Integration.query.filter_by(name=name).first()
         if r is not None:
             self.db.session.delete(r)
+        # handlers and metadata of the previous integration must not be reused
+        from mindsdb.interfaces.database.metadata_catalog import metadata_catalog
+        self.command_executor.session.integration_controller.handlers_cache.delete(name)
+        metadata_catalog.invalidate(name)
 
         # create
         r = self.db.Integration(
@@ -452,6 +456,8 @@ class BaseExecutorMockPredictor(BaseExecutorTest):
             explain_arr = []
             if isinstance(data, dict):
                 data = [data]
+            elif isinstance(data, pd.DataFrame):
+                data = data.to_dict(orient="records")
 
             predicted_value = predictor["predicted_value"]
             target = predictor["predict"]
@@ -3,6 +3,7 @@ import psycopg
 from psycopg.pq import ExecStatus
 from unittest.mock import patch, MagicMock, Mock
 from collections import OrderedDict
+from mindsdb_sql import parse_sql
 from mindsdb.integrations.handlers.postgres_handler.postgres_handler import PostgresHandler
 from mindsdb.integrations.libs.response import (
     HandlerResponse as Response,
@@ -18,6 +19,62 @@ class CursorContextManager(Mock):
         pass
 
 
+class FakeCursor:
+    """ Imitates cursors of postgres: named cursor is closed by commit or rollback of its connection """
+
+    def __init__(self, connection, data, name=None):
+        self.connection = connection
+        self.data = data
+        self.name = name
+        self.closed = False
+        self.position = 0
+        self.description = [Mock(type_code=23)]
+        self.description[0].name = 'a'
+        self.pgresult = Mock(status=ExecStatus.TUPLES_OK)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, query):
+        self.position = 0
+
+    def fetchmany(self, size):
+        if self.closed:
+            raise psycopg.errors.InvalidCursorName(f'cursor "{self.name}" does not exist')
+        rows = self.data[self.position:self.position + size]
+        self.position += size
+        return rows
+
+    def fetchall(self):
+        return self.fetchmany(len(self.data))
+
+
+class FakeConnection:
+    def __init__(self, data):
+        self.data = data
+        self.named_cursors = []
+        self.closed = False
+
+    def cursor(self, name=None):
+        cursor = FakeCursor(self, self.data, name=name)
+        if name is not None:
+            self.named_cursors.append(cursor)
+        return cursor
+
+    def commit(self):
+        for cursor in self.named_cursors:
+            cursor.closed = True
+        self.named_cursors = []
+
+    rollback = commit
+
+    def close(self):
+        self.closed = True
+
+
 class TestPostgresHandler(unittest.TestCase):
 
     dummy_connection_data = OrderedDict(
@@ -93,6 +150,36 @@ class TestPostgresHandler(unittest.TestCase):
         assert isinstance(data, Response)
         self.assertFalse(data.error_code)
 
+    def test_query_stream(self):
+        """
+        Tests that `query_stream` returns the result by batches and that queries executed
+        between reading of batches don't close the server-side cursor of the stream.
+        """
+        data = [[i] for i in range(5)]
+        connections = []
+
+        def connect_f(**kwargs):
+            connections.append(FakeConnection(data))
+            return connections[-1]
+
+        self.mock_connect.side_effect = connect_f
+        self.handler.connect()
+
+        stream = self.handler.query_stream(parse_sql('select a from tbl'), batch_size=2)
+        assert next(stream)['a'].tolist() == [0, 1]
+
+        # other query commits the connection of the handler
+        response = self.handler.native_query('select a from tbl')
+        assert response.data_frame['a'].tolist() == [0, 1, 2, 3, 4]
+
+        assert next(stream)['a'].tolist() == [2, 3]
+        assert [df['a'].tolist() for df in stream] == [[4]]
+
+        # the stream used its own connection and closed it
+        assert len(connections) == 2
+        assert not connections[0].closed
+        assert connections[1].closed
+
     def test_get_columns(self):
         """
         Checks if the `get_columns` method correctly constructs the SQL query and if it calls `native_query` with the correct query.
@@ -1,5 +1,6 @@
 import time
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 from mindsdb_sql import parse_sql
@@ -378,3 +379,157 @@ class TestHuggingface(BaseExecutorTest):
         )
 
         assert ret.error_code is None
+
+
+class FakeTokenizer:
+    # one token per word and two special tokens around the text
+    model_max_length = 5
+
+    def __call__(self, items):
+        return {"input_ids": [["<s>"] + item.split() + ["</s>"] for item in items]}
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+class FakePipeline:
+    """ Pipeline of text classification or fill-mask, without a model """
+
+    def __init__(self, task):
+        self.task = task
+        self.calls = []
+        self.tokenizer = FakeTokenizer()
+        self.model = SimpleNamespace(config=MagicMock(id2label={0: "LABEL_0", 1: "LABEL_1"}))
+        self.model.config.to_dict.return_value = {"max_position_embeddings": 5}
+
+    def save_pretrained(self, path):
+        pass
+
+    def __call__(self, items, batch_size=None, **kwargs):
+        self.calls.append((list(items), batch_size))
+        if "fail" in items:
+            raise RuntimeError("can't predict")
+
+        results = []
+        for item in items:
+            if self.task == "fill-mask":
+                results.append([{"sequence": item + " a", "score": 0.6}, {"sequence": item + " b", "score": 0.4}])
+            else:
+                label = "LABEL_1" if "spam" in item else "LABEL_0"
+                other = "LABEL_0" if label == "LABEL_1" else "LABEL_1"
+                results.append([{"label": label, "score": 0.9}, {"label": other, "score": 0.1}])
+        if self.task == "fill-mask" and len(items) == 1:
+            # result of single input is not wrapped
+            return results[0]
+        return results
+
+
+class TestHuggingfaceHandler:
+    """ Predict of the handler with fake pipeline: models are not downloaded """
+
+    def get_handler(self, task="text-classification", **kwargs):
+        from mindsdb.integrations.handlers.huggingface_handler.huggingface_handler import HuggingFaceHandler
+
+        args = {
+            "task": task,
+            "task_proper": task,
+            "model_name": "fake_model",
+            "input_column": "text",
+            "target": "pred",
+            "max_length": 5,
+            "labels_map": {"LABEL_0": "ham", "LABEL_1": "spam"},
+            **kwargs,
+        }
+        model_storage = MagicMock()
+        model_storage.json_get.return_value = args
+        handler = HuggingFaceHandler(model_storage=model_storage, engine_storage=MagicMock())
+        return handler, args
+
+    def test_batched_predict(self):
+        handler, _ = self.get_handler(batch_size=2)
+        pipeline = FakePipeline("text-classification")
+
+        texts = ["hello"] * 20
+        texts[3] = "spam"
+        texts[18] = "fail"
+        with patch("transformers.pipeline", return_value=pipeline):
+            pred = handler.predict(pd.DataFrame({"text": texts}))
+
+        # input is sent by chunks of batch_size * 8 items
+        assert [(len(items), batch_size) for items, batch_size in pipeline.calls[:2]] == [(16, 2), (4, 2)]
+        # failed chunk is predicted by rows
+        assert len(pipeline.calls) == 2 + 4
+
+        assert len(pred) == 20
+        assert pred["pred"][3] == "spam"
+        assert pred["pred"][0] == "ham"
+        assert pred["pred_explain"][3] == {"spam": 0.9, "ham": 0.1}
+        # only the failed row has error
+        assert pred["error"][18] == "can't predict"
+        assert pred["error"].isna().sum() == 19
+        assert pred["pred"][19] == "ham"
+
+    def test_truncation_policy(self):
+        long_text = "one two three four spam"
+        texts = [long_text] + ["hello"] * 16 + [long_text]
+
+        for policy, expected in (("left", "three four spam"), ("right", "one two three")):
+            handler, _ = self.get_handler(batch_size=2, truncation_policy=policy)
+            pipeline = FakePipeline("text-classification")
+            with patch("transformers.pipeline", return_value=pipeline):
+                pred = handler.predict(pd.DataFrame({"text": texts}))
+
+            # long text in both chunks is cut
+            assert pipeline.calls[0][0][0] == expected
+            assert pipeline.calls[1][0] == ["hello", expected]
+            assert "error" not in pred.columns
+
+        handler, _ = self.get_handler(batch_size=2, truncation_policy="strict")
+        pipeline = FakePipeline("text-classification")
+        with patch("transformers.pipeline", return_value=pipeline):
+            pred = handler.predict(pd.DataFrame({"text": texts}))
+
+        # long texts are not sent to the model
+        assert [items for items, _ in pipeline.calls] == [["hello"] * 15, ["hello"]]
+        assert pred["error"][0] == "Tokens count exceed model limit: 7 > 5"
+        assert pred["error"][17] == pred["error"][0]
+        assert pred["pred"][1:17].tolist() == ["ham"] * 16
+
+    def test_fill_mask_single_input(self):
+        handler, _ = self.get_handler(task="fill-mask")
+        pipeline = FakePipeline("fill-mask")
+        with patch("transformers.pipeline", return_value=pipeline):
+            pred = handler.predict(pd.DataFrame({"text": ["x [MASK]"]}))
+            assert pred["pred"].tolist() == ["x [MASK] a"]
+            assert pred["pred_explain"][0] == {"x [MASK] a": 0.6, "x [MASK] b": 0.4}
+
+            pred = handler.predict(pd.DataFrame({"text": ["x [MASK]", "y [MASK]"]}))
+            assert pred["pred"].tolist() == ["x [MASK] a", "y [MASK] a"]
+
+    def test_pipeline_reuse(self):
+        from mindsdb.integrations.handlers.huggingface_handler import huggingface_handler
+
+        handler, args = self.get_handler()
+        df = pd.DataFrame({"text": ["hello"]})
+
+        with patch("transformers.pipeline", side_effect=lambda **kwargs: FakePipeline("text-classification")) as load:
+            handler.predict(df)
+            handler.predict(df)
+            # pipeline is kept in the handler
+            assert load.call_count == 1
+
+            # model is created again
+            handler.create("pred", {"using": dict(args)})
+            assert load.call_count == 2
+            handler.predict(df)
+            assert load.call_count == 3
+
+            # model is finetuned
+            handler.base_model_storage = MagicMock()
+            handler.base_model_storage.json_get.return_value = dict(args)
+            handler.model_storage.folder_get.return_value = "/tmp/fake_model"
+            finetune_map = {"text-classification": lambda df, args: (MagicMock(), MagicMock())}
+            with patch.dict(huggingface_handler.FINETUNE_MAP, finetune_map):
+                handler.finetune(df, {})
+            handler.predict(df)
+            assert load.call_count == 4
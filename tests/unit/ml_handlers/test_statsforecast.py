@@ -1,5 +1,5 @@
 import time
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import numpy as np
 import pandas as pd
 import pytest
@@ -12,6 +12,7 @@ from mindsdb.integrations.handlers.statsforecast_handler.statsforecast_handler i
     choose_model,
     model_dict,
     get_insample_cv_results,
+    StatsForecastHandler,
 )
 from mindsdb_sql import parse_sql
 from tests.unit.ml_handlers.test_time_series_utils import create_mock_df
@@ -27,6 +28,92 @@ def test_choose_model():
     assert best_model.__class__.__name__ == "AutoTheta"
 
 
+class FakeModelStorage:
+    def __init__(self):
+        self.files = {}
+        self.file_get_calls = 0
+
+    def json_set(self, name, value):
+        self.files[name] = value
+
+    def json_get(self, name):
+        return self.files[name]
+
+    def file_set(self, name, value):
+        self.files[name] = value
+
+    def file_get(self, name):
+        self.file_get_calls += 1
+        return self.files[name]
+
+
+class TestStatsForecastHandler:
+    """ Handler is called directly, the fitted state is kept in it between predicts """
+
+    def create_model(self, **using):
+        model_storage = FakeModelStorage()
+        handler = StatsForecastHandler(model_storage=model_storage, engine_storage=MagicMock())
+        args = {
+            "timeseries_settings": {
+                "is_timeseries": True, "horizon": 3, "order_by": "time_col", "group_by": ["group_col"]
+            },
+            "using": using,
+        }
+        handler.create("target_col", create_mock_df(), args)
+        return model_storage
+
+    def predict(self, model_storage, groups):
+        df = create_mock_df()
+        handler = StatsForecastHandler(model_storage=model_storage, engine_storage=MagicMock())
+        return handler, handler.predict(df[df["group_col"].isin(groups)])
+
+    def test_predict_groups(self):
+        model_storage = self.create_model()
+
+        handler, result = self.predict(model_storage, ["b"])
+        assert list(result["group_col"]) == ["b"] * 3
+        assert list(round(result["target_col"])) == [42, 43, 44]
+
+        # only requested series are forecasted
+        with patch.object(StatsForecast, "predict", wraps=handler._fitted_state["sf"].predict) as predict:
+            handler.predict(create_mock_df())
+            predict.assert_called_once()
+        _, result_all = self.predict(model_storage, ["a", "b"])
+        assert len(result_all) == 6
+        assert np.allclose(result_all[result_all["group_col"] == "b"]["target_col"], result["target_col"])
+
+        # series is not in training data
+        df = create_mock_df()
+        df["group_col"] = "c"
+        result = handler.predict(df)
+        assert len(result) == 0
+        assert "target_col" in result.columns
+
+    def test_state_reuse(self):
+        model_storage = self.create_model()
+
+        handler, _ = self.predict(model_storage, ["a"])
+        loads = model_storage.file_get_calls
+        assert loads > 0
+
+        # fitted models and training data are loaded once
+        handler.predict(create_mock_df())
+        handler.predict(create_mock_df())
+        assert model_storage.file_get_calls == loads
+
+    def test_precompute_forecast(self):
+        model_storage = self.create_model(precompute_forecast=True)
+        assert "forecast_df" in model_storage.files
+
+        _, expected = self.predict(self.create_model(), ["a"])
+
+        # models are not used at predict
+        with patch.object(StatsForecast, "predict", side_effect=AssertionError("forecast is precomputed")):
+            _, result = self.predict(model_storage, ["a"])
+        assert list(result["group_col"]) == ["a"] * 3
+        assert np.allclose(result["target_col"], expected["target_col"])
+
+
 class TestStatsForecast(BaseExecutorTest):
     def wait_predictor(self, project, name):
         # wait
@@ -7,6 +7,7 @@ import warnings
 import tempfile
 import json
 import os
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -71,6 +72,10 @@ class TestCashe(unittest.TestCase):
         assert dataframe_checksum(df) == dataframe_checksum(df2)
         assert list(df.columns) == list(df2.columns)
 
+        # test many records
+        cache.set_many({'many_a': 1, 'many_b': [2]})
+        assert cache.get_many(['many_b', 'many_x', 'many_a']) == [[2], None, 1]
+
         # test delete
         cache.delete(name)
 
@@ -87,3 +92,89 @@ class TestCashe(unittest.TestCase):
         # get first, must be deleted
         df2 = cache.get('first')
         assert df2 is None
+
+    def test_file_max_bytes(self):
+        # imported here: modules can be reloaded by other tests, metrics of cache have to be the same
+        from mindsdb.metrics import metrics
+        from mindsdb.utilities.cache import FileCache as _FileCache
+
+        cache = _FileCache(f'test_max_bytes_{time.time()}', max_size=None, max_bytes=2500)
+        value = 'x' * 1000
+
+        evictions = metrics.CACHE_EVICTIONS.labels(cache.category)._value.get()
+        for name in ('a', 'b'):
+            cache.set(name, value)
+
+        # 'a' becomes recently used
+        assert cache.get('a') is not None
+        cache.set('c', value)
+
+        # 'b' is least recently used and removed to fit into size limit
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+        assert cache.index.total_bytes <= 2500
+        assert metrics.CACHE_EVICTIONS.labels(cache.category)._value.get() == evictions + 1
+        assert metrics.CACHE_MISSES.labels(cache.category)._value.get() == 1
+        assert metrics.CACHE_HITS.labels(cache.category)._value.get() == 3
+
+    def test_dataframe_checksum(self):
+        df = pd.DataFrame([
+            [1, 'x', [1, 2], {'a': 1}],
+            [2, 'y', [3], {'b': 2}],
+        ], columns=['a', 'b', 'c', 'd'])
+
+        assert dataframe_checksum(df) == dataframe_checksum(df.copy())
+
+        df2 = df.copy()
+        df2.loc[1, 'c'] = [4]
+        assert dataframe_checksum(df) != dataframe_checksum(df2)
+
+        # names of columns are used
+        assert dataframe_checksum(df) != dataframe_checksum(df.rename(columns={'a': 'z'}))
+
+        # types of values in object columns are used
+        def checksum(values):
+            return dataframe_checksum(pd.DataFrame({'a': values}))
+
+        assert checksum([1, 'x']) != checksum(['1', 'x'])
+        assert checksum([None, 'x']) != checksum(['None', 'x'])
+        assert checksum([[1, 2], 'x']) != checksum(['[1, 2]', 'x'])
+        assert checksum([1, 'x']) == checksum([1, 'x'])
+
+    def test_predict_row_cache(self):
+        from types import SimpleNamespace
+        from mindsdb.utilities.config import Config
+        from mindsdb.integrations.libs.ml_exec_base import BaseMLEngineExec
+
+        ml_exec = BaseMLEngineExec.__new__(BaseMLEngineExec)
+        ml_exec.config = Config()
+
+        predicted = []
+
+        def predict_df(model_name, predictor_record, df, args):
+            predicted.append(list(df['a']))
+            predictions = pd.DataFrame({'p': df['a'] * 2})
+            predictions['__mindsdb_row_id'] = df['__mindsdb_row_id']
+            return predictions
+
+        ml_exec._predict_df = predict_df
+        predictor_record = SimpleNamespace(id=int(time.time() * 1000), version=1, learn_args={})
+
+        df = pd.DataFrame({'a': [1, 2, 3], '__mindsdb_row_id': [1, 2, 3]})
+        ml_exec._predict_with_row_cache('m', predictor_record, df, {})
+
+        # only new rows are sent to model and stored in cache, predictions are merged in order of input
+        from mindsdb.utilities.cache import FileCache as _FileCache
+        df = pd.DataFrame({'a': [4, 2, 1, 5], '__mindsdb_row_id': [10, 11, 12, 13]})
+        with patch.object(_FileCache, 'get_many', autospec=True, side_effect=_FileCache.get_many) as get_many, \
+                patch.object(_FileCache, 'set_many', autospec=True, side_effect=_FileCache.set_many) as set_many:
+            predictions = ml_exec._predict_with_row_cache('m', predictor_record, df, {})
+
+            # every row is a separate record
+            assert len(get_many.call_args[0][1]) == 4
+            assert len(set_many.call_args[0][1]) == 2
+
+        assert predicted == [[1, 2, 3], [4, 5]]
+        assert list(predictions['p']) == [8, 4, 2, 10]
+        assert list(predictions['__mindsdb_row_id']) == [10, 11, 12, 13]
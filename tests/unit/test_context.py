@@ -0,0 +1,55 @@
+import pickle
+import threading
+
+import pytest
+
+from mindsdb.utilities.context import context as ctx
+
+
+class TestContext:
+
+    def setup_method(self):
+        ctx.set_default()
+
+    def test_copy_on_write(self):
+        ctx.company_id = 1
+        snapshot = ctx.dump()
+
+        result = {}
+
+        def run():
+            ctx.load(snapshot)
+            ctx.company_id = 2
+            result['company_id'] = ctx.company_id
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        assert result['company_id'] == 2
+        assert ctx.company_id == 1
+        assert snapshot['company_id'] == 1
+
+        del ctx.company_id
+        with pytest.raises(AttributeError):
+            ctx.company_id
+        assert snapshot['company_id'] == 1
+
+    def test_profiling(self):
+        ctx.profiling['enabled'] = True
+        ctx.profiling['tree'] = {'name': 'query', 'children': []}
+
+        # profiling is not in snapshot by default
+        snapshot = ctx.dump()
+        assert 'profiling' not in snapshot
+        assert pickle.loads(pickle.dumps(snapshot)) == snapshot
+
+        ctx.load(snapshot)
+        assert ctx.profiling == {'level': 0, 'enabled': False, 'pointer': None, 'tree': None}
+
+        # profiling of the snapshot is not shared
+        ctx.profiling['enabled'] = True
+        snapshot = ctx.dump(with_profiling=True)
+        ctx.load(snapshot)
+        ctx.profiling['level'] += 1
+        assert snapshot['profiling']['level'] == 0
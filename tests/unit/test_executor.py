@@ -1,8 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 import datetime as dt
 import tempfile
 import pytest
 import json
+import threading
 
 import pandas as pd
 import numpy as np
@@ -94,6 +95,97 @@ class Test(BaseExecutorMockPredictor):
         # check sql in query method
         assert mock_handler().query.call_args[0][0].to_string() == 'SELECT * FROM tasks'
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_integration_select_stream(self, mock_handler):
+        from mindsdb_sql import parse_sql
+        from mindsdb.integrations.libs.base import DatabaseHandler
+        from mindsdb.api.mysql.mysql_proxy.classes.result_cursor import ResultCursor
+        from mindsdb.api.executor import SQLQuery
+
+        data = [[i, str(i)] for i in range(10)]
+        df = pd.DataFrame(data, columns=['a', 'b'])
+        self.set_handler(mock_handler, name='pg', tables={'tasks': df})
+
+        closed = []
+
+        def query_stream_f(query, batch_size):
+            try:
+                for i in range(0, len(df), batch_size):
+                    yield df[i:i + batch_size]
+            except GeneratorExit:
+                closed.append(True)
+                raise
+
+        mock_handler().__class__ = DatabaseHandler
+        mock_handler().query_stream.side_effect = query_stream_f
+
+        config = self.command_executor.session.config
+        with patch.dict(config._config, {'executor': {'stream_batch_size': 3}}):
+            ret = self.command_executor.execute_command(parse_sql('select * from pg.tasks'), stream=True)
+
+            # only the first batch is fetched
+            assert ret.data == data[:3]
+
+            cursor = ResultCursor(ret.data, ret.stream)
+            assert cursor.fetch(4) == data[:4]
+            assert cursor.fetch(2) == data[4:6]
+            assert cursor.has_more()
+            cursor.close()
+            assert closed == [True]
+
+            # whole result is fetched without streaming
+            ret = self.execute('select * from pg.tasks')
+            assert ret.data == data
+
+            # all batches are concatenated
+            ret = self.command_executor.execute_command(parse_sql('select * from pg.tasks'), stream=True)
+            cursor = ResultCursor(ret.data, ret.stream)
+            assert list(cursor) == data
+            assert not cursor.has_more()
+
+            # rest of the stream is read by fetch
+            query = SQLQuery(parse_sql('select * from pg.tasks'), session=self.command_executor.session, stream=True)
+            assert query.fetch()['result'] == data
+
+    def test_prepared_statement_stream_release(self):
+        from types import SimpleNamespace
+        from mindsdb.api.mysql.mysql_proxy.mysql_proxy import MysqlProxy
+        from mindsdb.api.mysql.mysql_proxy.classes.result_cursor import ResultCursor
+
+        data = [[i] for i in range(4)]
+
+        proxy = MysqlProxy.__new__(MysqlProxy)
+        proxy.session = SimpleNamespace(prepared_stmts={})
+        proxy.to_mysql_columns = MagicMock()
+        proxy.get_packet_writer = MagicMock()
+        proxy.packet = MagicMock()
+        proxy.last_packet = MagicMock()
+
+        # buffered result without stream doesn't keep handlers
+        proxy.session.prepared_stmts[1] = {
+            'statement': SimpleNamespace(data=data, columns=[]), 'cursor': ResultCursor(data), 'fetched': 0
+        }
+        assert not proxy.has_open_streams()
+
+        # the result is read from the integration
+        stmt = {
+            'statement': SimpleNamespace(data=data[:2], columns=[]),
+            'cursor': ResultCursor(data[:2], iter([data[2:]])),
+            'fetched': 0
+        }
+        proxy.session.prepared_stmts[2] = stmt
+        assert proxy.has_open_streams()
+
+        proxy.answer_stmt_fetch(2, 3)
+        assert stmt['fetched'] == 3
+        assert proxy.has_open_streams()
+
+        # exhausted cursor is removed
+        proxy.answer_stmt_fetch(2, 3)
+        assert stmt['fetched'] == 4
+        assert stmt['cursor'] is None
+        assert not proxy.has_open_streams()
+
     def test_predictor_1_row(self):
         predicted_value = 3.14
         predictor = {
@@ -906,6 +998,46 @@ class TestTableau(BaseExecutorMockPredictor):
         # 3: count rows, 4: sum of 'a', 5 max of prediction
         assert ret.data[0] == [2]
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_information_schema_catalog(self, mock_handler):
+
+        self.set_handler(mock_handler, name='pg', tables={'table1': self.task_table})
+        get_tables = mock_handler().get_tables
+
+        ret = self.execute("""
+            select table_name from information_schema.tables where table_schema = 'pg'
+        """)
+        assert ret.data == [['table1']]
+        assert get_tables.call_count == 1
+
+        # tables list is cached
+        ret = self.execute("""
+            select table_name from information_schema.tables where table_schema in ('pg', 'mindsdb')
+        """)
+        assert ['table1'] in ret.data
+        assert get_tables.call_count == 1
+
+        # integration is not requested if it is filtered out
+        self.execute("""
+            select table_name from information_schema.tables where table_schema = 'files'
+        """)
+        assert get_tables.call_count == 1
+
+        # columns of integration
+        ret = self.execute("""
+            select column_name, data_type from information_schema.columns
+            where table_schema = 'pg' and table_name = 'table1'
+        """)
+        assert ret.data == [['a', 'bigint'], ['b', 'bigint']]
+        assert mock_handler().get_columns.call_count == 1
+
+        # cache is invalidated on alter database
+        self.command_executor.session.integration_controller.modify('pg', {})
+        self.execute("""
+            select table_name from information_schema.tables where table_schema = 'pg'
+        """)
+        assert get_tables.call_count == 2
+
 
 class TestWithNativeQuery(BaseExecutorMockPredictor):
     @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
@@ -1008,8 +1140,9 @@ class TestWithNativeQuery(BaseExecutorMockPredictor):
         # check predictor call
         # input = one row whit a==2
         data_in = self.mock_predict.call_args[0][1]
+        assert isinstance(data_in, pd.DataFrame)
         assert len(data_in) == 1
-        assert data_in[0]['a'] == 2
+        assert data_in['a'][0] == 2
 
         # check prediction
         assert ret.data[0][0] == predicted_value
@@ -1107,6 +1240,92 @@ class TestSteps(BaseExecutorMockPredictor):
             limit 1
         """)
 
+    @patch('mindsdb.integrations.handlers.postgres_handler.Handler')
+    def test_join_2_integrations(self, mock_handler):
+        # fetch steps from different integrations are independent and executed in parallel
+        df = pd.DataFrame([
+            {'a': 1, 'b': 'x'},
+            {'a': 2, 'b': 'y'},
+            {'a': 3, 'b': 'z'},
+        ])
+        df2 = pd.DataFrame([
+            {'a': 1, 'c': 10},
+            {'a': 3, 'c': 30},
+        ])
+        tables = {'tasks': df, 'tasks2': df2}
+        self.set_handler(mock_handler, name='pg', tables=tables)
+        self.set_handler(mock_handler, name='pg2', tables=tables)
+
+        threads = set()
+        query_f = mock_handler().query.side_effect
+
+        def query_thread_f(query):
+            threads.add(threading.current_thread().name)
+            return query_f(query)
+
+        mock_handler().query.side_effect = query_thread_f
+
+        ret = self.execute("""
+            select t1.a, t1.b, t2.c from pg.tasks t1
+            join pg2.tasks2 t2 on t1.a = t2.a
+            order by t1.a
+        """)
+        ret_df = self.ret_to_df(ret)
+        assert list(ret_df['a']) == [1, 3]
+        assert list(ret_df['c']) == [10, 30]
+
+        # both fetches were executed in steps thread pool
+        assert len(threads) > 0
+        assert all(name.startswith('sql_query_step') for name in threads)
+
+    def test_step_dependencies(self):
+        from mindsdb_sql import parse_sql
+        from mindsdb_sql.parser.ast import Parameter
+        from mindsdb_sql.planner.step_result import Result
+        from mindsdb_sql.planner.steps import FetchDataframeStep, JoinStep
+
+        from mindsdb.api.executor.sql_query.sql_query import get_step_dependencies
+
+        query = parse_sql('select * from tbl where a in 1', dialect='mindsdb')
+        query.where.args[1] = Parameter(Result(1))
+        step = FetchDataframeStep(integration='pg', query=query, step_num=2)
+        assert get_step_dependencies(step) == {1}
+
+        step = JoinStep(left=Result(0), right=Result(2), query=None, step_num=3)
+        assert get_step_dependencies(step) == {0, 2}
+
+    def test_map_reduce_batching(self):
+        from mindsdb_sql import parse_sql
+        from mindsdb_sql.parser.ast import Constant
+
+        from mindsdb.api.executor.sql_query.steps.map_reduce_step import (
+            split_query_vars, build_vars_condition, join_conditions
+        )
+
+        query = parse_sql('select * from tbl where x > 1 and a = 1 and b = 2', dialect='mindsdb')
+        query.where.args[0].args[1].args[1] = Constant('$var[a]')
+        query.where.args[1].args[1] = Constant('$var[b]')
+
+        conditions, var_columns = split_query_vars(query.where)
+        assert list(var_columns.keys()) == ['a', 'b']
+
+        vars = [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}]
+        query.where = join_conditions(conditions + [build_vars_condition(var_columns, vars)], 'and')
+        expected = parse_sql(
+            "select * from tbl where x > 1 and ((a = 1 and b = 'x') or (a = 2 and b = 'y'))",
+            dialect='mindsdb'
+        )
+        assert query.to_string() == expected.to_string()
+
+        # single var: 'in' condition
+        query.where = build_vars_condition({'a': var_columns['a']}, vars)
+        assert query.where.to_string() == 'a IN (1, 2)'
+
+        # var is used not in 'and' chain: batching is not possible
+        query = parse_sql('select * from tbl where x > 1 or a = 1', dialect='mindsdb')
+        query.where.args[1].args[1] = Constant('$var[a]')
+        assert split_query_vars(query.where) is None
+
 
 class TestExecutionTools:
 
@@ -1123,6 +1342,20 @@ class TestExecutionTools:
         df = pd.DataFrame(d)
         query_df(df, 'select * from models')
 
+    def test_query_df_mixed_types(self):
+        from mindsdb.api.executor.utilities.sql import get_duckdb_connection
+
+        # type of 'object' column is inferred from all values, not from sample
+        df = pd.DataFrame({'a': [1] * 2000 + ['x'], 'b': range(2001)})
+        res = query_df(df, 'select a from t where b > 1998')
+        assert list(res['a']) == ['1', 'x']
+
+        # connection is reused, tables are unregistered
+        con = get_duckdb_connection()
+        query_df(df, 'select a from t where b = 1')
+        assert get_duckdb_connection() is con
+        assert len(con.execute('show tables').fetchall()) == 0
+
 
 class TestIfExistsIfNotExists(BaseExecutorMockPredictor):
 
@@ -0,0 +1,157 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mindsdb.interfaces.database.integrations import HandlersCache, HandlersPool
+from mindsdb.utilities.context import context as ctx
+
+
+def create_handler(alive=True):
+    handler = MagicMock()
+    handler.check_connection.return_value = MagicMock(success=alive)
+    return handler
+
+
+def in_thread(fnc):
+    result = {}
+
+    def run():
+        ctx.set_default()
+        try:
+            result['value'] = fnc()
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    return result
+
+
+class TestHandlersCache:
+
+    def setup_method(self):
+        ctx.set_default()
+        self.cache = HandlersCache()
+
+    def teardown_method(self):
+        self.cache._stop_clean()
+
+    def test_checkout_checkin(self):
+        self.cache.pools[('pg', None)] = HandlersPool('pg', max_size=2)
+
+        handler = self.cache.checkout('pg', create_handler)
+        handler.connect.assert_called_once()
+
+        # the same handler for the thread
+        assert self.cache.checkout('pg', create_handler) is handler
+
+        # other thread gets new handler
+        result = in_thread(lambda: self.cache.checkout('pg', create_handler))
+        assert result['value'] is not handler
+
+        # after checkin handler is reused by other threads
+        self.cache.checkin()
+        result = in_thread(lambda: self.cache.checkout('pg', create_handler))
+        assert result['value'] is handler
+        assert self.cache.pools[('pg', None)].size() == 2
+
+    def test_max_size(self):
+        pool = HandlersPool('pg', max_size=1, checkout_timeout=0.1)
+        self.cache.pools[('pg', None)] = pool
+        handler = self.cache.checkout('pg', create_handler)
+
+        result = in_thread(lambda: self.cache.checkout('pg', create_handler))
+        assert 'all 1 connections are in use' in str(result['error'])
+
+        # waiting thread gets handler after checkin
+        pool.checkout_timeout = 5
+        result = {}
+
+        def checkout():
+            ctx.set_default()
+            result['value'] = self.cache.checkout('pg', create_handler)
+
+        thread = threading.Thread(target=checkout)
+        thread.start()
+        time.sleep(0.2)
+        self.cache.checkin()
+        thread.join()
+        assert result['value'] is handler
+
+    def test_health_check(self):
+        self.cache.pools[('pg', None)] = HandlersPool('pg', health_check_interval=0)
+        handler = self.cache.checkout('pg', lambda: create_handler(alive=False))
+        self.cache.checkin()
+
+        time.sleep(0.01)
+        new_handler = self.cache.checkout('pg', create_handler)
+        assert new_handler is not handler
+        handler.disconnect.assert_called_once()
+        assert self.cache.pools[('pg', None)].size() == 1
+
+    def test_eviction(self):
+        pool = HandlersPool('pg', ttl=0, min_size=1)
+        self.cache.pools[('pg', None)] = pool
+        first = self.cache.checkout('pg', create_handler)
+        second = in_thread(lambda: self.cache.checkout('pg', create_handler))['value']
+
+        # thread is finished: its handler is returned to the pool and closed by ttl
+        time.sleep(0.01)
+        self.cache._clean_step()
+        second.disconnect.assert_called_once()
+        assert pool.size() == 1
+
+        # min size
+        self.cache.checkin()
+        time.sleep(0.01)
+        self.cache._clean_step()
+        first.disconnect.assert_not_called()
+        assert len(pool.idle) == 1
+
+        # closed on delete
+        self.cache.delete('pg')
+        first.disconnect.assert_called_once()
+        assert ('pg', None) not in self.cache.pools
+
+    def test_create_error(self):
+        self.cache.pools[('pg', None)] = HandlersPool('pg', max_size=1)
+
+        def create_error():
+            raise Exception('wrong integration')
+
+        with pytest.raises(Exception, match='wrong integration'):
+            self.cache.checkout('pg', create_error)
+        assert self.cache.pools[('pg', None)].size() == 0
+
+    def test_not_pooled(self):
+        pool = HandlersPool('pg', max_size=2, checkout_timeout=0.1)
+        self.cache.pools[('pg', None)] = pool
+
+        # long-lived subscribers hold their handlers and never check in
+        stop_event = threading.Event()
+        subscribed = []
+
+        def subscribe():
+            ctx.set_default()
+            subscribed.append(self.cache.checkout('pg', create_handler, pooled=False))
+            stop_event.wait()
+
+        threads = [threading.Thread(target=subscribe) for _ in range(pool.max_size + 1)]
+        for thread in threads:
+            thread.start()
+        try:
+            while len(subscribed) < len(threads):
+                time.sleep(0.01)
+            assert pool.size() == 0
+
+            # other threads can check out
+            result = in_thread(lambda: self.cache.checkout('pg', create_handler))
+            assert 'error' not in result
+            assert result['value'] not in subscribed
+        finally:
+            stop_event.set()
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,94 @@
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mindsdb.interfaces.database.integrations import IntegrationController, LazyHandlersDict
+from mindsdb.integrations.libs.const import HANDLER_TYPE
+
+
+def write_handler(path: Path, init_code: str) -> Path:
+    path.mkdir()
+    path.joinpath('__init__.py').write_text(init_code)
+    return path
+
+
+class TestHandlersImport:
+
+    def test_read_handler_meta(self, tmp_path):
+        handler_dir = write_handler(tmp_path / 'test_handler', (
+            'from mindsdb.integrations.libs.const import HANDLER_TYPE\n'
+            'from .__about__ import __version__ as version\n'
+            "name = 'test'\n"
+            "title = 'Test'\n"
+            'type = HANDLER_TYPE.ML\n'
+            "icon_path = 'icon.svg'\n"
+        ))
+        assert IntegrationController._read_handler_meta(handler_dir) == {
+            'name': 'test',
+            'title': 'Test',
+            'type': HANDLER_TYPE.ML,
+            'icon_path': 'icon.svg',
+            'permanent': False,
+            'import': {'folder': 'test_handler'}
+        }
+
+        # name is known only after import
+        handler_dir = write_handler(tmp_path / 'dynamic_handler', "name = 'dyn' + 'amic'\n")
+        assert IntegrationController._read_handler_meta(handler_dir) is None
+
+    def test_lazy_import(self):
+        controller = IntegrationController()
+        controller.handlers_cache._stop_clean()
+
+        assert 'files' in controller._lazy_handlers
+        assert controller.get_handlers_metadata()['files']['permanent'] is True
+
+        # handler is imported on first use
+        with patch.object(controller, 'import_handler', side_effect=controller.import_handler) as import_handler:
+            assert 'files' in controller.handler_modules
+            assert controller.handlers_import_status['files']['import']['success'] is True
+            assert controller.handler_modules['files'].name == 'files'
+            imported = [call.kwargs['handler_name'] for call in import_handler.call_args_list]
+        assert imported == ['files']
+        assert 'files' not in controller._lazy_handlers
+
+        # unknown handler
+        assert 'not_existing' not in controller.handler_modules
+        assert controller.handlers_import_status.get('not_existing') is None
+
+    def test_iteration(self):
+        import_all = MagicMock()
+        handlers = LazyHandlersDict(import_handler=lambda name: None, import_all=import_all)
+        handlers['a'] = 1
+        assert 'b' not in handlers
+
+        # all handlers are imported before iteration
+        assert list(handlers.items()) == [('a', 1)]
+        import_all.assert_called()
+
+    def test_probed_args_cache(self, tmp_path):
+        controller = IntegrationController.__new__(IntegrationController)
+        controller._args_cache = None
+        controller._args_cache_lock = MagicMock()
+        handler_dir = write_handler(tmp_path / 'test_handler', "name = 'test'\n")
+        handler_class = MagicMock()
+        handler_class.prediction_args.return_value = [{'name': 'question', 'required': True}]
+        handler_class.creation_args.return_value = []
+
+        cache_path = tmp_path / 'cache' / 'handlers_args.json'
+        with patch.object(IntegrationController, '_get_args_cache_path', return_value=cache_path):
+            args = controller._get_probed_args(handler_dir, handler_class)
+            assert args == {'prediction': [{'name': 'question', 'required': True}], 'creation_args': []}
+            assert cache_path.is_file()
+
+            # new process reads args from disk
+            controller._args_cache = None
+            assert controller._get_probed_args(handler_dir, handler_class) == args
+            assert handler_class.prediction_args.call_count == 1
+
+            # handler is changed
+            init_path = handler_dir / '__init__.py'
+            stat = init_path.stat()
+            os.utime(init_path, (stat.st_atime, stat.st_mtime + 10))
+            controller._get_probed_args(handler_dir, handler_class)
+            assert handler_class.prediction_args.call_count == 2
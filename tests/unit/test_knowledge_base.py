@@ -258,6 +258,42 @@ class TestKnowledgeBase(BaseExecutorTest):
         df = self.run_sql(sql)
         assert df.shape[0] == 1
 
+    def test_query_embeddings_cache(self):
+        from mindsdb.interfaces.knowledge_base import controller
+        from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable
+
+        # ids of records are the same in every test
+        controller.query_embeddings_cache.clear()
+        controller._models_info.clear()
+
+        self.run_sql(f"""
+            CREATE KNOWLEDGE BASE test_kb
+            USING
+            MODEL = {self.embedding_model_name},
+            STORAGE = {self.vector_database_name}.{self.vector_database_table_name}
+        """)
+
+        sql = "SELECT * FROM test_kb WHERE content = 'some query' LIMIT 1"
+        with patch.object(
+            KnowledgeBaseTable, '_df_to_embeddings', side_effect=KnowledgeBaseTable._df_to_embeddings, autospec=True
+        ) as df_to_embeddings:
+            first = self.run_sql(sql)
+            second = self.run_sql(sql)
+            df_to_embeddings.assert_called_once()
+
+            self.run_sql("SELECT * FROM test_kb WHERE content = 'other query' LIMIT 1")
+            assert df_to_embeddings.call_count == 2
+
+        assert list(first['id']) == list(second['id'])
+
+        # description of model was cached by queries
+        kb = self.db.session.query(self.db.KnowledgeBase).filter_by(name='test_kb').first()
+        kb_table = KnowledgeBaseTable(kb, self.command_executor.session)
+        with patch.object(self.db.session, 'query', wraps=self.db.session.query) as db_query:
+            assert kb_table._get_model_info() == kb_table._get_model_info()
+        models_queries = [call for call in db_query.call_args_list if call[0][0] is self.db.Predictor]
+        assert len(models_queries) == 0
+
     def test_insert_into_kb(self):
         # create the knowledge base
         sql = f"""
@@ -308,6 +344,105 @@ class TestKnowledgeBase(BaseExecutorTest):
         df = self.run_sql(sql)
         assert df.shape[0] == 7
 
+    def test_insert_unchanged_content(self):
+        from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable
+
+        self.run_sql(f"""
+            CREATE KNOWLEDGE BASE test_kb
+            USING
+            MODEL = {self.embedding_model_name},
+            STORAGE = {self.vector_database_name}.{self.vector_database_table_name},
+            content_columns = ['content']
+        """)
+
+        def get_embeddings():
+            ret = self.run_sql(f"SELECT * FROM {self.vector_database_name}.{self.vector_database_table_name}")
+            return {row['id']: list(row['embeddings']) for _, row in ret.iterrows()}
+
+        self.save_file('docs', pd.DataFrame([
+            {'id': 'd1', 'content': 'same', 'color': 'red'},
+            {'id': 'd2', 'content': 'same', 'color': 'red'},
+            {'id': 'd3', 'content': 'other', 'color': 'red'},
+        ]))
+        with patch.object(
+            KnowledgeBaseTable, '_df_to_embeddings', side_effect=KnowledgeBaseTable._df_to_embeddings, autospec=True
+        ) as df_to_embeddings:
+            self.run_sql('INSERT INTO test_kb SELECT * FROM files.docs')
+            # the same content is embedded once
+            assert len(df_to_embeddings.call_args_list[0][0][1]) == 2
+            embeddings = get_embeddings()
+
+            # nothing is changed: model is not called
+            df_to_embeddings.reset_mock()
+            self.run_sql('INSERT INTO test_kb SELECT * FROM files.docs')
+            df_to_embeddings.assert_not_called()
+            assert get_embeddings() == embeddings
+
+            # changed metadata: stored embeddings are used, changed content: embedded again
+            self.save_file('docs2', pd.DataFrame([
+                {'id': 'd1', 'content': 'same', 'color': 'blue'},
+                {'id': 'd2', 'content': 'changed', 'color': 'red'},
+            ]))
+            self.run_sql('INSERT INTO test_kb SELECT * FROM files.docs2')
+            assert len(df_to_embeddings.call_args_list) == 1
+            assert list(df_to_embeddings.call_args_list[0][0][1]['content']) == ['changed']
+
+        ret = self.run_sql("SELECT * FROM test_kb WHERE id = 'd1'")
+        assert ret['metadata'][0] == {'color': 'blue'}
+        new_embeddings = get_embeddings()
+        assert new_embeddings['d1'] == embeddings['d1']
+        assert new_embeddings['d2'] != embeddings['d2']
+
+    @patch('mindsdb.interfaces.knowledge_base.controller.Config')
+    def test_insert_by_batches(self, mock_config):
+        from mindsdb.interfaces.knowledge_base.controller import KnowledgeBaseTable, INSERT_CHECKPOINT_KEY
+        from mindsdb.interfaces.storage.json import get_json_storage
+
+        mock_config.return_value.get.return_value = {'insert_batch_size': 2, 'insert_queue_size': 1}
+
+        self.run_sql(f"""
+            CREATE KNOWLEDGE BASE test_kb
+            USING
+            MODEL = {self.embedding_model_name},
+            STORAGE = {self.vector_database_name}.{self.vector_database_table_name},
+            content_columns = ['content']
+        """)
+        kb = self.db.session.query(self.db.KnowledgeBase).filter_by(name='test_kb').first()
+        checkpoints = get_json_storage(resource_id=kb.id, resource_group='knowledge_base')
+
+        self.save_file('docs', pd.DataFrame([
+            {'id': f'd{i}', 'content': f'content {i}'}
+            for i in range(5)
+        ]))
+
+        upsert_batch = KnowledgeBaseTable._upsert_batch
+        upserts = []
+
+        def failed_upsert(kb_table, df, ctx_dump):
+            upserts.append(list(df['id']))
+            if len(upserts) == 2:
+                raise RuntimeError('vector db is not available')
+            upsert_batch(kb_table, df, ctx_dump)
+
+        # the second batch is failed: the first batch is saved in checkpoint
+        with patch.object(KnowledgeBaseTable, '_upsert_batch', failed_upsert):
+            with pytest.raises(Exception):
+                self.run_sql('INSERT INTO test_kb SELECT * FROM files.docs')
+        assert upserts == [['d0', 'd1'], ['d2', 'd3']]
+        assert checkpoints.get(INSERT_CHECKPOINT_KEY)['rows_done'] == 2
+
+        # insert continues from checkpoint
+        with patch.object(
+            KnowledgeBaseTable, '_df_to_embeddings', side_effect=KnowledgeBaseTable._df_to_embeddings, autospec=True
+        ) as df_to_embeddings:
+            self.run_sql('INSERT INTO test_kb SELECT * FROM files.docs')
+            embedded = [list(call[0][1]['content']) for call in df_to_embeddings.call_args_list]
+        assert embedded == [['content 2', 'content 3'], ['content 4']]
+        assert checkpoints.get(INSERT_CHECKPOINT_KEY) is None
+
+        ret = self.run_sql(f"SELECT id FROM {self.vector_database_name}.{self.vector_database_table_name}")
+        assert {f'd{i}' for i in range(5)}.issubset(ret['id'])
+
     @pytest.mark.skip(reason="Not implemented")
     def test_update_kb(self):
         ...
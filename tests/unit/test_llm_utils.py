@@ -116,6 +116,23 @@ class TestLLM(unittest.TestCase):
         with self.assertRaises(Exception):
             get_completed_prompts(base_template, df)
 
+    def test_get_completed_prompts_columns(self):
+        df = pd.DataFrame({
+            'question': ['what is {x}?', None, 'why?'],
+            'number': [1.5, 2.0, None],
+        })
+        base_template = '{json: true} Q: {{question}} ({{number}}) repeat: {{question}}'
+        prompts, empties = get_completed_prompts(base_template, df)
+
+        assert prompts[0] == '{json: true} Q: what is {x}? (1.5) repeat: what is {x}?'
+        assert prompts[1] == '{json: true} Q:  (2.0) repeat: '
+        # value which is missing in not object column makes prompt empty
+        assert prompts[2] is pd.NA
+        assert len(empties) == 0
+
+        # input is not changed
+        assert list(df.columns) == ['question', 'number']
+
     def test_ft_chat_format_validation(self):
         for chat in self.valid_chats:
             ft_chat_format_validation(chat)  # if chat is valid, returns `None`
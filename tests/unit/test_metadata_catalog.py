@@ -0,0 +1,62 @@
+import threading
+import time
+from unittest.mock import patch
+
+from mindsdb.interfaces.database.metadata_catalog import MetadataCatalog
+from mindsdb.utilities.context import context as ctx
+
+
+class TestMetadataCatalog:
+
+    def setup_method(self):
+        ctx.set_default()
+        # workers don't use handlers and db in tests
+        self.release_resources = patch.object(MetadataCatalog, '_release_resources')
+        self.release_resources.start()
+
+    def teardown_method(self):
+        self.release_resources.stop()
+
+    def test_timeout_and_stale(self):
+        catalog = MetadataCatalog()
+        release = threading.Event()
+
+        def slow_loader():
+            release.wait(5)
+            return ['slow']
+
+        with patch.object(MetadataCatalog, '_get_config', return_value={'timeout': 0.1, 'ttl': 0}):
+            # slow integration doesn't hold up others
+            result = catalog.get_many({
+                ('fast', 'tables'): lambda: ['fast'],
+                ('slow', 'tables'): slow_loader,
+            })
+            assert result == {('fast', 'tables'): ['fast']}
+
+            # load of slow integration is continued in background
+            release.set()
+            time.sleep(0.1)
+            assert catalog.get(('slow', 'tables'), slow_loader) == ['slow']
+
+            # expired entry is returned while it is refreshed
+            time.sleep(0.1)
+            assert catalog.get(('slow', 'tables'), lambda: ['new']) == ['slow']
+            time.sleep(0.1)
+            assert catalog.get(('slow', 'tables'), lambda: ['new']) == ['new']
+
+            # load errors are not cached
+            def error_loader():
+                raise Exception('connection error')
+
+            assert catalog.get(('broken', 'tables'), error_loader) is None
+            assert catalog.get(('broken', 'tables'), lambda: ['ok']) == ['ok']
+
+    def test_invalidate(self):
+        catalog = MetadataCatalog()
+        catalog.get(('pg', 'tables'), lambda: ['a'])
+        catalog.get(('pg', 'columns', 'a'), lambda: ['x'])
+        catalog.get(('mysql', 'tables'), lambda: ['b'])
+
+        catalog.invalidate('PG')
+        assert [key for _, key in catalog.entries.keys()] == [('mysql', 'tables')]
+        assert catalog.get(('pg', 'tables'), lambda: ['c']) == ['c']
@@ -0,0 +1,70 @@
+import datetime as dt
+import logging
+
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packet_writer import PacketWriter, lenenc_int
+from mindsdb.api.mysql.mysql_proxy.data_types.mysql_packets import ResultsetRowPacket
+from mindsdb.api.mysql.mysql_proxy.libs.constants.mysql import MAX_PACKET_SIZE
+
+
+class FakeSocket:
+    def __init__(self):
+        self.chunks = []
+
+    def sendall(self, data):
+        self.chunks.append(bytes(data))
+
+
+class FakeSession:
+    def __init__(self):
+        self.packet_sequence_number = 0
+        self.logging = logging.getLogger(__name__)
+
+    def inc_packet_sequence_number(self):
+        self.packet_sequence_number = (self.packet_sequence_number + 1) % 256
+
+
+class TestPacketWriter:
+
+    def test_text_rows(self):
+        rows = [
+            [1, 'x', None, 1.5],
+            [2, 'ы' * 300, dt.datetime(2020, 1, 2), None],
+        ]
+
+        # packet objects
+        session = FakeSession()
+        expected = b''
+        for row in rows:
+            packet = ResultsetRowPacket(data=row, session=session)
+            session.inc_packet_sequence_number()
+            expected += packet.accum()
+
+        socket = FakeSocket()
+        writer = PacketWriter(socket, FakeSession(), flush_size=10)
+        writer.write_text_rows(rows)
+        writer.flush()
+
+        assert b''.join(socket.chunks) == expected
+        # sent in chunks
+        assert len(socket.chunks) == 2
+
+    def test_big_packet(self):
+        socket = FakeSocket()
+        session = FakeSession()
+        writer = PacketWriter(socket, session)
+
+        writer.write_payload(b'a' * MAX_PACKET_SIZE)
+        writer.flush()
+        data = b''.join(socket.chunks)
+
+        # full packet and empty packet after it
+        assert len(data) == MAX_PACKET_SIZE + 8
+        assert data[:4] == b'\xff\xff\xff\x00'
+        assert data[-4:] == b'\x00\x00\x00\x01'
+        assert session.packet_sequence_number == 2
+
+    def test_lenenc_int(self):
+        assert lenenc_int(250) == b'\xfa'
+        assert lenenc_int(251) == b'\xfc\xfb\x00'
+        assert lenenc_int(1 << 16) == b'\xfd\x00\x00\x01'
+        assert lenenc_int(1 << 24) == b'\xfe\x00\x00\x00\x01\x00\x00\x00\x00'
@@ -0,0 +1,121 @@
+import io
+import socketserver
+import struct
+from unittest.mock import patch, MagicMock
+
+from mindsdb.api.executor import Column
+from mindsdb.api.postgres.postgres_proxy.executor import Executor
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import FE_MESSAGE_MAP
+from mindsdb.api.postgres.postgres_proxy.postgres_proxy import PostgresProxyHandler
+
+
+class FakeFile:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+
+
+def message(identifier, body=b''):
+    return identifier + struct.pack('!i', len(body) + 4) + body
+
+
+def parse_message(sql, name=b''):
+    return message(b'P', name + b'\x00' + sql + b'\x00' + struct.pack('!h', 0))
+
+
+def bind_message(statement=b'', portal=b''):
+    return message(b'B', portal + b'\x00' + statement + b'\x00' + struct.pack('!hhh', 0, 0, 0))
+
+
+def execute_message(portal=b''):
+    return message(b'E', portal + b'\x00' + struct.pack('!i', 0))
+
+
+def do_execute(self):
+    self.is_executed = True
+    self.data = [[self.query.where.args[1].value]]
+    self.columns = [Column(name='a', alias='a', type='int')]
+
+
+class TestPostgresProxy:
+
+    def get_handler(self, client_data: bytes):
+        with patch.object(socketserver.BaseRequestHandler, '__init__', lambda *args: None):
+            handler = PostgresProxyHandler(None, None, None)
+        handler.session = MagicMock(database='mindsdb')
+        handler.user_parameters = {}
+        handler.rfile = io.BytesIO(client_data)
+        handler.wfile = FakeFile()
+        with patch.object(PostgresProxyHandler, 'init_session'), \
+                patch.object(PostgresProxyHandler, 'is_cloud_connection', return_value={'is_cloud': True}), \
+                patch.object(PostgresProxyHandler, 'handshake'), \
+                patch.object(PostgresProxyHandler, 'main_loop'):
+            handler.handle()
+        handler.wfile = FakeFile()
+        # map is imported by reader in runtime, mindsdb modules can be unloaded by other tests at this moment
+        handler.client_buffer.fe_message_map = FE_MESSAGE_MAP
+        return handler
+
+    def test_pipeline(self):
+        sql = b'select a from tbl where a = 1'
+        client_data = (
+            parse_message(sql) + bind_message() + execute_message()
+            + parse_message(sql) + bind_message() + execute_message()
+            + parse_message(sql.replace(b'1', b'2')) + bind_message() + execute_message()
+            + message(b'S')
+            + message(b'X')
+        )
+        handler = self.get_handler(client_data)
+
+        with patch.object(Executor, 'do_execute', do_execute), \
+                patch.object(Executor, 'parse', side_effect=Executor.parse, autospec=True) as parse:
+            handler.main_loop()
+
+            # every statement is parsed once
+            assert parse.call_count == 2
+            assert len(handler.statements_cache) == 2
+
+        # first ReadyForQuery and all responses to Sync
+        assert len(handler.wfile.chunks) == 2
+        response = handler.wfile.chunks[1]
+        assert response.count(b'D\x00\x00\x00\x0b\x00\x01\x00\x00\x00\x011') == 2
+        assert response.count(b'D\x00\x00\x00\x0b\x00\x01\x00\x00\x00\x012') == 1
+        assert response.endswith(b'Z\x00\x00\x00\x05I')
+
+    def test_statements_cache_size(self):
+        handler = self.get_handler(b'')
+        handler.statements_cache_size = 2
+        for i in range(3):
+            executor = handler.get_prepared_executor(f'select {i}')
+        assert list(handler.statements_cache.keys()) == [('mindsdb', 'select 1'), ('mindsdb', 'select 2')]
+
+        # copy is returned
+        cached, _ = handler.statements_cache[('mindsdb', 'select 2')]
+        assert executor is not cached
+        assert executor.query is not cached.query
+
+        # not select query clears cache
+        handler.invalidate_statements_cache(executor)
+        assert len(handler.statements_cache) == 2
+        executor.parse('drop table x')
+        handler.invalidate_statements_cache(executor)
+        assert len(handler.statements_cache) == 0
+
+    def test_statements_cache_ttl(self):
+        handler = self.get_handler(b'')
+        handler.statements_cache_ttl = 10
+
+        with patch('time.monotonic', return_value=100), \
+                patch.object(Executor, 'stmt_prepare', autospec=True) as stmt_prepare:
+            handler.get_prepared_executor('select 1')
+            handler.get_prepared_executor('select 1')
+            assert stmt_prepare.call_count == 1
+
+        # schema could be changed by other connection: statement is prepared again after ttl
+        with patch('time.monotonic', return_value=111), \
+                patch.object(Executor, 'stmt_prepare', autospec=True) as stmt_prepare:
+            handler.get_prepared_executor('select 1')
+            assert stmt_prepare.call_count == 1
+            assert handler.statements_cache[('mindsdb', 'select 1')][1] == 121
@@ -0,0 +1,123 @@
+import datetime as dt
+import io
+import struct
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_fields import POSTGRES_TYPES, POSTGRES_FORMAT
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_message_formats import DataRow
+from mindsdb.api.postgres.postgres_proxy.postgres_packets.postgres_row_encoder import (
+    encode_rows,
+    get_format_codes,
+)
+
+
+class TestRowEncoder:
+
+    def test_text(self):
+        rows = [
+            [1, 'x', 1.5, True, {'a': 1}, dt.datetime(2020, 1, 2, 3, 4, 5), dt.date(2020, 1, 2), Decimal('1.1')],
+            [None, 'ы\x00', None, np.bool_(False), [1, 2], None, None, None],
+            [np.int64(3), '', np.float64(2.5), None, None, pd.Timestamp('2020-01-02 03:04:05.123'), None, None],
+        ]
+        result = encode_rows(rows)
+
+        assert list(map(list, result)) == [
+            [b'1', b'x', b'1.5', b'true', b'{"a": 1}', b'2020-01-02 03:04:05', b'2020-01-02', b'1.1'],
+            [None, 'ы\x00'.encode(), None, b'false', b'[1, 2]', None, None, None],
+            [b'3', b'', b'2.5', None, None, b'2020-01-02 03:04:05.123000', None, None],
+        ]
+
+        assert encode_rows([]) == []
+
+    def test_binary(self):
+        columns = [
+            {'name': 'a', 'type': POSTGRES_TYPES.LONG},
+            {'name': 'b', 'type': POSTGRES_TYPES.DOUBLE},
+            {'name': 'c', 'type': POSTGRES_TYPES.DATETIME},
+            {'name': 'd', 'type': POSTGRES_TYPES.DATE},
+            {'name': 'e', 'type': POSTGRES_TYPES.VARCHAR},
+        ]
+        rows = [
+            [1, 1.5, dt.datetime(2000, 1, 1, 0, 0, 1), dt.date(2000, 1, 3), 'x'],
+            [None, None, None, None, None],
+            [-2, 3, '1999-12-31 23:59:59', '1999-12-31', 'y'],
+        ]
+        result = encode_rows(rows, columns, format_codes=[POSTGRES_FORMAT.BINARY])
+
+        assert list(result[0]) == [
+            struct.pack('!q', 1),
+            struct.pack('!d', 1.5),
+            struct.pack('!q', 1000000),
+            struct.pack('!i', 2),
+            b'x',
+        ]
+        assert list(result[1]) == [None] * 5
+        assert list(result[2]) == [
+            struct.pack('!q', -2),
+            struct.pack('!d', 3.0),
+            struct.pack('!q', -1000000),
+            struct.pack('!i', -1),
+            b'y',
+        ]
+
+        # format code per column
+        result = encode_rows(rows[:1], columns, format_codes=[0, 1, 0, 0, 0])
+        assert result[0][:2] == (b'1', struct.pack('!d', 1.5))
+
+    def test_nulls(self):
+        columns = [
+            {'name': 'a', 'type': POSTGRES_TYPES.LONG},
+            {'name': 'b', 'type': POSTGRES_TYPES.DOUBLE},
+            {'name': 'c', 'type': POSTGRES_TYPES.DATETIME},
+            {'name': 'd', 'type': POSTGRES_TYPES.DATE},
+        ]
+        # nullable int column stored by pandas as float64
+        df = pd.DataFrame({
+            'a': [1, None],
+            'b': [1.5, np.nan],
+            'c': [pd.Timestamp('2000-01-01 00:00:01'), pd.NaT],
+            'd': [dt.date(2000, 1, 3), pd.NaT],
+        })
+        rows = df.astype(object).values.tolist()
+        assert df['a'].dtype == np.float64
+
+        result = encode_rows(rows, columns, format_codes=[POSTGRES_FORMAT.BINARY])
+        assert list(result[0]) == [
+            struct.pack('!q', 1),
+            struct.pack('!d', 1.5),
+            struct.pack('!q', 1000000),
+            struct.pack('!i', 2),
+        ]
+        assert list(result[1]) == [None] * 4
+
+        # the same in text format
+        result = encode_rows(rows, columns)
+        assert list(result[0]) == [b'1.0', b'1.5', b'2000-01-01 00:00:01', b'2000-01-03']
+        assert list(result[1]) == [None] * 4
+
+        result = encode_rows([[np.nan, np.float32('nan')]], columns[:2])
+        assert list(result[0]) == [None, None]
+
+    def test_format_codes(self):
+        assert get_format_codes([], 2) == [0, 0]
+        assert get_format_codes([1], 2) == [1, 1]
+        assert get_format_codes([0, 1], 2) == [0, 1]
+
+    def test_data_row(self):
+        rows = [(b'1', None, b'abc'), (b'', b'x', None)]
+        buffer = io.BytesIO()
+        DataRow(rows=rows).send(buffer)
+
+        expected = b''
+        for row in rows:
+            body = struct.pack('!h', 3)
+            for val in row:
+                if val is None:
+                    body += struct.pack('!i', -1)
+                else:
+                    body += struct.pack('!i', len(val)) + val
+            expected += b'D' + struct.pack('!i', len(body) + 4) + body
+        assert buffer.getvalue() == expected
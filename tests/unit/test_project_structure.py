@@ -781,6 +781,7 @@ class TestProjectStructure(BaseExecutorDummyML):
         ''')
 
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         # table size didn't change
         calls = data_handler().query.call_args_list
@@ -799,6 +800,7 @@ class TestProjectStructure(BaseExecutorDummyML):
         self.db.session.commit()
 
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         calls = data_handler().query.call_args_list
 
@@ -1004,6 +1006,7 @@ class TestJobs(BaseExecutorDummyML):
 
         # ------------ executing
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         # check query to integration
         job = self.db.Jobs.query.filter(self.db.Jobs.name == 'j2').first()
@@ -1022,6 +1025,7 @@ class TestJobs(BaseExecutorDummyML):
 
         # run once again
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         # job wasn't executed
         ret = self.run_sql('select * from log.jobs_history', database='proj2')
@@ -1033,6 +1037,7 @@ class TestJobs(BaseExecutorDummyML):
         self.db.session.commit()
 
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         ret = self.run_sql('select * from log.jobs_history', database='proj2')
         assert len(ret) == 2  # was executed
@@ -1064,6 +1069,7 @@ class TestJobs(BaseExecutorDummyML):
 
         # run scheduler
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         ret = self.run_sql('select * from log.jobs_history')
         # no history
@@ -1096,6 +1102,7 @@ class TestJobs(BaseExecutorDummyML):
 
         # run scheduler
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         # check no models created
         ret = self.run_sql('select * from models where name="pred"')
@@ -1111,6 +1118,7 @@ class TestJobs(BaseExecutorDummyML):
 
         # run scheduler
         scheduler.check_timetable()
+        scheduler.wait_tasks()
 
         # check 1 model
         ret = self.run_sql('select * from models where name="pred"')
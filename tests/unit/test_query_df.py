@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from mindsdb.api.executor.utilities.sql import df_to_arrow, query_df_with_type_infer_fallback
+
+
+class TestQueryDf:
+
+    def test_arrow_column_types(self):
+        # integers with nulls are stored in object column
+        df = pd.DataFrame({'a': [1, None, 3], 'b': ['1', '2', None]}, dtype=object)
+
+        # sql types and numpy dtypes of columns are used
+        for col_type in ('integer', np.dtype('int64'), pd.Int64Dtype()):
+            table = df_to_arrow(df, {'a': col_type, 'b': 'text'})
+            assert table.schema.field('a').type == pa.int64()
+            assert table.schema.field('b').type == pa.string()
+            assert table.column('a').to_pylist() == [1, None, 3]
+
+        table = df_to_arrow(df, {'a': np.dtype('float64')})
+        assert table.schema.field('a').type == pa.float64()
+
+        # unknown type: inferred from values
+        table = df_to_arrow(df, {'a': np.dtype('O'), 'b': None})
+        assert table.schema.field('a').type == pa.int64()
+        assert table.schema.field('b').type == pa.string()
+
+        # values don't fit to type: fallback to inferring
+        table = df_to_arrow(pd.DataFrame({'a': ['x', 'y']}), {'a': np.dtype('int64')})
+        assert table.column('a').to_pylist() == ['x', 'y']
+
+    def test_query_with_column_types(self):
+        df = pd.DataFrame({'a': [None, 2, 3]}, dtype=object)
+        result, _ = query_df_with_type_infer_fallback(
+            'select sum(a) as s from df', {'df': df}, column_types={'df': {'a': np.dtype('int64')}}
+        )
+        assert result['s'][0] == 5
@@ -0,0 +1,108 @@
+import pandas as pd
+
+from mindsdb.api.executor.sql_query.result_set import ResultSet, Column
+
+
+def get_df():
+    return pd.DataFrame([
+        [1, 'a', 1.5],
+        [2, 'b', 2.5],
+    ], columns=['x', 'y', 'z'])
+
+
+class TestResultSet:
+
+    def test_columnar_from_df(self):
+        rs = ResultSet().from_df(get_df(), database='db', table_name='t')
+        assert rs.is_columnar()
+        assert rs.length() == 2
+        assert rs.get_column_names() == ['x', 'y', 'z']
+        assert rs.get_records()[0] == {'x': 1, 'y': 'a', 'z': 1.5}
+        assert rs.get_column_values(1) == ['a', 'b']
+        # reading doesn't change storage
+        assert rs.is_columnar()
+
+    def test_columns_modification(self):
+        rs = ResultSet().from_df(get_df(), database='db', table_name='t')
+
+        rs.add_column(Column(name='row_id'), [10, 11])
+        assert rs.get_records_raw()[1][3] == 11
+
+        # missing values are filled with None
+        rs.add_column(Column(name='empty'))
+        assert rs.get_records_raw()[0][4] is None
+
+        rs.del_column(rs.find_columns('y')[0])
+        assert rs.get_column_names() == ['x', 'z', 'row_id', 'empty']
+        assert rs.get_column_values(2) == [10, 11]
+
+        # switch to rows
+        rs.add_record_raw([3, 2.5, 12, None])
+        assert not rs.is_columnar()
+        assert rs.length() == 3
+        assert rs.to_df()['row_id'].tolist() == [10, 11, 12]
+
+    def test_duplicated_names(self):
+        df = pd.DataFrame([[1, 2]], columns=['a', 'a'])
+        rs = ResultSet().from_df(df, database='db', table_name='t')
+
+        df2, col_names = rs.to_df_cols(prefix='A')
+        assert len(col_names) == 1  # same hash name
+
+        rs.del_column(rs.columns[0])
+        assert rs.get_records_raw() == [[2]]
+
+    def test_list_and_columnar_are_equal(self):
+        df = get_df()
+
+        rs_list = ResultSet()
+        for col in df.columns:
+            rs_list.add_column(Column(name=col))
+        rs_list.add_records_raw(df.to_dict(orient='split')['data'])
+
+        rs_df = ResultSet().from_df(df, database=None, table_name=None)
+
+        assert rs_list.get_records() == rs_df.get_records()
+        assert rs_list.to_df().equals(rs_df.to_df())
+
+    def test_rows_of_columnar(self):
+        rs = ResultSet().from_df(get_df(), database='db', table_name='t')
+
+        # rows are converted once for the frame
+        rows = rs._get_df_rows()
+        assert rs._get_df_rows() is rows
+        assert rs.get_records_raw() == rows
+        assert rs.is_columnar()
+
+        rs.add_column(Column(name='row_id'), [10, 11])
+        assert rs.get_records_raw() == [[1, 'a', 1.5, 10], [2, 'b', 2.5, 11]]
+
+    def test_returned_data_is_not_shared(self):
+        rs = ResultSet().from_df(get_df(), database='db', table_name='t')
+
+        df = rs.to_df()
+        df.loc[0, 'x'] = 99
+        df_cols, _ = rs.to_df_cols()
+        df_cols.iloc[0, 0] = 99
+        rows = rs.get_records_raw()
+        rows[0][0] = -1
+
+        assert rs.is_columnar()
+        assert rs.get_records_raw()[0] == [1, 'a', 1.5]
+        assert rs.to_df().loc[0, 'x'] == 1
+        assert rs.get_records()[0]['x'] == 1
+
+    def test_limit_offset_columnar(self):
+        from types import SimpleNamespace
+        from mindsdb.api.executor.sql_query.steps.sql_steps import LimitOffsetStepCall
+
+        df = pd.DataFrame({'x': range(10)})
+        rs = ResultSet().from_df(df, database='db', table_name='t')
+
+        step_call = LimitOffsetStepCall(SimpleNamespace(steps_data=[rs], context={}, session=None))
+        step = SimpleNamespace(dataframe=SimpleNamespace(step_num=0), limit=3, offset=2)
+
+        result = step_call.call(step)
+        assert result.is_columnar()
+        assert result.columns == rs.columns
+        assert result.get_column_values(0) == [2, 3, 4]
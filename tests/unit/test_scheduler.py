@@ -0,0 +1,98 @@
+import datetime as dt
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from mindsdb.interfaces.jobs.jobs_controller import JobsExecutor
+from mindsdb.interfaces.jobs.scheduler import Scheduler
+from mindsdb.interfaces.storage import db
+
+
+class TestScheduler:
+
+    def setup_method(self):
+        self.release = threading.Event()
+        self.started = []
+        self.records = [
+            SimpleNamespace(id=1, name='j1', company_id=1),
+            SimpleNamespace(id=2, name='j2', company_id=1),
+            SimpleNamespace(id=3, name='j3', company_id=2),
+        ]
+
+        def execute_task_local(executor, record_id, history_id):
+            self.started.append(record_id)
+            self.release.wait(5)
+
+        self.patchers = [
+            patch.object(db, 'session', MagicMock()),
+            patch.object(Scheduler, '_release_resources'),
+            patch.object(JobsExecutor, 'get_next_tasks', lambda executor: self.records),
+            patch.object(JobsExecutor, 'lock_record', lambda executor, record_id: record_id * 10),
+            patch.object(JobsExecutor, 'execute_task_local', execute_task_local),
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def teardown_method(self):
+        self.release.set()
+        for patcher in self.patchers:
+            patcher.stop()
+
+    def test_concurrency(self):
+        scheduler = Scheduler({'jobs': {'max_workers': 3, 'max_workers_per_company': 1}})
+
+        # dispatch doesn't wait for the end of jobs, second job of company 1 waits for a free worker
+        scheduler.check_timetable()
+        assert sorted(scheduler.running.keys()) == [1, 3]
+        assert scheduler.is_waiting is True
+
+        # already running jobs are not started again
+        scheduler.check_timetable()
+        assert len(scheduler.running) == 2
+
+        # heartbeat of all running jobs in one query
+        scheduler.send_heartbeats()
+        query_filter = db.session.query.return_value.filter
+        query_filter.assert_called_once()
+        query_filter.return_value.update.assert_called_once()
+
+        self.release.set()
+        scheduler.wait_tasks(timeout=5)
+        assert scheduler.running == {}
+        assert scheduler._wake_event.is_set()
+
+        # waiting job is started when worker is free
+        self.records = [self.records[1]]
+        scheduler.check_timetable()
+        scheduler.wait_tasks(timeout=5)
+        assert sorted(self.started) == [1, 2, 3]
+        assert scheduler.is_waiting is False
+        scheduler.stop_thread()
+
+    def test_wait_time(self):
+        scheduler = Scheduler({'jobs': {'check_interval': 30, 'heartbeat_interval': 3}})
+
+        with patch.object(JobsExecutor, 'get_next_run_at', return_value=None):
+            assert scheduler.get_wait_time() == 30
+
+        next_run_at = dt.datetime.now() + dt.timedelta(seconds=10)
+        with patch.object(JobsExecutor, 'get_next_run_at', return_value=next_run_at):
+            assert 8 < scheduler.get_wait_time() <= 11
+
+            # heartbeat of running jobs
+            scheduler.running[1] = {'history_id': 10, 'company_id': 1}
+            assert scheduler.get_wait_time() == 3
+
+        # job is overdue: it is locked by other instance
+        self.records = self.records[:1]
+        overdue_at = dt.datetime.now() - dt.timedelta(seconds=60)
+        scheduler = Scheduler({'jobs': {'check_interval': 30, 'heartbeat_interval': 3}})
+        with patch.object(JobsExecutor, 'lock_record', return_value=None), \
+                patch.object(JobsExecutor, 'get_next_run_at', return_value=overdue_at) as get_next_run_at:
+            scheduler.check_timetable()
+            assert scheduler.running == {}
+            assert scheduler.locked_ids == {1}
+
+            # locked job is excluded, there is a floor of wait time
+            assert scheduler.get_wait_time() >= 1
+            assert get_next_run_at.call_args.kwargs['exclude_ids'] == [1]
@@ -0,0 +1,82 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from mindsdb.integrations.libs.response import HandlerResponse, RESPONSE_TYPE
+from mindsdb.interfaces.database.metadata_catalog import MetadataCatalog, metadata_catalog
+from mindsdb.interfaces.skills.sql_agent import SQLAgent
+from mindsdb.utilities.context import context as ctx
+
+
+class FakeHandler:
+    def __init__(self):
+        self.columns_calls = []
+        self.tables_calls = 0
+        self.queries = []
+        # tables are described at the same time
+        self.barrier = threading.Barrier(2, timeout=5)
+
+    def get_tables(self):
+        self.tables_calls += 1
+        return HandlerResponse(
+            RESPONSE_TYPE.TABLE,
+            pd.DataFrame([['public', 't1'], ['public', 't2'], ['public', 't3']], columns=['table_schema', 'table_name'])
+        )
+
+    def get_columns(self, table_name):
+        self.columns_calls.append(table_name)
+        self.barrier.wait()
+        return HandlerResponse(
+            RESPONSE_TYPE.TABLE,
+            pd.DataFrame([['a', 'int'], ['b', 'text']], columns=['Field', 'Type'])
+        )
+
+    def query(self, query):
+        self.queries.append(str(query))
+        return HandlerResponse(RESPONSE_TYPE.TABLE, pd.DataFrame([[1, 'x' * 200]], columns=['a', 'b']))
+
+
+class TestSQLAgent:
+
+    def setup_method(self):
+        ctx.set_default()
+        metadata_catalog.invalidate('test_db')
+        # workers don't use handlers and db in tests
+        self.release_resources = patch.object(MetadataCatalog, '_release_resources')
+        self.release_resources.start()
+
+    def teardown_method(self):
+        self.release_resources.stop()
+        metadata_catalog.invalidate('test_db')
+
+    def test_table_info_cache(self):
+        handler = FakeHandler()
+        command_executor = MagicMock()
+        command_executor.session.integration_controller.get_data_handler.return_value = handler
+
+        agent = SQLAgent(command_executor, 'test_db', ignore_tables=['test_db.t3'])
+        assert agent.get_usable_table_names() == ['test_db.t1', 'test_db.t2']
+
+        info = agent.get_table_info()
+        assert 'Table named `t1`' in info and 'Table named `t2`' in info
+        assert info.index('`t1`') < info.index('`t2`')
+        assert '1\t' + 'x' * 100 + '...' in info
+        assert sorted(handler.columns_calls) == ['t1', 't2']
+        assert len(handler.queries) == 2
+
+        # the other skill with the same integration uses the cache
+        agent2 = SQLAgent(command_executor, 'test_db')
+        assert agent2.get_usable_table_names() == ['test_db.t1', 'test_db.t2', 'test_db.t3']
+        assert agent2.get_table_info(['test_db.t1']) == agent.get_table_info(['test_db.t1'])
+        assert handler.tables_calls == 1
+        assert len(handler.columns_calls) == 2
+
+        # integration is modified
+        metadata_catalog.invalidate('test_db')
+        agent.get_table_info()
+        assert handler.tables_calls == 2
+        assert len(handler.columns_calls) == 4
+
+        # the shared executor is not used by workers
+        command_executor.execute_command.assert_not_called()
@@ -0,0 +1,76 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from mindsdb.api.executor.sql_query import steps_executor
+from mindsdb.utilities.context import context as ctx
+
+
+class TestStepsExecutor:
+
+    def setup_method(self):
+        # database session of threads of the pool is removed after step
+        self.db_session = patch.object(steps_executor.db, 'session')
+        self.db_session.start()
+
+    def teardown_method(self):
+        self.db_session.stop()
+
+    def test_pool_replaced(self):
+        config = MagicMock()
+        with patch.object(steps_executor, 'Config', return_value=config):
+            config.get.return_value = {'parallel_steps': 2}
+            pool = steps_executor.get_steps_executor()
+            assert steps_executor.get_steps_executor() is pool
+
+            # threads of the replaced pool are stopped
+            config.get.return_value = {'parallel_steps': 3}
+            new_pool = steps_executor.get_steps_executor()
+            assert new_pool is not pool
+            assert pool._shutdown is True
+
+            # query which got old pool is executed in the new one
+            future = steps_executor.submit_to_steps_executor(pool, ctx.dump(), lambda: 1)
+            assert future.result() == 1
+
+    def test_cancel(self):
+        from mindsdb.interfaces.database.integrations import integration_controller
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        cancel_event = threading.Event()
+        started = threading.Event()
+        executed = []
+
+        def running_step():
+            started.set()
+            # request to data source is executed and is not interrupted
+            cancel_event.wait(5)
+            executed.append('running')
+            steps_executor.check_cancelled()
+            executed.append('next request')
+
+        def queued_step():
+            executed.append('queued')
+
+        with patch.object(integration_controller.handlers_cache, 'checkin') as checkin:
+            running = steps_executor.submit_to_steps_executor(
+                pool, ctx.dump(), running_step, cancel_event=cancel_event
+            )
+            queued = steps_executor.submit_to_steps_executor(
+                pool, ctx.dump(), queued_step, cancel_event=cancel_event
+            )
+            started.wait(5)
+            # other step is failed
+            cancel_event.set()
+
+            with pytest.raises(steps_executor.StepCancelled):
+                running.result()
+            with pytest.raises(steps_executor.StepCancelled):
+                queued.result()
+            assert executed == ['running']
+
+            # handlers of cancelled steps are returned to the pool
+            assert checkin.call_count == 2
+        pool.shutdown()
@@ -0,0 +1,112 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from mindsdb_sql import parse_sql
+from mindsdb_sql.parser.ast import Data
+
+from mindsdb.interfaces.storage import db
+from mindsdb.interfaces.triggers.trigger_task import TriggerTask
+from mindsdb.utilities.context import context as ctx
+
+
+class TestTriggerTask:
+
+    def setup_method(self):
+        ctx.set_default()
+        self.session_patcher = patch.object(db, 'session', MagicMock())
+        self.session_patcher.start()
+
+        self.task = TriggerTask(task_id=1, object_id=1)
+        self.task.query = parse_sql('insert into files.tbl (select * from TABLE_DELTA)', dialect='mindsdb')
+
+        # rows which were passed to every execution of query
+        self.batches = []
+
+        def execute_command(query):
+            self.batches.append(query.from_select.from_table.data)
+            return MagicMock(error_code=None)
+
+        self.task.command_executor = MagicMock()
+        self.task.command_executor.execute_command.side_effect = execute_command
+
+    def teardown_method(self):
+        self.session_patcher.stop()
+
+    def start(self):
+        thread = threading.Thread(target=self.task._process_rows)
+        thread.start()
+        return thread
+
+    def stop(self, thread):
+        self.task._subscribe_finished.set()
+        self.task._batch_event.set()
+        thread.join()
+
+    def test_batch_size(self):
+        self.task.batch_size = 2
+        self.task.batch_window = 10
+        thread = self.start()
+
+        for i in range(5):
+            self.task._callback({'a': i}, key={'id': i})
+        time.sleep(0.2)
+        # full batches are executed without waiting for window
+        assert self.batches == [
+            [{'a': 0, 'id': 0}, {'a': 1, 'id': 1}],
+            [{'a': 2, 'id': 2}, {'a': 3, 'id': 3}],
+        ]
+
+        # the rest is executed on stop
+        self.stop(thread)
+        assert self.batches[2] == [{'a': 4, 'id': 4}]
+        assert isinstance(self.task.query.from_select.from_table, Data) is False
+
+    def test_batch_window(self):
+        self.task.batch_size = 100
+        self.task.batch_window = 0.2
+        thread = self.start()
+
+        self.task._callback({'a': 1})
+        self.task._callback({'a': 2})
+        time.sleep(0.1)
+        assert self.batches == []
+
+        time.sleep(0.3)
+        assert self.batches == [[{'a': 1}, {'a': 2}]]
+        self.stop(thread)
+        assert len(self.batches) == 1
+
+    def test_max_pending_rows(self):
+        self.task.batch_size = 1
+        self.task.max_pending_rows = 2
+
+        # rows are not processed yet: handler is blocked when the buffer is full
+        callback = threading.Thread(target=lambda: [self.task._callback({'a': i}) for i in range(3)])
+        callback.start()
+        callback.join(0.2)
+        assert callback.is_alive()
+        assert len(self.task._rows) == 2
+
+        thread = self.start()
+        callback.join(5)
+        assert callback.is_alive() is False
+        self.stop(thread)
+        assert self.batches == [[{'a': 0}], [{'a': 1}], [{'a': 2}]]
+
+    def test_process_error(self):
+        self.task.batch_size = 1
+        self.task.max_pending_rows = 1
+        db.session.commit.side_effect = RuntimeError('db is lost')
+
+        thread = self.start()
+        self.task._callback({'a': 1})
+        thread.join(5)
+
+        # processing is finished: subscription is stopped and rows are not collected anymore
+        assert thread.is_alive() is False
+        assert isinstance(self.task._process_error, RuntimeError)
+        assert self.task._stop_event.is_set()
+        self.task._callback({'a': 2})
+        self.task._callback({'a': 3})
+        assert self.task._rows == []
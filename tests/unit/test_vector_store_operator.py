@@ -0,0 +1,70 @@
+import threading
+import time
+from unittest.mock import patch
+
+from langchain_community.embeddings import FakeEmbeddings
+from langchain_community.vectorstores import Chroma
+from langchain_core.documents import Document
+
+from mindsdb.integrations.utilities.rag.vector_store import TokenBucket, VectorStoreOperator
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    """ Fake embeddings which remember sizes of requests and count of requests executed at the same time
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(size=8, **kwargs)
+        object.__setattr__(self, 'requests', [])
+        object.__setattr__(self, 'in_flight', [0, 0])
+        object.__setattr__(self, 'lock', threading.Lock())
+
+    def embed_documents(self, texts):
+        with self.lock:
+            self.requests.append(len(texts))
+            self.in_flight[0] += 1
+            self.in_flight[1] = max(self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight[0] -= 1
+        return super().embed_documents(texts)
+
+
+def test_token_bucket():
+    bucket = TokenBucket(capacity=100, rate=1000)
+
+    start = time.monotonic()
+    bucket.acquire(100)
+    assert time.monotonic() - start < 0.05
+
+    # bucket is empty: 50 tokens are refilled in 0.05s
+    bucket.acquire(50)
+    assert time.monotonic() - start >= 0.045
+
+    # request bigger than bucket waits for the full bucket
+    start = time.monotonic()
+    bucket.acquire(1000)
+    assert 0.05 <= time.monotonic() - start < 1
+
+
+def test_add_documents_by_batches():
+    documents = [Document(page_content=f'document {i}', metadata={'i': i}) for i in range(250)]
+    embeddings = CountingEmbeddings()
+
+    with patch.object(TokenBucket, 'acquire') as acquire:
+        operator = VectorStoreOperator(
+            vector_store=Chroma,
+            embeddings_model=embeddings,
+            documents=documents,
+            batch_size=100,
+            max_concurrency=2,
+        )
+
+    # every document is embedded once
+    assert sorted(embeddings.requests) == [50, 100, 100]
+    assert acquire.call_count == 3
+    # batches after the first one are embedded at the same time
+    assert embeddings.in_flight[1] == 2
+
+    stored = operator.vector_store.get()
+    assert sorted(metadata['i'] for metadata in stored['metadatas']) == list(range(250))